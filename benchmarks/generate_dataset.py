@@ -0,0 +1,88 @@
+# benchmarks/generate_dataset.py
+#
+# MeasurementParser'ın beklediği biçimde sentetik bir olcumler/ ağacı üretir.
+# Kullanım: python benchmarks/generate_dataset.py hedef_klasor --files 1000 --points 2000
+
+import argparse
+import datetime
+import os
+import random
+from typing import List, Optional
+
+# Ölçüm tipi -> (klasör adı, dosya adındaki tip, değer ortalaması, değer sapması)
+MEASUREMENT_TYPES = {
+    'sıcaklık': ('sıcaklık', 'Sicaklik', 15.0, 8.0),
+    'nem': ('nem', 'Nem', 60.0, 15.0),
+}
+
+# Bozuk satır örnekleri (ayrıştırıcının yavaş yoluna düşer ve reddedilir)
+MALFORMED_LINES = ['', 'hatalı satır', '25:61:00,12.5', '08:00:00', '08:00:00,abc', '08:00:00,1,2']
+
+def _format_time(seconds: int) -> str:
+    return f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:{seconds % 60:02d}"
+
+def generate_dataset(root_folder: str, file_count: int = 100, points_per_file: int = 1000,
+                     temperature_share: float = 0.5, malformed_share: float = 0.0,
+                     locations: Optional[List[str]] = None, start_date: datetime.date = datetime.date(2011, 11, 11),
+                     interval_seconds: int = 5, decimals: int = 1, seed: int = 42) -> List[str]:
+    """
+    root_folder altında sıcaklık/ ve nem/ klasörlerini oluşturup ölçüm dosyaları yazar.
+
+    Args:
+        file_count: Toplam dosya sayısı.
+        points_per_file: Dosya başına ölçüm satırı sayısı.
+        temperature_share: Dosyaların sıcaklık olma oranı (geri kalanı nem).
+        malformed_share: Bozuk ölçüm satırı oranı (0-1).
+        locations: Dosyalara dağıtılacak yer adları.
+        interval_seconds: Ardışık ölçümler arasındaki saniye.
+        decimals: Değerlerin ondalık basamak sayısı.
+        seed: Rastgele sayı üreteci tohumu (aynı tohum aynı veriyi üretir).
+
+    Dönüş değeri: yazılan dosya yolları.
+    """
+    rng = random.Random(seed)
+    locations = locations or ['YER']
+    written_files = []
+    for measurement_type, (folder_name, _, _, _) in MEASUREMENT_TYPES.items():
+        os.makedirs(os.path.join(root_folder, folder_name), exist_ok=True)
+
+    for file_id in range(1, file_count + 1):
+        measurement_type = 'sıcaklık' if rng.random() < temperature_share else 'nem'
+        folder_name, file_type_name, mean, deviation = MEASUREMENT_TYPES[measurement_type]
+        location = locations[(file_id - 1) % len(locations)]
+        date = start_date + datetime.timedelta(days=(file_id - 1) // len(locations))
+        date_str = date.strftime('%d.%m.%Y')
+
+        start_seconds = rng.randrange(0, 12 * 3600)
+        lines = [f"id:{file_id} ölçüm: {measurement_type} - yer: {location} - tarih: {date_str}"]
+        for i in range(points_per_file):
+            if malformed_share and rng.random() < malformed_share:
+                lines.append(rng.choice(MALFORMED_LINES))
+                continue
+            seconds = (start_seconds + i * interval_seconds) % 86400
+            lines.append(f"{_format_time(seconds)},{round(rng.gauss(mean, deviation), decimals)}")
+
+        file_path = os.path.join(root_folder, folder_name, f"id{file_id}_{file_type_name}_{location}_{date_str}.txt")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+            f.write("\n")
+        written_files.append(file_path)
+    return written_files
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Sentetik olcumler/ veri seti üretir.")
+    arg_parser.add_argument('root', help="Oluşturulacak kök klasör")
+    arg_parser.add_argument('--files', type=int, default=100, help="Toplam dosya sayısı")
+    arg_parser.add_argument('--points', type=int, default=1000, help="Dosya başına ölçüm sayısı")
+    arg_parser.add_argument('--temperature-share', type=float, default=0.5, help="Sıcaklık dosyası oranı (0-1)")
+    arg_parser.add_argument('--malformed-share', type=float, default=0.0, help="Bozuk satır oranı (0-1)")
+    arg_parser.add_argument('--locations', nargs='*', default=['YER'], help="Yer adları")
+    arg_parser.add_argument('--seed', type=int, default=42, help="Rastgele sayı tohumu")
+    args = arg_parser.parse_args()
+
+    files = generate_dataset(args.root, args.files, args.points, args.temperature_share,
+                             args.malformed_share, args.locations, seed=args.seed)
+    print(f"{len(files)} dosya yazıldı: {args.root}")
+
+if __name__ == '__main__':
+    main()
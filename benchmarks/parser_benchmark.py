@@ -0,0 +1,54 @@
+# benchmarks/parser_benchmark.py
+#
+# MeasurementParser.parse_file için hızlı yol ile strptime kullanan yavaş yolu karşılaştırır.
+# Kullanım: python benchmarks/parser_benchmark.py [--points 200000] [--repeat 3]
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_parser import MeasurementParser
+
+def write_sample_file(file_path: str, point_count: int):
+    """Verilen sayıda ölçüm noktası içeren örnek bir sıcaklık dosyası yazar."""
+    rng = random.Random(42)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write("id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011\n")
+        for i in range(point_count):
+            seconds = i % 86400
+            f.write(f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:{seconds % 60:02d},{rng.uniform(-10, 40):.1f}\n")
+
+def best_time(parser: MeasurementParser, file_path: str, repeat: int) -> float:
+    """parse_file çağrısının en iyi süresini saniye cinsinden döndürür."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse_file(file_path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Ölçüm satırı ayrıştırıcı karşılaştırması")
+    arg_parser.add_argument('--points', type=int, default=200000, help="Dosyadaki ölçüm noktası sayısı")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Tekrar sayısı (en iyi süre alınır)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'sample.txt')
+        write_sample_file(file_path, args.points)
+
+        slow = best_time(MeasurementParser(verbose=False, fast_path=False), file_path, args.repeat)
+        fast = best_time(MeasurementParser(verbose=False, fast_path=True), file_path, args.repeat)
+
+    print(f"{args.points} nokta")
+    print(f"Yavaş yol (strptime): {slow:.3f} s ({slow / args.points * 1e6:.2f} µs/nokta)")
+    print(f"Hızlı yol:            {fast:.3f} s ({fast / args.points * 1e6:.2f} µs/nokta)")
+    print(f"Hızlanma: {slow / fast:.1f}x")
+
+if __name__ == '__main__':
+    main()
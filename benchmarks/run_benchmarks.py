@@ -0,0 +1,155 @@
+# benchmarks/run_benchmarks.py
+#
+# Ayrıştırma, hesaplama, yazma ve uçtan uca çalıştırma sürelerini ölçer; sonuçları JSON olarak
+# kaydeder ve kayıtlı bir temel (baseline) ile karşılaştırır.
+# Kullanım:
+#   python benchmarks/run_benchmarks.py                    # ölç ve benchmarks/baseline.json ile karşılaştır
+#   python benchmarks/run_benchmarks.py --save-baseline    # ölçümü yeni temel olarak kaydet
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from array import array
+from typing import Callable, Dict
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from generate_dataset import generate_dataset
+from data_parser import MeasurementParser
+from calculation_strategies import FusedCalculationEngine
+from output_writer import OutputWriter
+from pipeline import format_header_info
+from strategy_registry import load_all_strategies
+import cli
+
+DEFAULT_BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_RESULTS_PATH = os.path.join(BENCHMARK_DIR, 'results.json')
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Fonksiyonun en iyi çalışma süresini saniye cinsinden döndürür."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_benchmarks(work_folder: str, file_count: int, points_per_file: int, large_file_points: int,
+                   malformed_share: float, workers: int, repeat: int) -> Dict[str, float]:
+    """Tüm ölçümleri yapar ve {ölçüm adı: saniye} döndürür."""
+    results = {}
+    dataset_root = os.path.join(work_folder, 'olcumler')
+    generate_dataset(dataset_root, file_count, points_per_file, malformed_share=malformed_share)
+    large_root = os.path.join(work_folder, 'buyuk')
+    large_file = generate_dataset(large_root, 1, large_file_points, temperature_share=1.0)[0]
+
+    parser = MeasurementParser(verbose=False)
+    results['parse_file'] = best_time(lambda: parser.parse_file(large_file), repeat)
+    results['get_all_measurements_in_folder'] = best_time(
+        lambda: parser.get_all_measurements_in_folder(dataset_root), repeat)
+    if workers > 1:
+        results[f'get_all_measurements_in_folder[workers={workers}]'] = best_time(
+            lambda: parser.get_all_measurements_in_folder(dataset_root, workers=workers, chunk_size=16), repeat)
+
+    all_measurements_by_type = parser.get_all_measurements_in_folder(dataset_root)
+    measurements = [data for measurements in all_measurements_by_type.values() for data in measurements]
+    all_values = array('d')
+    for data in measurements:
+        all_values.extend(data.value_column)
+    all_values = memoryview(all_values)
+
+    strategies = load_all_strategies()
+    for name, strategy in strategies.items():
+        results[f'strategy[{name}]'] = best_time(lambda: strategy.calculate(all_values), repeat)
+    engine = FusedCalculationEngine(list(strategies.values()))
+    results['strategy[tümü, birleşik]'] = best_time(lambda: engine.calculate(all_values), repeat)
+
+    writer = OutputWriter(os.path.join(work_folder, 'yazma'))
+    average_results = {format_header_info(data): sum(data.values) / len(data) for data in measurements}
+    frequency_results = {format_header_info(data): strategies['Frekans'].calculate(data.values) for data in measurements}
+    results['write_results[Ortalama]'] = best_time(
+        lambda: writer.write_results(average_results, 'sıcaklık', 'Ortalama'), repeat)
+    results['write_results[Frekans]'] = best_time(
+        lambda: writer.write_results(frequency_results, 'sıcaklık', 'Frekans', layout='frequency'), repeat)
+
+    names = list(strategies)
+    results['end_to_end[cli]'] = best_time(
+        lambda: cli.run_root(dataset_root, os.path.join(work_folder, 'uctan_uca'), names, names), repeat)
+    return results
+
+def compare_with_baseline(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> int:
+    """Sonuçları temel ile karşılaştırıp yazdırır; eşiği aşan gerilemelerin sayısını döndürür."""
+    regressions = 0
+    print(f"{'Ölçüm':<50} {'Temel (s)':>10} {'Şimdi (s)':>10} {'Oran':>7}")
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<50} {'-':>10} {seconds:>10.4f} {'yeni':>7}")
+            continue
+        ratio = seconds / base if base else float('inf')
+        marker = ''
+        if ratio > 1 + tolerance:
+            marker = '  <-- GERİLEME'
+            regressions += 1
+        print(f"{name:<50} {base:>10.4f} {seconds:>10.4f} {ratio:>6.2f}x{marker}")
+    return regressions
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Performans ölçümlerini çalıştırır.")
+    arg_parser.add_argument('--files', type=int, default=200, help="Klasör ölçümleri için dosya sayısı")
+    arg_parser.add_argument('--points', type=int, default=2000, help="Dosya başına ölçüm sayısı")
+    arg_parser.add_argument('--large-file-points', type=int, default=200000, help="parse_file için büyük dosyadaki nokta sayısı")
+    arg_parser.add_argument('--malformed-share', type=float, default=0.001, help="Bozuk satır oranı")
+    arg_parser.add_argument('--workers', type=int, default=4, help="Paralel okuma ölçümü için süreç sayısı")
+    arg_parser.add_argument('--repeat', type=int, default=3, help="Tekrar sayısı (en iyi süre alınır)")
+    arg_parser.add_argument('--output', default=DEFAULT_RESULTS_PATH, help="Sonuçların yazılacağı JSON dosyası")
+    arg_parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="Karşılaştırılacak temel JSON dosyası")
+    arg_parser.add_argument('--save-baseline', action='store_true', help="Sonuçları temel olarak kaydet")
+    arg_parser.add_argument('--tolerance', type=float, default=0.25, help="İzin verilen yavaşlama oranı (0.25 = %%25)")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_folder:
+        results = run_benchmarks(work_folder, args.files, args.points, args.large_file_points,
+                                 args.malformed_share, args.workers, args.repeat)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'files': args.files,
+            'points': args.points,
+            'large_file_points': args.large_file_points,
+            'malformed_share': args.malformed_share,
+            'workers': args.workers,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    output_path = args.baseline if args.save_baseline else args.output
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar kaydedildi: {output_path}")
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        for name, seconds in results.items():
+            print(f"{name:<50} {seconds:>10.4f}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('files') != args.files or baseline.get('meta', {}).get('points') != args.points:
+        print("Uyarı: Temel farklı veri seti boyutlarıyla ölçülmüş; karşılaştırma yanıltıcı olabilir.")
+    regressions = compare_with_baseline(results, baseline.get('results', {}), args.tolerance)
+    if regressions:
+        print(f"{regressions} ölçümde %{args.tolerance * 100:.0f} üzeri yavaşlama var.")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# binary_format.py
+#
+# Ölçüm dosyaları için ikili sütunlu biçim (.olc) ve metin (.txt) düzeninden toplu dönüştürücü.
+# Örnek:
+#   python binary_format.py olcumler olcumler_ikili
+#   python binary_format.py olcumler            (ikili dosyalar .txt dosyalarının yanına yazılır)
+
+import argparse
+import datetime
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+from measurement import ColumnStatistics, MeasurementData, TIME_TYPECODE, VALUE_TYPECODE
+
+# Dosya biçimi (küçük endian):
+#   magic (4 bayt) | sürüm (uint16) | bayraklar (uint16) | nokta sayısı (uint32) | başlık uzunluğu (uint32)
+#   | başlık (utf-8, id, tip, yer ve tarih '\x1f' ile ayrılır) | 8 bayta hizalama dolgusu
+#   | değer sütunu (float64 * n) | zaman sütunu (int32 * n, gün başından itibaren saniye)
+#   | alt bilgi (bayraklarda FLAG_FOOTER varsa): magic (4 bayt) | sayı (uint64) | toplam | min | max (float64)
+# Değer sütunu 8 bayta hizalı olduğu için dosya belleğe eşlenip kopyalamadan okunabilir.
+BINARY_MAGIC = b'OLC\x00'
+BINARY_VERSION = 1
+BINARY_SUFFIX = '.olc'
+FLAG_FOOTER = 1
+
+_PREFIX = struct.Struct('<4sHHII')
+_FOOTER = struct.Struct('<4sQddd')
+_FOOTER_MAGIC = b'OLCF'
+_FIELD_SEPARATOR = '\x1f'
+_ALIGNMENT = 8
+
+class BinaryFormatError(ValueError):
+    """İkili ölçüm dosyası okunamadığında veya biçimi tutmadığında fırlatılır."""
+    pass
+
+def is_binary_file(file_path: str) -> bool:
+    return file_path.endswith(BINARY_SUFFIX)
+
+def column_statistics(values) -> ColumnStatistics:
+    """Değer sütununun alt bilgide saklanan özetini hesaplar (toplam, SeriesSummary ile aynı sırayla)."""
+    if not len(values):
+        return ColumnStatistics(0, 0.0, 0.0, 0.0)
+    return ColumnStatistics(len(values), sum(values), min(values), max(values))
+
+def _data_offset(header_length: int) -> int:
+    offset = _PREFIX.size + header_length
+    return offset + (-offset % _ALIGNMENT)
+
+def encode(data: MeasurementData, with_footer: bool = True) -> bytes:
+    """MeasurementData nesnesini ikili biçime çevirir."""
+    header_bytes = _FIELD_SEPARATOR.join(
+        (data.id, data.measurement_type, data.location, data.date.isoformat())
+    ).encode('utf-8')
+    value_column = array(VALUE_TYPECODE, data.value_column)
+    time_column = array(TIME_TYPECODE, data.time_column)
+    if sys.byteorder == 'big':
+        value_column.byteswap()
+        time_column.byteswap()
+
+    prefix = _PREFIX.pack(BINARY_MAGIC, BINARY_VERSION, FLAG_FOOTER if with_footer else 0,
+                          len(value_column), len(header_bytes))
+    padding = b'\x00' * (_data_offset(len(header_bytes)) - len(prefix) - len(header_bytes))
+    parts = [prefix, header_bytes, padding, value_column.tobytes(), time_column.tobytes()]
+    if with_footer:
+        statistics = column_statistics(data.value_column)
+        parts.append(_FOOTER.pack(_FOOTER_MAGIC, statistics.count, statistics.total,
+                                  statistics.minimum, statistics.maximum))
+    return b''.join(parts)
+
+def write_binary(file_path: str, data: MeasurementData, with_footer: bool = True):
+    """
+    Ölçüm verisini ikili biçimde yazar (geçici dosya + yeniden adlandırma ile).
+    Geçici dosya yeniden adlandırılmadan önce diske zorlanır (bkz. output_writer.atomic_write).
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(encode(data, with_footer))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _read_layout(f, file_path: str) -> Tuple[Dict[str, any], int, int, bool]:
+    """Önek ve başlığı okur. Dönüş: (başlık bilgisi, nokta sayısı, sütunların başlangıcı, alt bilgi var mı)"""
+    try:
+        magic, version, flags, count, header_length = _PREFIX.unpack(f.read(_PREFIX.size))
+    except struct.error:
+        raise BinaryFormatError(f"'{file_path}' ikili ölçüm dosyası çok kısa.")
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise BinaryFormatError(f"'{file_path}' ikili ölçüm biçimi veya sürümü uyumsuz.")
+    try:
+        id_, measurement_type, location, date_str = f.read(header_length).decode('utf-8').split(_FIELD_SEPARATOR)
+        date = datetime.date.fromisoformat(date_str)
+    except ValueError as e: # UnicodeDecodeError da ValueError'dır
+        raise BinaryFormatError(f"'{file_path}' başlığı çözülemedi: {e}") from e
+
+    has_footer = bool(flags & FLAG_FOOTER)
+    data_offset = _data_offset(header_length)
+    expected_size = data_offset + count * (8 + 4) + (_FOOTER.size if has_footer else 0)
+    if os.fstat(f.fileno()).st_size != expected_size:
+        raise BinaryFormatError(f"'{file_path}' boyutu başlıktaki nokta sayısıyla ({count}) uyuşmuyor.")
+    header_info = {'id': id_, 'measurement_type': measurement_type, 'location': location, 'date': date}
+    return header_info, count, data_offset, has_footer
+
+def _read_footer(f, file_path: str) -> ColumnStatistics:
+    f.seek(-_FOOTER.size, os.SEEK_END)
+    magic, count, total, minimum, maximum = _FOOTER.unpack(f.read(_FOOTER.size))
+    if magic != _FOOTER_MAGIC:
+        raise BinaryFormatError(f"'{file_path}' alt bilgisi bozuk.")
+    return ColumnStatistics(count, total, minimum, maximum)
+
+def read_binary_header(file_path: str) -> Dict[str, any]:
+    """
+    İkili dosyanın yalnızca başlığını ve (varsa) alt bilgisini okur; nokta verisine dokunmaz.
+    Dönüş değeri: {'id', 'measurement_type', 'location', 'date', 'statistics'} (alt bilgi yoksa statistics None)
+    """
+    with open(file_path, 'rb') as f:
+        header_info, _, _, has_footer = _read_layout(f, file_path)
+        header_info['statistics'] = _read_footer(f, file_path) if has_footer else None
+    return header_info
+
+def load_binary(file_path: str, memory_map: bool = True) -> MeasurementData:
+    """
+    İkili ölçüm dosyasını yükler. memory_map açıksa (ve makine küçük endian ise) dosya belleğe
+    eşlenir ve sütunlar eşlenmiş belleğin salt okunur görünümleri olur: değerler kopyalanmaz,
+    yalnızca erişilen sayfalar diskten okunur. Aksi halde sütunlar dizilere kopyalanır
+    (örn. sonucu başka sürece gönderilecek okumalarda).
+    """
+    with open(file_path, 'rb') as f:
+        header_info, count, data_offset, has_footer = _read_layout(f, file_path)
+        statistics = _read_footer(f, file_path) if has_footer else None
+        values_end = data_offset + count * 8
+        times_end = values_end + count * 4
+        if memory_map and count and sys.byteorder == 'little':
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            value_column = view[data_offset:values_end].cast(VALUE_TYPECODE)
+            time_column = view[values_end:times_end].cast(TIME_TYPECODE)
+        else:
+            f.seek(data_offset)
+            value_column = array(VALUE_TYPECODE)
+            time_column = array(TIME_TYPECODE)
+            value_column.frombytes(f.read(count * 8))
+            time_column.frombytes(f.read(count * 4))
+            if sys.byteorder == 'big':
+                value_column.byteswap()
+                time_column.byteswap()
+    return MeasurementData(time_column=time_column, value_column=value_column, statistics=statistics,
+                           file_path=file_path, **header_info)
+
+def binary_path_for(file_path: str, source_root: str, target_root: str) -> str:
+    """Metin dosyasının hedef kökteki ikili karşılığının yolu (tip klasörü korunur)."""
+    relative = os.path.relpath(file_path, source_root)
+    return os.path.join(target_root, os.path.splitext(relative)[0] + BINARY_SUFFIX)
+
+def convert_folder(parser, source_root: str, target_root: Optional[str] = None, with_footer: bool = True,
+                   progress: Optional[Callable[[int, int], None]] = None) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """
+    Kök klasördeki .txt ölçüm dosyalarını ikili biçime çevirir. target_root verilmezse ikili
+    dosyalar metin dosyalarının yanına yazılır (okuyucu daha yeni olanı kullanır).
+    Hedefi kaynaktan yeni olan dosyalar atlanır; böylece dönüştürme tekrar çalıştırıldığında
+    yalnızca yeni veya değişen dosyalar işlenir.
+    Dönüş değeri: (dönüştürülen, atlanan, [(dosya yolu, hata nedeni), ...])
+    """
+    target_root = target_root or source_root
+    file_jobs = parser._collect_file_jobs(source_root, suffixes=('.txt',))
+    converted = skipped = 0
+    failures = []
+    for processed, (file_path, measurement_type) in enumerate(file_jobs, 1):
+        target_path = binary_path_for(file_path, source_root, target_root)
+        try:
+            if os.path.exists(target_path) and os.path.getmtime(target_path) >= os.path.getmtime(file_path):
+                skipped += 1
+            else:
+                data = parser._parse_file_checked(file_path)
+                if data.measurement_type != measurement_type:
+                    raise ValueError(f"Ölçüm tipi '{data.measurement_type}', '{measurement_type}' klasörü ile uyuşmuyor.")
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                write_binary(target_path, data, with_footer)
+                converted += 1
+        except Exception as e:
+            failures.append((file_path, str(e)))
+        if progress:
+            progress(processed, len(file_jobs))
+    return converted, skipped, failures
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from data_parser import MeasurementParser
+    arg_parser = argparse.ArgumentParser(description="Metin ölçüm dosyalarını ikili sütunlu biçime (.olc) çevirir.")
+    arg_parser.add_argument('source', help="Ölçüm kök klasörü (altında sıcaklık/, nem/ gibi tip klasörleri bulunan)")
+    arg_parser.add_argument('target', nargs='?', default=None,
+                            help="İkili dosyaların yazılacağı kök klasör (varsayılan: kaynak klasörün kendisi)")
+    arg_parser.add_argument('--no-footer', action='store_true', help="Alt bilgi (sayı, toplam, min, max) yazma")
+    args = arg_parser.parse_args(argv)
+
+    parser = MeasurementParser(verbose=False)
+    converted, skipped, failures = convert_folder(parser, args.source, args.target, not args.no_footer)
+    print(f"{converted} dosya dönüştürüldü, {skipped} dosya güncel olduğu için atlandı.")
+    for file_path, reason in failures:
+        print(f"Uyarı: {file_path} dönüştürülemedi: {reason}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
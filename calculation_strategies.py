@@ -1,9 +1,270 @@
 # calculation_strategies.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict # Buraya Dict eklendi!
+from typing import List, Dict, Optional, Sequence, Tuple # Buraya Dict eklendi!
+from array import array
+from bisect import bisect_right
+import copy
+from functools import cached_property
 import math
 from collections import Counter
+from instrumentation import NULL_INSTRUMENTATION
+from measurement import ColumnStatistics
+from measurement_types import histogram_bin_width
+from quantile_sketch import KLLSketch, k_for_rank_error
+from result_cache import MISSING, content_key
+
+# Medyan histogramının tam değer olarak tutabileceği en fazla farklı değer sayısı
+DEFAULT_MAX_HISTOGRAM_BINS = 1 << 16
+# Tam (kutusuz) frekans ve tam persentilin global ve akış sonuçlarında birleştirilebilecek en fazla
+# farklı değer sayısı. Kısmi özet bu sınırın ötesine hiç büyümez (float anahtarlı sözlükte yaklaşık 64 MB).
+DEFAULT_MAX_EXACT_VALUES = 1 << 20
+# Kutulu frekans (Histogram) için kutu genişliği tanımlanmamış tiplerde kullanılan genişlik;
+# tip başına varsayılanlar measurement_types kaydındadır
+DEFAULT_HISTOGRAM_BIN_WIDTH = 1.0
+
+def select_kth(data_values: Sequence[float], k: int) -> float:
+    """
+    Sıralanmış haldeki k. (0 tabanlı) elemanı tam sıralama yapmadan bulur.
+    Quickselect: beklenen doğrusal süre, küçük parçalar için sorted() kullanılır.
+    """
+    items = data_values
+    while True:
+        if len(items) <= 32:
+            return sorted(items)[k]
+        # Üçün ortancası pivot seçimi (sıralı verilerde kötü duruma düşmemek için)
+        pivot = sorted((items[0], items[len(items) // 2], items[-1]))[1]
+        lows = [x for x in items if x < pivot]
+        if k < len(lows):
+            items = lows
+            continue
+        highs = [x for x in items if x > pivot]
+        equal_count = len(items) - len(lows) - len(highs)
+        if k < len(lows) + equal_count:
+            return pivot
+        k -= len(lows) + equal_count
+        items = highs
+
+class MergeableHistogram:
+    """
+    Birleştirilebilir, bellek sınırlı değer histogramı (global medyan için).
+
+    Farklı değer sayısı max_bins değerini aşmadıkça değerler tam olarak sayılır ve
+    sıra istatistikleri (medyan) tam sonuç verir. Aşıldığında değerler 2'nin kuvveti
+    genişliğindeki kutulara toplanır; kutular iç içe geçtiği için farklı genişlikteki
+    histogramlar da birleştirilebilir. Bu durumda hata en fazla bin_width / 2 olur.
+    max_bins None ise hiçbir zaman kutulanmaz (bellek farklı değer sayısıyla büyür, sonuç hep tamdır).
+    """
+
+    def __init__(self, max_bins: Optional[int] = DEFAULT_MAX_HISTOGRAM_BINS):
+        self.max_bins = max_bins
+        self.bin_width = 0.0 # 0 ise değerler tam olarak tutulur
+        self.counts: Dict[float, int] = {}
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    @classmethod
+    def from_value_counts(cls, value_counts: Dict[float, int],
+                          max_bins: Optional[int] = DEFAULT_MAX_HISTOGRAM_BINS) -> 'MergeableHistogram':
+        """{değer: adet} sözlüğünden bir histogram oluşturur."""
+        histogram = cls(max_bins)
+        if value_counts:
+            histogram._add(value_counts, sum(value_counts.values()), min(value_counts), max(value_counts))
+        return histogram
+
+    def merge(self, other: 'MergeableHistogram') -> 'MergeableHistogram':
+        """Diğer histogramı bu histograma ekler ve kendisini döndürür."""
+        if other.bin_width > self.bin_width:
+            self._rebin(other.bin_width)
+        if other.count:
+            self._add(other.counts, other.count, other.minimum, other.maximum)
+        return self
+
+    def _add(self, counts: Dict[float, int], count: int, minimum: float, maximum: float):
+        width = self.bin_width
+        own_counts = self.counts
+        for value, value_count in counts.items():
+            key = math.floor(value / width) * width if width else value
+            own_counts[key] = own_counts.get(key, 0) + value_count
+        self.count += count
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+        self._compact()
+
+    def _rebin(self, width: float):
+        counts = {}
+        for value, value_count in self.counts.items():
+            key = math.floor(value / width) * width
+            counts[key] = counts.get(key, 0) + value_count
+        self.counts = counts
+        self.bin_width = width
+
+    def _compact(self):
+        if self.max_bins is None:
+            return
+        while len(self.counts) > self.max_bins:
+            if self.bin_width:
+                width = self.bin_width * 2
+            else:
+                # İlk kutu genişliği: aralığı max_bins kutuya bölen en küçük 2'nin kuvveti
+                width = 2.0 ** math.ceil(math.log2((self.maximum - self.minimum) / self.max_bins))
+            self._rebin(width)
+
+    def value_at_rank(self, rank: int) -> float:
+        """Sıralanmış haldeki rank. (0 tabanlı) değeri döndürür (kutulu modda kutu ortası)."""
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if rank < seen:
+                if not self.bin_width:
+                    return key
+                return min(max(key + self.bin_width / 2, self.minimum), self.maximum)
+        raise IndexError("Histogram sırası aralık dışında.")
+
+    def median(self) -> float:
+        n = self.count
+        if n % 2 == 1:
+            return self.value_at_rank(n // 2)
+        return (self.value_at_rank(n // 2 - 1) + self.value_at_rank(n // 2)) / 2
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        """
+        Kesirler (0-1) için doğrusal aradeğerli kantiller; tam modda sıralı değerlerle aynı sonucu verir.
+        Tüm kantiller sayımlar üzerinden tek bir geçişle bulunur.
+        """
+        positions = [fraction * (self.count - 1) for fraction in fractions]
+        ranks = sorted({rank for position in positions for rank in (math.floor(position), math.ceil(position))})
+        values_at = {}
+        seen = 0
+        rank_iter = iter(ranks)
+        rank = next(rank_iter, None)
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            while rank is not None and rank < seen:
+                values_at[rank] = key if not self.bin_width else \
+                    min(max(key + self.bin_width / 2, self.minimum), self.maximum)
+                rank = next(rank_iter, None)
+        return [_interpolate(values_at[math.floor(position)], values_at[math.ceil(position)], position)
+                for position in positions]
+
+def check_distinct_limit(merged: Dict[float, int], incoming: Dict[float, int], limit: Optional[int],
+                         message: str):
+    """
+    incoming sayımları merged'e eklenmeden önce çağrılır; eklenince farklı değer sayısı limit'i
+    aşacaksa ValueError fırlatır. Böylece birleştirilen özet sınırın ötesine hiç büyümez.
+    """
+    if limit is None or len(merged) + len(incoming) <= limit:
+        return
+    if len(merged) + sum(1 for key in incoming if key not in merged) > limit:
+        raise ValueError(message)
+
+def _interpolate(lower: float, upper: float, position: float) -> float:
+    """position'ın kesirli kısmına göre iki komşu sıra istatistiği arasında doğrusal aradeğer."""
+    fraction = position - math.floor(position)
+    return lower + (upper - lower) * fraction if fraction else lower
+
+class SeriesSummary:
+    """
+    Tek bir değer serisi için ara istatistikleri tembel olarak hesaplar ve saklar.
+    Birden fazla strateji aynı ara değeri (toplam, ortalama vb.) isterse
+    veri üzerinden yalnızca bir kez geçilir.
+
+    times verilirse değerlerle aynı sırada gün başından itibaren saniyelerdir;
+    zaman serisi stratejileri tarafından kullanılır.
+    """
+
+    def __init__(self, data_values: Sequence[float], times: Optional[Sequence[int]] = None):
+        self.values = data_values
+        self.times = times
+
+    @cached_property
+    def count(self) -> int:
+        return len(self.values)
+
+    @cached_property
+    def total(self) -> float:
+        return sum(self.values)
+
+    @cached_property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    @cached_property
+    def squared_deviation_sum(self) -> float:
+        """Ortalamadan sapmaların karelerinin toplamı (M2)."""
+        mean = self.mean
+        return sum((x - mean) ** 2 for x in self.values)
+
+    @cached_property
+    def minimum(self) -> float:
+        return min(self.values)
+
+    @cached_property
+    def maximum(self) -> float:
+        return max(self.values)
+
+    @cached_property
+    def value_counts(self) -> Dict[float, int]:
+        return dict(Counter(self.values))
+
+    @cached_property
+    def time_order(self) -> Optional[List[int]]:
+        """
+        Zamanlar sıralı değilse değerleri zamana göre sıralayan indeks listesi, sıralıysa None.
+        Ölçüm dosyaları genellikle zaten sıralı olduğu için çoğunlukla tek bir doğrusal kontrol yapılır.
+        """
+        times = self.times
+        if all(times[i] <= times[i + 1] for i in range(len(times) - 1)):
+            return None
+        return sorted(range(len(times)), key=times.__getitem__)
+
+    @cached_property
+    def sorted_values(self) -> List[float]:
+        """Sıralı değerler; birden fazla kantil stratejisi aynı sıralamayı paylaşır."""
+        return sorted(self.values)
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        """Kesirler (0-1) için doğrusal aradeğerli kesin kantiller (tek sıralama)."""
+        ordered = self.sorted_values
+        last = self.count - 1
+        return [_interpolate(ordered[math.floor(fraction * last)], ordered[math.ceil(fraction * last)], fraction * last)
+                for fraction in fractions]
+
+    @cached_property
+    def median(self) -> float:
+        n = self.count
+        if n % 2 == 1: # Tek sayıda eleman
+            return select_kth(self.values, n // 2)
+        # Çift sayıda eleman: iki ortadaki eleman
+        mid1 = select_kth(self.values, n // 2 - 1)
+        mid2 = select_kth(self.values, n // 2)
+        return (mid1 + mid2) / 2
+
+def binned_counts(summary: SeriesSummary, bin_width: Optional[float] = None,
+                  bin_edges: Optional[Sequence[float]] = None) -> Dict[int, int]:
+    """
+    Değerleri kutulara sayar: {kutu indeksi: adet}.
+
+    bin_width verilirse i. kutu [i * bin_width, (i + 1) * bin_width) aralığıdır; kutular sıfırdan
+    başlayan sabit bir ızgaraya oturduğu için farklı dosyaların sayımları doğrudan toplanabilir.
+    bin_edges verilirse i. kutu [bin_edges[i], bin_edges[i + 1]) aralığıdır; ilk kenardan küçükler
+    -1, son kenar ve üstü len(bin_edges) - 1 indeksine düşer.
+
+    Seri için farklı değer sayımları zaten hesaplanmışsa kutulama bunlar üzerinden yapılır.
+    """
+    if bin_edges is not None:
+        edges = list(bin_edges)
+        index_of = lambda value: bisect_right(edges, value) - 1
+    else:
+        index_of = lambda value: math.floor(value / bin_width)
+    if 'value_counts' in summary.__dict__: # cached_property önceden hesaplanmış
+        counts: Dict[int, int] = {}
+        for value, value_count in summary.value_counts.items():
+            key = index_of(value)
+            counts[key] = counts.get(key, 0) + value_count
+        return counts
+    return dict(Counter(map(index_of, summary.values)))
 
 # Strateji arayüzü (soyut sınıf)
 class ICalculationStrategy(ABC):
@@ -14,12 +275,66 @@ class ICalculationStrategy(ABC):
         """Verilen değerler listesi üzerinde hesaplamayı yapar."""
         pass
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> any:
+        """
+        Paylaşılan ara istatistikler üzerinden hesaplama yapar.
+        Varsayılan olarak ham değerlerle calculate() çağrılır; somut stratejiler
+        ortak ara değerleri kullanmak için bu metodu ezebilir.
+        """
+        return self.calculate(summary.values)
+
+    # Global hesaplamalar için birleştirilebilir kısmi özetler.
+    # Varsayılan uygulama ham değerleri kopyalar; somut stratejiler daha küçük özetler üretir.
+
+    def partial_from_summary(self, summary: SeriesSummary) -> any:
+        """Tek bir seriden (dosyadan) global sonuca birleştirilecek kısmi özeti üretir."""
+        return array('d', summary.values)
+
+    def merge_partials(self, left: any, right: any) -> any:
+        """İki kısmi özeti birleştirir. 'left' yerinde değiştirilip döndürülebilir."""
+        left.extend(right)
+        return left
+
+    def calculate_from_partial(self, partial: any) -> any:
+        """Birleştirilmiş kısmi özetten sonucu hesaplar."""
+        return self.calculate(partial)
+
+    def partial_from_statistics(self, statistics: ColumnStatistics) -> any:
+        """
+        Dosyanın hazır özetinden (ikili biçimin alt bilgisi) kısmi özet üretir; böylece nokta
+        verisi hiç okunmaz. Özet bu strateji için yeterli değilse None döner (varsayılan).
+        """
+        return None
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Hesaplama stratejisinin adını döndürür."""
         pass
 
+    # Global (tüm dosyalar birleşik) hesaplama anlamlı mı; arayüz global checkbox'ını buna göre açar
+    supports_global = True
+
+    # Hesaplama mantığı değiştiğinde artırılır; sonuç önbelleğindeki eski sonuçlar böylece geçersiz olur
+    version = 1
+
+    # Sonucun metin çıktısındaki yerleşimi (bkz. output_writer.OUTPUT_LAYOUTS):
+    # 'value' başlık başına tek değer, 'single_line' tek satıra yazılan sözlük (örn. 'p5: 1.2, p95: 3.4'),
+    # 'frequency' başlık başına değer/adet bloğu, 'series' başlık başına zaman etiketli satırlar
+    output_layout = 'value'
+
+    @property
+    def global_output_layout(self) -> str:
+        """Global sonucun yerleşimi; varsayılan olarak lokal sonuçla aynıdır."""
+        return self.output_layout
+
+    def for_measurement_type(self, measurement_type: str) -> 'ICalculationStrategy':
+        """
+        Ölçüm tipine göre ayarlanmış stratejiyi döndürür (örn. tipe özel kutu genişliği).
+        Varsayılan olarak strateji tipten bağımsızdır ve kendisi döndürülür.
+        """
+        return self
+
 # Somut Stratejiler
 class AverageCalculationStrategy(ICalculationStrategy):
     def calculate(self, data_values: List[float]) -> float:
@@ -27,6 +342,26 @@ class AverageCalculationStrategy(ICalculationStrategy):
             return 0.0
         return sum(data_values) / len(data_values)
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        if not summary.count:
+            return 0.0
+        return summary.mean
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Tuple[int, float]:
+        return (summary.count, summary.total if summary.count else 0.0)
+
+    def merge_partials(self, left: Tuple[int, float], right: Tuple[int, float]) -> Tuple[int, float]:
+        return (left[0] + right[0], left[1] + right[1])
+
+    def partial_from_statistics(self, statistics: ColumnStatistics) -> Tuple[int, float]:
+        return (statistics.count, statistics.total if statistics.count else 0.0)
+
+    def calculate_from_partial(self, partial: Tuple[int, float]) -> float:
+        count, total = partial
+        if not count:
+            return 0.0
+        return total / count
+
     @property
     def name(self) -> str:
         return "Ortalama"
@@ -37,6 +372,27 @@ class MaximumCalculationStrategy(ICalculationStrategy):
             raise ValueError("Maksimum hesaplamak için veri bulunmuyor.")
         return max(data_values)
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        if not summary.count:
+            raise ValueError("Maksimum hesaplamak için veri bulunmuyor.")
+        return summary.maximum
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Optional[float]:
+        return summary.maximum if summary.count else None
+
+    def partial_from_statistics(self, statistics: ColumnStatistics) -> Optional[float]:
+        return statistics.maximum if statistics.count else None
+
+    def merge_partials(self, left: Optional[float], right: Optional[float]) -> Optional[float]:
+        if left is None or right is None:
+            return right if left is None else left
+        return max(left, right)
+
+    def calculate_from_partial(self, partial: Optional[float]) -> float:
+        if partial is None:
+            raise ValueError("Maksimum hesaplamak için veri bulunmuyor.")
+        return partial
+
     @property
     def name(self) -> str:
         return "Maksimum"
@@ -47,6 +403,27 @@ class MinimumCalculationStrategy(ICalculationStrategy):
             raise ValueError("Minimum hesaplamak için veri bulunmuyor.")
         return min(data_values)
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        if not summary.count:
+            raise ValueError("Minimum hesaplamak için veri bulunmuyor.")
+        return summary.minimum
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Optional[float]:
+        return summary.minimum if summary.count else None
+
+    def partial_from_statistics(self, statistics: ColumnStatistics) -> Optional[float]:
+        return statistics.minimum if statistics.count else None
+
+    def merge_partials(self, left: Optional[float], right: Optional[float]) -> Optional[float]:
+        if left is None or right is None:
+            return right if left is None else left
+        return min(left, right)
+
+    def calculate_from_partial(self, partial: Optional[float]) -> float:
+        if partial is None:
+            raise ValueError("Minimum hesaplamak için veri bulunmuyor.")
+        return partial
+
     @property
     def name(self) -> str:
         return "Minimum"
@@ -62,14 +439,86 @@ class StandardDeviationCalculationStrategy(ICalculationStrategy):
         variance = sum([(x - mean) ** 2 for x in data_values]) / (n - 1) # Örneklem standart sapması
         return math.sqrt(variance)
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        if summary.count < 2:
+            return 0.0
+        return math.sqrt(summary.squared_deviation_sum / (summary.count - 1))
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Tuple[int, float, float]:
+        """(adet, ortalama, M2) üçlüsü."""
+        if not summary.count:
+            return (0, 0.0, 0.0)
+        return (summary.count, summary.mean, summary.squared_deviation_sum)
+
+    def partial_from_statistics(self, statistics: ColumnStatistics) -> Optional[Tuple[int, float, float]]:
+        if not statistics.count:
+            return (0, 0.0, 0.0)
+        if statistics.squared_deviation_sum is None:
+            return None
+        return (statistics.count, statistics.total / statistics.count, statistics.squared_deviation_sum)
+
+    def merge_partials(self, left: Tuple[int, float, float], right: Tuple[int, float, float]) -> Tuple[int, float, float]:
+        """Chan vd. paralel varyans birleştirmesi."""
+        n_a, mean_a, m2_a = left
+        n_b, mean_b, m2_b = right
+        if not n_a or not n_b:
+            return right if not n_a else left
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        return (n, mean_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n)
+
+    def calculate_from_partial(self, partial: Tuple[int, float, float]) -> float:
+        n, _, m2 = partial
+        if n < 2:
+            return 0.0
+        return math.sqrt(m2 / (n - 1))
+
     @property
     def name(self) -> str:
         return "Standart Sapma"
 
 class FrequencyCalculationStrategy(ICalculationStrategy):
+    """
+    Değerlerin kaç kez ölçüldüğünü sayar. bin_width veya bin_edges verilmezse her farklı
+    değer ayrı sayılır (tam mod); verilirse değerler kutulara sayılır ve sonuç anahtarları
+    '[alt, üst)' biçiminde kutu etiketleridir (bkz. binned_counts).
+
+    Tam modda global ve akış sonuçları da tamdır. Birleştirilen farklı değer sayısı
+    max_distinct_values sınırını aşacaksa sayımlar eklenmez ve sonuç yaklaşık değerlerle
+    üretilmez, ValueError fırlatılır; akış modunda bellek bu sınırla (ve bir parça ile) sınırlıdır.
+    """
+
+    def __init__(self, bin_width: Optional[float] = None, bin_edges: Optional[Sequence[float]] = None,
+                 max_distinct_values: Optional[int] = DEFAULT_MAX_EXACT_VALUES):
+        if bin_width is not None and bin_width <= 0:
+            raise ValueError("Kutu genişliği pozitif olmalıdır.")
+        if bin_edges is not None and (len(bin_edges) < 2 or list(bin_edges) != sorted(bin_edges)):
+            raise ValueError("Kutu kenarları en az iki elemanlı ve artan sırada olmalıdır.")
+        self.bin_width = bin_width
+        self.bin_edges = list(bin_edges) if bin_edges is not None else None
+        self.max_distinct_values = max_distinct_values # Tam modda global/akış sayımı için üst sınır (None: sınırsız)
+
+    @property
+    def binned(self) -> bool:
+        return self.bin_width is not None or self.bin_edges is not None
+
+    def bin_label(self, key: int) -> str:
+        """Kutu indeksinin etiketi (alt sınır dahil, üst sınır hariç). Örn: '[9.5, 10)'"""
+        if self.bin_edges is not None:
+            edges = self.bin_edges
+            if key < 0:
+                return f"< {edges[0]:g}"
+            if key >= len(edges) - 1:
+                return f">= {edges[-1]:g}"
+            return f"[{edges[key]:g}, {edges[key + 1]:g})"
+        lower = round(key * self.bin_width, 10)
+        return f"[{lower:g}, {round(lower + self.bin_width, 10):g})"
+
     def calculate(self, data_values: List[float]) -> Dict[float, int]:
         if not data_values:
             return {}
+        if self.binned:
+            return self.calculate_from_summary(SeriesSummary(data_values))
         # Sayıları tam sayıya yuvarlayarak frekans sayımı yapabiliriz
         # Float değerler için doğrudan Counter kullanmak bazı ondalık farklardan dolayı sorun yaratabilir.
         # Ödevde örnek çıktıya bakılırsa "9 Derece 8 defa ölçüldü" gibi tam sayı kullanılmış.
@@ -77,10 +526,86 @@ class FrequencyCalculationStrategy(ICalculationStrategy):
         # float değerleri direkt sayabiliriz. Şimdilik direkt sayım yapalım.
         return dict(Counter(data_values))
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> Dict[float, int]:
+        if not summary.count:
+            return {}
+        if self.binned:
+            return self._labelled(binned_counts(summary, self.bin_width, self.bin_edges))
+        return summary.value_counts
+
+    def _labelled(self, counts: Dict[int, int]) -> Dict[str, int]:
+        return {self.bin_label(key): counts[key] for key in sorted(counts)}
+
+    def partial_from_summary(self, summary: SeriesSummary):
+        if self.binned:
+            # Kutu sayımları sabit ızgarada olduğu için birleştirme yalnızca toplamadır
+            return binned_counts(summary, self.bin_width, self.bin_edges) if summary.count else {}
+        # Tam modda kısmi özet {değer: adet} sözlüğüdür; değerler hiçbir zaman kutulanmaz
+        return dict(summary.value_counts) if summary.count else {}
+
+    def merge_partials(self, left, right):
+        if not self.binned:
+            # Bellek farklı değer sayısıyla büyür; sayımlar kutulanarak uydurulmaz, sınır aşılacaksa
+            # hesaplama birleştirmeden önce durdurulur
+            check_distinct_limit(left, right, self.max_distinct_values,
+                                 f"Tam frekans için farklı değer sayısı {self.max_distinct_values} sınırını aştı; "
+                                 f"kutulu sayım için Histogram hesaplamasını kullanın.")
+        # İlk görülme sırası korunur; böylece tam modda sonuç birleşik listedeki Counter ile aynı sıradadır
+        for key, count in right.items():
+            left[key] = left.get(key, 0) + count
+        return left
+
+    def calculate_from_partial(self, partial) -> Dict[float, int]:
+        if self.binned:
+            return self._labelled(partial)
+        return partial
+
+    # 2: akış ve global tam frekans sonuçları artık kutulanmaz
+    version = 2
+
+    output_layout = 'frequency'
+    global_output_layout = 'value' # Global tam frekans sözlüğü tek satıra olduğu gibi yazılır
+
     @property
     def name(self) -> str:
         return "Frekans"
 
+class HistogramCalculationStrategy(FrequencyCalculationStrategy):
+    """
+    Kutulu frekans. Kutu genişliği veya kenarları verilmezse ölçüm tipinin kayıtlı
+    genişliği kullanılır (örn. sıcaklık için 0.5 derece, bkz. measurement_types).
+    bin_widths verilirse tip başına genişlikler kayıt yerine bu sözlükten okunur.
+    """
+
+    def __init__(self, bin_width: Optional[float] = None, bin_edges: Optional[Sequence[float]] = None,
+                 bin_widths: Optional[Dict[str, float]] = None):
+        if bin_width is None and bin_edges is None:
+            bin_width = DEFAULT_HISTOGRAM_BIN_WIDTH
+            self._type_specific = True
+        else:
+            self._type_specific = False
+        super().__init__(bin_width, bin_edges)
+        self.bin_widths = dict(bin_widths) if bin_widths is not None else None
+
+    def for_measurement_type(self, measurement_type: str) -> 'HistogramCalculationStrategy':
+        if not self._type_specific:
+            return self
+        if self.bin_widths is not None:
+            width = self.bin_widths.get(measurement_type)
+        else:
+            width = histogram_bin_width(measurement_type)
+        if width is None:
+            return self
+        configured = copy.copy(self)
+        configured.bin_width = width
+        return configured
+
+    global_output_layout = 'frequency' # Global histogram da lokal ile aynı biçimde (tek blok) yazılır
+
+    @property
+    def name(self) -> str:
+        return "Histogram"
+
 class MedianCalculationStrategy(ICalculationStrategy):
     def calculate(self, data_values: List[float]) -> float:
         if not data_values:
@@ -96,6 +621,255 @@ class MedianCalculationStrategy(ICalculationStrategy):
             mid2 = sorted_values[n // 2]
             return (mid1 + mid2) / 2
 
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        if not summary.count:
+            raise ValueError("Medyan hesaplamak için veri bulunmuyor.")
+        return summary.median
+
+    def partial_from_summary(self, summary: SeriesSummary) -> MergeableHistogram:
+        if not summary.count:
+            return MergeableHistogram()
+        return MergeableHistogram.from_value_counts(summary.value_counts)
+
+    def merge_partials(self, left: MergeableHistogram, right: MergeableHistogram) -> MergeableHistogram:
+        return left.merge(right)
+
+    def calculate_from_partial(self, partial: MergeableHistogram) -> float:
+        if not partial.count:
+            raise ValueError("Medyan hesaplamak için veri bulunmuyor.")
+        return partial.median()
+
     @property
     def name(self) -> str:
-        return "Medyan"
\ No newline at end of file
+        return "Medyan"
+
+class PercentileCalculationStrategy(ICalculationStrategy):
+    """
+    İstenen kantilleri (varsayılan p5, p50, p95, p99) birlikte hesaplar.
+    Sonuç: {'p5': değer, 'p50': değer, ...}
+
+    mode='exact': tüm kantiller tek bir sıralamadan doğrusal aradeğerle hesaplanır; global ve
+    akış sonuçları kutulanmayan değer sayımlarının (MergeableHistogram, max_bins=None)
+    birleştirilmesiyle bulunur ve her zaman tamdır. Bellek farklı değer sayısıyla büyür;
+    birleştirilen farklı değer sayısı max_distinct_values sınırını aşacaksa ValueError fırlatılır.
+    mode='approximate': her seri için sabit bellekli bir KLL özeti oluşturulur ve global sonuç
+    özetler birleştirilerek bulunur. Normalize sıra hatası yaklaşık rank_error kadardır.
+    """
+
+    def __init__(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95, 0.99), mode: str = 'exact',
+                 rank_error: float = 0.01, seed: Optional[int] = 0,
+                 max_distinct_values: Optional[int] = DEFAULT_MAX_EXACT_VALUES):
+        if mode not in ('exact', 'approximate'):
+            raise ValueError(f"Geçersiz persentil modu: '{mode}'")
+        if not quantiles or any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError("Kantiller 0 ile 1 arasında olmalıdır.")
+        self.quantiles = list(quantiles)
+        self.mode = mode
+        self.rank_error = rank_error
+        self.seed = seed
+        self.max_distinct_values = max_distinct_values # Tam modda global/akış sayımı için üst sınır (None: sınırsız)
+
+    def _labelled(self, values: List[float]) -> Dict[str, float]:
+        return {f"p{q * 100:g}": value for q, value in zip(self.quantiles, values)}
+
+    def _new_sketch(self) -> KLLSketch:
+        return KLLSketch(k_for_rank_error(self.rank_error), self.seed)
+
+    def calculate(self, data_values: List[float]) -> Dict[str, float]:
+        return self.calculate_from_summary(SeriesSummary(data_values))
+
+    def calculate_from_summary(self, summary: SeriesSummary) -> Dict[str, float]:
+        if not summary.count:
+            raise ValueError(f"{self.name} hesaplamak için veri bulunmuyor.")
+        if self.mode == 'approximate':
+            return self.calculate_from_partial(self.partial_from_summary(summary))
+        return self._labelled(summary.quantiles(self.quantiles))
+
+    def partial_from_summary(self, summary: SeriesSummary):
+        if self.mode == 'approximate':
+            sketch = self._new_sketch()
+            sketch.extend(summary.values)
+            return sketch
+        # Tam modda sayımlar hiç kutulanmaz; aksi halde kantiller kutu ortalarından yaklaşık çıkardı
+        if not summary.count:
+            return MergeableHistogram(max_bins=None)
+        return MergeableHistogram.from_value_counts(summary.value_counts, max_bins=None)
+
+    def merge_partials(self, left, right):
+        if self.mode == 'exact':
+            check_distinct_limit(left.counts, right.counts, self.max_distinct_values,
+                                 f"Tam persentil için farklı değer sayısı {self.max_distinct_values} sınırını aştı; "
+                                 f"sabit bellekli Yaklaşık Persentil hesaplamasını kullanın.")
+        return left.merge(right)
+
+    def calculate_from_partial(self, partial) -> Dict[str, float]:
+        if not partial.count:
+            raise ValueError(f"{self.name} hesaplamak için veri bulunmuyor.")
+        return self._labelled(partial.quantiles(self.quantiles))
+
+    # 2: tam modun global ve akış sonuçları artık kutulanmaz
+    # 3: yaklaşık mod kantilleri komşu sıralar arasında aradeğerle bulunur
+    version = 3
+
+    output_layout = 'single_line'
+
+    @property
+    def name(self) -> str:
+        return "Persentil"
+
+class ApproximatePercentileCalculationStrategy(PercentileCalculationStrategy):
+    """Sabit bellekli KLL özetiyle yaklaşık persentiller (bkz. PercentileCalculationStrategy)."""
+
+    def __init__(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95, 0.99), rank_error: float = 0.01,
+                 seed: Optional[int] = 0):
+        super().__init__(quantiles, 'approximate', rank_error, seed)
+
+    @property
+    def name(self) -> str:
+        return "Yaklaşık Persentil"
+
+class FusedCalculationEngine:
+    """
+    Seçili stratejilerin hepsini bir seri üzerinde birlikte hesaplar.
+    Her seri için tek bir SeriesSummary oluşturulur; böylece ortak ara değerler
+    (toplam, ortalama, min/max, sayımlar) stratejiler arasında paylaşılır.
+    """
+
+    def __init__(self, strategies: List[ICalculationStrategy], instrumentation=NULL_INSTRUMENTATION,
+                 result_cache=None):
+        self.strategies = list(strategies)
+        self.instrumentation = instrumentation # Açıksa her strateji ayrı zamanlayıcıyla ölçülür
+        self.result_cache = result_cache # ResultCache verilirse yalnızca önbellekte olmayan sonuçlar hesaplanır
+
+    def calculate(self, data_values: Sequence[float]) -> Tuple[Dict[str, any], Dict[str, ValueError]]:
+        """
+        Tüm stratejileri verilen seri üzerinde çalıştırır.
+        Dönüş değeri: ({strateji adı: sonuç}, {strateji adı: ValueError})
+        """
+        return self.calculate_summary(SeriesSummary(data_values))
+
+    def calculate_summary(self, summary: SeriesSummary,
+                          series_key: Optional[str] = None) -> Tuple[Dict[str, any], Dict[str, ValueError]]:
+        """
+        calculate() ile aynıdır; hazır bir SeriesSummary üzerinde çalışır.
+        Sonuç önbelleği varsa seri içerik özetiyle (series_key, verilmezse hesaplanır)
+        saklı sonuçlar kullanılır ve yalnızca eksik stratejiler hesaplanıp saklanır.
+        Hata veren stratejiler saklanmaz.
+        """
+        results = {}
+        errors = {}
+        strategies = self.strategies
+        cache = self.result_cache
+        if cache is not None and strategies:
+            if series_key is None:
+                series_key = content_key(summary.values, summary.times)
+            strategies = []
+            for strategy in self.strategies:
+                result = cache.get(series_key, strategy)
+                if result is MISSING:
+                    strategies.append(strategy)
+                else:
+                    results[strategy.name] = result
+
+        timed = self.instrumentation.enabled
+        for strategy in strategies:
+            try:
+                if timed:
+                    with self.instrumentation.stage(f"strateji[{strategy.name}]"):
+                        results[strategy.name] = strategy.calculate_from_summary(summary)
+                else:
+                    results[strategy.name] = strategy.calculate_from_summary(summary)
+            except ValueError as e:
+                errors[strategy.name] = e
+                continue
+            if cache is not None:
+                cache.put(series_key, strategy, results[strategy.name])
+        if cache is not None and len(strategies) < len(self.strategies):
+            # Sonuçlar önbellekten gelse de stratejilerin seçim sırasında dönmesi için
+            results = {strategy.name: results[strategy.name] for strategy in self.strategies
+                       if strategy.name in results}
+        return results, errors
+
+class GlobalAggregator:
+    """
+    Global sonuçları ham değerleri birleştirmeden, dosya bazındaki kısmi
+    özetleri birleştirerek hesaplar. Lokal geçişte her dosyanın SeriesSummary
+    nesnesi add() ile eklenir; sonuçlar calculate() ile alınır.
+
+    Aynı yapı tek bir büyük dosyanın parça parça (akış halinde) okunan değer
+    gruplarını birleştirmek için de kullanılır.
+    """
+
+    def __init__(self, strategies: List[ICalculationStrategy], instrumentation=NULL_INSTRUMENTATION):
+        self.strategies = list(strategies)
+        self.instrumentation = instrumentation
+        self.partials: Dict[str, any] = {}
+        self.failures: Dict[str, ValueError] = {} # Birleştirmesi başarısız olan stratejiler (örn. sınır aşımı)
+        self.count = 0 # Eklenen toplam değer sayısı
+
+    def add(self, summary: SeriesSummary):
+        """Bir serinin kısmi özetlerini global özetlere ekler."""
+        self.count += summary.count
+        timed = self.instrumentation.enabled
+        for strategy in self.strategies:
+            if timed:
+                with self.instrumentation.stage(f"global[{strategy.name}]"):
+                    self._add_partial(strategy, summary)
+            else:
+                self._add_partial(strategy, summary)
+
+    def add_statistics(self, statistics: Optional[ColumnStatistics]) -> bool:
+        """
+        Bir dosyanın hazır özetini (nokta verisi okunmadan) global özetlere ekler.
+        Özet yoksa veya stratejilerden biri için yeterli değilse hiçbir şey eklenmez ve False döner.
+        """
+        if statistics is None:
+            return False
+        partials = {}
+        for strategy in self.strategies:
+            partial = strategy.partial_from_statistics(statistics)
+            if partial is None and statistics.count:
+                return False
+            partials[strategy.name] = partial
+        self.count += statistics.count
+        for strategy in self.strategies:
+            partial = partials[strategy.name]
+            if strategy.name in self.partials:
+                partial = strategy.merge_partials(self.partials[strategy.name], partial)
+            self.partials[strategy.name] = partial
+        return True
+
+    def _add_partial(self, strategy: ICalculationStrategy, summary: SeriesSummary):
+        if strategy.name in self.failures:
+            return
+        partial = strategy.partial_from_summary(summary)
+        if strategy.name in self.partials:
+            try:
+                partial = strategy.merge_partials(self.partials[strategy.name], partial)
+            except ValueError as e:
+                # Strateji sonuç üretemez; özet bırakılır ve hata calculate() ile raporlanır
+                self.failures[strategy.name] = e
+                del self.partials[strategy.name]
+                return
+        self.partials[strategy.name] = partial
+
+    def calculate(self) -> Tuple[Dict[str, any], Dict[str, ValueError]]:
+        """
+        Birleştirilmiş özetlerden global sonuçları hesaplar.
+        Dönüş değeri: ({strateji adı: sonuç}, {strateji adı: ValueError})
+        """
+        results = {}
+        errors = {}
+        for strategy in self.strategies:
+            if strategy.name in self.failures:
+                errors[strategy.name] = self.failures[strategy.name]
+                continue
+            partial = self.partials.get(strategy.name)
+            if partial is None and strategy.name not in self.partials:
+                partial = strategy.partial_from_summary(SeriesSummary(()))
+            try:
+                with self.instrumentation.stage(f"global[{strategy.name}]"):
+                    results[strategy.name] = strategy.calculate_from_partial(partial)
+            except ValueError as e:
+                errors[strategy.name] = e
+        return results, errors
\ No newline at end of file
@@ -0,0 +1,338 @@
+# cli.py
+#
+# Arayüz olmadan (PyQt5 yüklemeden) toplu hesaplama için komut satırı girişi.
+# Örnek:
+#   python cli.py olcumler --local Ortalama Medyan --global Ortalama --workers 4
+#   python cli.py kok1 kok2 kok3 --local Maksimum --roots-parallel 3 --output-dir sonuclar
+#   python cli.py olcumler --local Ortalama --global Ortalama --watch --interval 10
+#   python cli.py olcumler --grouped Ortalama Maksimum --group-by yer ay --start-date 01.11.2011 --lazy
+#   python cli.py olcumler --joined Ortalama Maksimum --join-tolerance 60
+
+import argparse
+import datetime
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from measurement_types import MEASUREMENT_TYPES, format_file_counts, resolve_measurement_type
+from strategy_registry import STRATEGY_CLASSES, find_strategy_name, load_strategy
+
+def resolve_strategy_name(name: str) -> str:
+    """Kullanıcının yazdığı strateji adını (büyük/küçük harf ve boşluktan bağımsız) kayıtlı ada çevirir."""
+    try:
+        return find_strategy_name(name)
+    except KeyError:
+        raise argparse.ArgumentTypeError(
+            f"Bilinmeyen hesaplama: '{name}'. Geçerli hesaplamalar: {', '.join(STRATEGY_CLASSES)}"
+        )
+
+def resolve_type_name(name: str) -> str:
+    """Kullanıcının yazdığı ölçüm tipini (diğer yazımları dahil, örn. 'basinc') kayıtlı ada çevirir."""
+    measurement_type = resolve_measurement_type(name)
+    if measurement_type is None:
+        raise argparse.ArgumentTypeError(
+            f"Bilinmeyen ölçüm tipi: '{name}'. Geçerli tipler: {', '.join(MEASUREMENT_TYPES)}"
+        )
+    return measurement_type
+
+def parse_date(text: str) -> datetime.date:
+    """gg.aa.yyyy biçimindeki tarihi çevirir."""
+    try:
+        return datetime.datetime.strptime(text, '%d.%m.%Y').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz tarih: '{text}' (beklenen biçim: gg.aa.yyyy)")
+
+def run_root(root_folder: str, output_folder: str, local_names: List[str], global_names: List[str],
+             workers: int = 1, use_cache: bool = False, verbose: bool = False,
+             report: bool = False, profile: bool = False,
+             stream_threshold_mb: Optional[float] = None, lazy: bool = False,
+             memory_budget_mb: Optional[float] = None, grouped_names: Optional[List[str]] = None,
+             group_by: Optional[List[str]] = None, measurement_filter=None,
+             use_result_cache: bool = False, formats: Tuple[str, ...] = ('txt',),
+             joined_names: Optional[List[str]] = None, join_tolerance: int = 0) -> Tuple[str, bool, List[str]]:
+    """
+    Tek bir ölçüm kök klasörünü okur, hesaplamaları yapar ve sonuçları yazar.
+    stream_threshold_mb verilirse bu boyuttan büyük dosyalar belleğe alınmadan parça parça işlenir.
+    lazy açıksa yalnızca başlıklar taranır; noktalar hesaplama sırasında yüklenir ve bellekte
+    en fazla memory_budget_mb kadar veri tutulur.
+    measurement_filter (MeasurementFilter) verilirse yalnızca uyan dosyalar hesaplanır; grouped_names
+    stratejileri group_by alanlarına göre grup başına hesaplanıp sonuc/gruplu altına yazılır.
+    use_result_cache açıksa lokal sonuçlar sonuc/.cache/sonuclar altında saklanır ve yeniden
+    çalıştırmada yalnızca yeni veya değişen dosyalar (ya da yeni stratejiler) hesaplanır.
+    formats: çıktı biçimleri ('txt', 'csv', 'jsonl'; bkz. OutputWriter).
+    joined_names None değilse aynı yer ve tarihli sıcaklık ve nem dosyaları join_tolerance saniye
+    toleransla eşleştirilir; korelasyon ve türetilmiş büyüklükler (çiy noktası, hissedilen sıcaklık)
+    hesaplanır ve joined_names stratejileri türetilmiş serilere uygulanır.
+    report/profile açıksa performans raporu (JSON) ve cProfile çıktısı sonuc klasörüne yazılır.
+    Dönüş değeri: (kök klasör, başarılı mı, log mesajları)
+    """
+    # Ağır modüller yalnızca gerçekten bir hesaplama yapılacağı zaman yüklenir
+    from data_parser import MeasurementParser
+    from output_writer import OutputWriter
+    from pipeline import CalculationPipeline
+
+    messages: List[str] = []
+    cache = None
+    if use_cache:
+        from parse_cache import ParsedDataCache
+        cache = ParsedDataCache.for_root(root_folder)
+
+    from instrumentation import NULL_INSTRUMENTATION, RunInstrumentation
+    instrumentation = RunInstrumentation(profile=profile) if (report or profile) else NULL_INSTRUMENTATION
+
+    with instrumentation.profiling():
+        stream_threshold_bytes = int(stream_threshold_mb * 1024 * 1024) if stream_threshold_mb is not None else None
+        parser = MeasurementParser(verbose=verbose, cache=cache, instrumentation=instrumentation,
+                                   stream_threshold_bytes=stream_threshold_bytes)
+        if lazy:
+            from measurement_index import DEFAULT_MEMORY_BUDGET_BYTES, MeasurementIndex
+            memory_budget_bytes = (int(memory_budget_mb * 1024 * 1024) if memory_budget_mb is not None
+                                   else DEFAULT_MEMORY_BUDGET_BYTES)
+            index = MeasurementIndex.scan(parser, root_folder, memory_budget_bytes)
+            all_measurements_by_type = index.measurements_by_type()
+        else:
+            all_measurements_by_type = parser.get_all_measurements_in_folder(root_folder, workers=workers)
+    messages.append(format_file_counts(all_measurements_by_type))
+    for failure in parser.parse_failures:
+        messages.append(f"Uyarı: {failure.file_path} ayrıştırılamadı: {failure.reason}")
+
+    if measurement_filter is not None:
+        # Yalnızca başlık alanlarıyla süzülür; indeks modunda eşleşmeyen dosyalar hiç ayrıştırılmaz
+        all_measurements_by_type = {
+            measurement_type: [data for data in measurements if measurement_filter.matches(data)]
+            for measurement_type, measurements in all_measurements_by_type.items()
+        }
+
+    grouped_names = grouped_names or []
+    strategies = {name: load_strategy(name)
+                  for name in dict.fromkeys(local_names + global_names + grouped_names + (joined_names or []))}
+    output_writer = OutputWriter(output_folder, formats=formats)
+    result_cache = None
+    if use_result_cache:
+        from result_cache import ResultCache
+        result_cache = ResultCache.for_root(root_folder)
+    pipeline = CalculationPipeline(output_writer, log=messages.append, instrumentation=instrumentation,
+                                   result_cache=result_cache)
+    with instrumentation.profiling():
+        status_message = ""
+        if local_names or global_names:
+            status_message = pipeline.run(
+                all_measurements_by_type,
+                [strategies[name] for name in local_names],
+                [strategies[name] for name in global_names]
+            )
+        if grouped_names:
+            from grouped_query import GroupedQuery
+            query = GroupedQuery(group_by or [], instrumentation=instrumentation)
+            status_message += pipeline.run_grouped(
+                all_measurements_by_type, [strategies[name] for name in grouped_names], query
+            )
+        if joined_names is not None:
+            status_message += pipeline.run_joined(
+                all_measurements_by_type, [strategies[name] for name in joined_names], join_tolerance
+            )
+    if status_message:
+        messages.append(status_message.rstrip('\n'))
+    if result_cache is not None:
+        result_cache.enforce_size_limit()
+
+    if instrumentation.enabled:
+        messages.append(instrumentation.format_summary())
+        report_path = os.path.join(output_writer.output_root_folder, "performans_raporu.json")
+        instrumentation.write_json(report_path)
+        messages.append(f"Performans raporu kaydedildi: {report_path}")
+        profile_path = os.path.join(output_writer.output_root_folder, "profil.prof")
+        if instrumentation.dump_profile(profile_path):
+            messages.append(f"Profil kaydedildi: {profile_path}")
+    return root_folder, True, messages
+
+def run_watch(roots: List[str], output_folders: List[str], local_names: List[str], global_names: List[str],
+              interval: float, use_cache: bool = False, max_polls: Optional[int] = None,
+              use_result_cache: bool = False, measurement_filter=None) -> int:
+    """
+    Kök klasörleri interval saniyede bir tarar; yalnızca değişen dosyalardan etkilenen sonuçları
+    yeniden hesaplayıp içeriği değişen çıktı dosyalarını yazar. Ctrl+C ile durdurulur.
+    measurement_filter (MeasurementFilter) verilirse yalnızca başlığı filtreye uyan dosyalar hesaplanır.
+    """
+    import time
+    from data_parser import MeasurementParser
+    from output_writer import OutputWriter
+    from watch import IncrementalCalculator
+
+    strategies = {name: load_strategy(name) for name in dict.fromkeys(local_names + global_names)}
+    calculators = []
+    for root_folder, output_folder in zip(roots, output_folders):
+        cache = None
+        if use_cache:
+            from parse_cache import ParsedDataCache
+            cache = ParsedDataCache.for_root(root_folder)
+        result_cache = None
+        if use_result_cache:
+            from result_cache import ResultCache
+            result_cache = ResultCache.for_root(root_folder)
+        calculators.append(IncrementalCalculator(
+            root_folder, OutputWriter(output_folder),
+            [strategies[name] for name in local_names], [strategies[name] for name in global_names],
+            parser=MeasurementParser(verbose=False, cache=cache), result_cache=result_cache,
+            measurement_filter=measurement_filter,
+            log=lambda message, root_folder=root_folder: print(f"[{root_folder}] {message}")
+        ))
+
+    print(f"İzleme başladı ({interval:g} sn aralıkla). Durdurmak için Ctrl+C.")
+    polls = 0
+    try:
+        while True:
+            for calculator in calculators:
+                calculator.poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("İzleme durduruldu.")
+    return 0
+
+def _output_folder_for(root_folder: str, output_dir: Optional[str], root_count: int) -> str:
+    """
+    Sonuçların yazılacağı klasör (altında 'sonuc' oluşturulur). Çıktı klasörü verilmezse
+    arayüzdeki gibi kök klasörün kendisi; birden fazla kök varsa her kök için ayrı alt klasör.
+    """
+    if not output_dir:
+        return root_folder
+    if root_count == 1:
+        return output_dir
+    return os.path.join(output_dir, os.path.basename(os.path.normpath(root_folder)))
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    from group_fields import GROUP_FIELDS
+    arg_parser = argparse.ArgumentParser(
+        description="Ölçüm klasörleri için istatistik hesaplamalarını arayüz olmadan çalıştırır."
+    )
+    arg_parser.add_argument('roots', nargs='+', help="Ölçüm kök klasörleri (altında sıcaklık/, nem/ gibi tip klasörleri bulunan)")
+    arg_parser.add_argument('--local', nargs='*', default=[], type=resolve_strategy_name, metavar='HESAPLAMA',
+                            help="Dosya bazında yapılacak hesaplamalar (örn: Ortalama Medyan 'Standart Sapma')")
+    arg_parser.add_argument('--global', dest='global_', nargs='*', default=[], type=resolve_strategy_name,
+                            metavar='HESAPLAMA', help="Tüm dosyalar birleştirilerek yapılacak hesaplamalar")
+    arg_parser.add_argument('--grouped', nargs='*', default=[], type=resolve_strategy_name, metavar='HESAPLAMA',
+                            help="--group-by alanlarına göre grup başına yapılacak hesaplamalar")
+    arg_parser.add_argument('--group-by', nargs='*', default=[], choices=list(GROUP_FIELDS), metavar='ALAN',
+                            help=f"Gruplama alanları: {', '.join(GROUP_FIELDS)} (boşsa tüm dosyalar tek grup)")
+    arg_parser.add_argument('--joined', nargs='*', default=None, type=resolve_strategy_name, metavar='HESAPLAMA',
+                            help="Sıcaklık ve nemi yer, tarih ve zamana göre eşleştir; korelasyonu ve çiy noktası ile "
+                                 "hissedilen sıcaklık serilerini hesapla (verilen hesaplamalar bu serilere uygulanır)")
+    arg_parser.add_argument('--join-tolerance', type=int, default=0, metavar='SANİYE',
+                            help="--joined için zaman eşleştirme toleransı (0: yalnızca aynı zamanlı ölçümler)")
+    arg_parser.add_argument('--types', nargs='*', default=None, type=resolve_type_name, metavar='TİP',
+                            help=f"Yalnızca bu ölçüm tiplerini hesapla ({', '.join(MEASUREMENT_TYPES)})")
+    arg_parser.add_argument('--locations', nargs='*', default=None, metavar='YER', help="Yalnızca bu yerleri hesapla")
+    arg_parser.add_argument('--start-date', type=parse_date, default=None, help="Bu tarihten (gg.aa.yyyy) itibaren")
+    arg_parser.add_argument('--end-date', type=parse_date, default=None, help="Bu tarihe (gg.aa.yyyy) kadar")
+    arg_parser.add_argument('--workers', type=int, default=1,
+                            help="Her kök klasör için ayrıştırma süreç sayısı (0: işlemci sayısı)")
+    arg_parser.add_argument('--roots-parallel', type=int, default=1,
+                            help="Aynı anda işlenecek kök klasör sayısı")
+    arg_parser.add_argument('--output-dir', default=None,
+                            help="Sonuçların yazılacağı klasör (varsayılan: her kök klasörün kendisi)")
+    arg_parser.add_argument('--cache', action='store_true', help="Ayrıştırma önbelleğini (sonuc/.cache) kullan")
+    arg_parser.add_argument('--formats', nargs='+', default=['txt'], choices=['txt', 'csv', 'jsonl'], metavar='BİÇİM',
+                            help="Çıktı biçimleri: txt (strateji başına metin), csv ve jsonl (dosya başına bir satır)")
+    arg_parser.add_argument('--result-cache', action='store_true',
+                            help="Lokal sonuçları (sonuc/.cache/sonuclar) sakla; yalnızca değişen dosyaları yeniden hesapla")
+    arg_parser.add_argument('--stream-threshold-mb', type=float, default=None,
+                            help="Bu boyuttan (MB) büyük dosyaları belleğe almadan parça parça işle")
+    arg_parser.add_argument('--lazy', action='store_true',
+                            help="Yalnızca başlıkları tara; ölçüm noktalarını hesaplama sırasında yükle")
+    arg_parser.add_argument('--memory-budget-mb', type=float, default=None,
+                            help="--lazy ile bellekte tutulacak yüklenmiş veri üst sınırı (MB, varsayılan 256)")
+    arg_parser.add_argument('--report', action='store_true',
+                            help="Aşama bazında performans raporunu sonuc/performans_raporu.json dosyasına yaz")
+    arg_parser.add_argument('--profile', action='store_true', help="cProfile çıktısını sonuc/profil.prof dosyasına yaz")
+    arg_parser.add_argument('--watch', action='store_true',
+                            help="Klasörü izle; yalnızca değişen dosyalardan etkilenen sonuçları güncelle")
+    arg_parser.add_argument('--interval', type=float, default=5.0, help="--watch için tarama aralığı (saniye)")
+    arg_parser.add_argument('--verbose', action='store_true', help="Ayrıştırıcının DEBUG çıktılarını göster")
+    return arg_parser
+
+# İzleme modunun desteklemediği seçenekler: (argparse hedefi, seçenek adı, varsayılan değer)
+_WATCH_UNSUPPORTED_OPTIONS = (
+    ('workers', '--workers', 1),
+    ('roots_parallel', '--roots-parallel', 1),
+    ('lazy', '--lazy', False),
+    ('stream_threshold_mb', '--stream-threshold-mb', None),
+    ('memory_budget_mb', '--memory-budget-mb', None),
+    ('report', '--report', False),
+    ('profile', '--profile', False),
+)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.watch:
+        # İzleme yalnızca değişen dosyaları tek tek işler; bu seçenekler sessizce yok sayılmaz
+        unsupported = [option for dest, option, default in _WATCH_UNSUPPORTED_OPTIONS if getattr(args, dest) != default]
+        if unsupported:
+            arg_parser.error(f"--watch ile birlikte kullanılamaz: {', '.join(unsupported)}")
+    if not args.local and not args.global_ and not args.grouped and args.joined is None:
+        print("Lütfen en az bir lokal (--local), global (--global), gruplu (--grouped) veya birleşik (--joined) "
+              "hesaplama türü seçin.", file=sys.stderr)
+        return 2
+
+    local_names = list(dict.fromkeys(args.local))
+    global_names = list(dict.fromkeys(args.global_))
+    grouped_names = list(dict.fromkeys(args.grouped))
+    joined_names = list(dict.fromkeys(args.joined)) if args.joined is not None else None
+    measurement_filter = None
+    if args.types is not None or args.locations is not None or args.start_date or args.end_date:
+        from grouped_query import MeasurementFilter
+        measurement_filter = MeasurementFilter(
+            measurement_types=set(args.types) if args.types is not None else None,
+            locations=set(args.locations) if args.locations is not None else None,
+            start_date=args.start_date, end_date=args.end_date
+        )
+    workers = args.workers if args.workers > 0 else None
+    if args.watch:
+        if grouped_names or joined_names is not None:
+            print("İzleme modunda gruplu (--grouped) ve birleşik (--joined) hesaplama desteklenmiyor.", file=sys.stderr)
+            return 2
+        if set(args.formats) != {'txt'}:
+            print("İzleme modunda yalnızca metin (txt) çıktısı desteklenir.", file=sys.stderr)
+            return 2
+        output_folders = [_output_folder_for(root, args.output_dir, len(args.roots)) for root in args.roots]
+        return run_watch(args.roots, output_folders, local_names, global_names, args.interval, args.cache,
+                         use_result_cache=args.result_cache, measurement_filter=measurement_filter)
+    jobs = [
+        (root, _output_folder_for(root, args.output_dir, len(args.roots)), local_names, global_names,
+         workers, args.cache, args.verbose, args.report, args.profile, args.stream_threshold_mb,
+         args.lazy, args.memory_budget_mb, grouped_names, args.group_by, measurement_filter, args.result_cache,
+         tuple(args.formats), joined_names, args.join_tolerance)
+        for root in args.roots
+    ]
+
+    results = []
+    if args.roots_parallel > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.roots_parallel) as executor:
+            futures = [executor.submit(run_root, *job) for job in jobs]
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append((job[0], False, [f"Hata: {e}"]))
+    else:
+        for job in jobs:
+            try:
+                results.append(run_root(*job))
+            except Exception as e:
+                results.append((job[0], False, [f"Hata: {e}"]))
+
+    exit_code = 0
+    for root_folder, succeeded, messages in results:
+        print(f"=== {root_folder} ===")
+        for message in messages:
+            print(message)
+        if not succeeded:
+            exit_code = 1
+    return exit_code
+
+if __name__ == '__main__':
+    sys.exit(main())
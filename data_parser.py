@@ -3,69 +3,263 @@
 import os
 import re
 import datetime
-from typing import List, Optional, Dict
-from measurement import MeasurementData, MeasurementPoint
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Dict, Tuple, Union
+from measurement import MeasurementData, MeasurementPoint, TIME_TYPECODE, VALUE_TYPECODE, seconds_of_day
+from parse_cache import ParsedDataCache
+from binary_format import BINARY_SUFFIX, BinaryFormatError, is_binary_file, load_binary, read_binary_header
+from instrumentation import NULL_INSTRUMENTATION
+from measurement_types import ordered_type_names, resolve_measurement_type
+
+# Paralel okumada her işçiye gönderilen varsayılan dosya sayısı
+DEFAULT_CHUNK_SIZE = 64
+# Akış modunda tek seferde okunan yaklaşık bayt sayısı
+DEFAULT_STREAM_CHUNK_BYTES = 4 * 1024 * 1024
+# Klasör keşfinde içine girilmeyen klasörler (OutputWriter'ın sonuç klasörü); '.' ile başlayanlar da atlanır
+SKIPPED_FOLDER_NAMES = ('sonuc',)
+
+# Hızlı yol için sabit genişlikli zaman tabloları: 'HH:MM:' -> saniye, 'SS,' -> saniye.
+# Anahtarlar ayraçları da içerdiği için bir tablo eşleşmesi satır biçimini de doğrular.
+_HOUR_MINUTE_SECONDS = {f"{h:02d}:{m:02d}:": h * 3600 + m * 60 for h in range(24) for m in range(60)}
+_SECOND_SECONDS = {f"{s:02d},": s for s in range(60)}
+
+class IngestionCancelled(Exception):
+    """Klasör okuması iptal edildiğinde fırlatılır."""
+    pass
+
+class MeasurementParseError(ValueError):
+    """Bir ölçüm dosyası ayrıştırılamadığında fırlatılır."""
+    pass
+
+@dataclass
+class ParseFailure:
+    """Ayrıştırılamayan bir dosyayı ve nedenini temsil eder."""
+    file_path: str
+    reason: str
+
+class MeasurementStream:
+    """
+    Çok büyük bir ölçüm dosyasını belleğe almadan okumak için tutamaç.
+
+    Başlık bilgisi (id, tip, yer, tarih) açılışta okunur; ölçüm noktaları ise
+    iter_batches() ile sabit boyutlu parçalar halinde (zaman, değer) dizileri olarak
+    üretilir. Açık dosya tutmadığı için işçi süreçlere gönderilebilir ve birden fazla
+    kez dolaşılabilir.
+    """
+
+    def __init__(self, file_path: str, header_info: Dict[str, any],
+                 chunk_bytes: int = DEFAULT_STREAM_CHUNK_BYTES, fast_path: bool = True):
+        self.file_path = file_path
+        self.id = header_info['id']
+        self.measurement_type = header_info['measurement_type']
+        self.location = header_info['location']
+        self.date = header_info['date']
+        self.chunk_bytes = chunk_bytes
+        self.fast_path = fast_path
+        self.rejected_count = 0 # Son dolaşımda ayrıştırılamayan satır sayısı
+        self.statistics = None # Metin dosyalarında hazır özet bulunmaz
+
+    def iter_batches(self) -> Iterator[Tuple[array, array]]:
+        """Dosyayı yaklaşık chunk_bytes boyutlu parçalar halinde okuyup (zaman, değer) dizileri üretir."""
+        parser = MeasurementParser(verbose=False, fast_path=self.fast_path)
+        self.rejected_count = 0
+        line_number = 2
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            f.readline() # Başlık satırı
+            while True:
+                lines = f.readlines(self.chunk_bytes)
+                if not lines:
+                    break
+                time_column, value_column, rejected_count = parser._parse_body(lines, line_number)
+                self.rejected_count += rejected_count
+                line_number += len(lines)
+                if len(value_column):
+                    yield time_column, value_column
+
+def _measurement_sort_key(data: MeasurementData) -> Tuple[int, datetime.date, str]:
+    """Ölçümleri id ve tarihe göre sıralamak için anahtar; eşitlikte dosya yolu sırayı belirler."""
+    return (int(data.id), data.date, data.file_path)
+
+def _parse_file_batch(file_jobs: List[Tuple[str, str]], cache: Optional[ParsedDataCache] = None,
+                      stream_threshold_bytes: Optional[int] = None
+                      ) -> Tuple[List[MeasurementData], List[ParseFailure], Dict[str, int]]:
+    """
+    İşçi süreçte bir grup dosyayı ayrıştırır.
+    file_jobs: [(dosya yolu, beklenen ölçüm tipi), ...]
+    Dönüş değeri: (ayrıştırılan veriler, hatalar, {dosya yolu: reddedilen satır sayısı})
+    Sonuçlar ana sürece kopyalanacağı için ikili dosyalar belleğe eşlenmeden okunur.
+    """
+    parser = MeasurementParser(verbose=False, cache=cache, stream_threshold_bytes=stream_threshold_bytes,
+                               memory_map=False)
+    parsed = []
+    failures = []
+    for file_path, expected_type in file_jobs:
+        data, failure = parser._parse_job(file_path, expected_type)
+        if data:
+            parsed.append(data)
+        else:
+            failures.append(failure)
+    return parsed, failures, parser.rejected_lines
 
 class MeasurementParser:
     """Ölçüm dosyalarını okumak ve ayrıştırmak için sınıf."""
 
+    def __init__(self, verbose: bool = True, fast_path: bool = True, cache: Optional[ParsedDataCache] = None,
+                 instrumentation=NULL_INSTRUMENTATION, stream_threshold_bytes: Optional[int] = None,
+                 memory_map: bool = True):
+        self.verbose = verbose # False ise DEBUG/UYARI çıktıları basılmaz
+        self.fast_path = fast_path # False ise her satır strptime ile (yavaş yol) ayrıştırılır
+        self.cache = cache # Verilirse klasör okumasında değişmemiş dosyalar önbellekten yüklenir
+        self.instrumentation = instrumentation # Klasör okuması için süre ve sayaç ölçümleri
+        # Verilirse klasör okumasında bu boyuttan büyük dosyalar belleğe alınmaz, MeasurementStream olarak döner
+        self.stream_threshold_bytes = stream_threshold_bytes
+        self.memory_map = memory_map # İkili (.olc) dosyalar belleğe eşlenerek kopyalamadan okunur
+        self.parse_failures: List[ParseFailure] = [] # Son klasör okumasında ayrıştırılamayan dosyalar
+        self.rejected_lines: Dict[str, int] = {} # Dosya yolu -> ayrıştırılamayan ölçüm satırı sayısı
+        self._last_file_jobs: List[Tuple[str, str]] = []
+        self.discovered_types: List[str] = [] # Son klasör keşfinde bulunan tip klasörleri (kayıt sırasıyla)
+
+    def _log(self, message: str):
+        """verbose açıksa mesajı yazdırır."""
+        if self.verbose:
+            print(message)
+
     def parse_file(self, file_path: str) -> Optional[MeasurementData]:
         """Verilen dosya yolundan ölçüm verilerini ayrıştırır."""
-        print(f"DEBUG: 'parse_file' çağrıldı: {file_path}") # Debug çıktısı
+        self._log(f"DEBUG: 'parse_file' çağrıldı: {file_path}") # Debug çıktısı
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            return self._parse_file_checked(file_path)
+        except MeasurementParseError as e:
+            self._log(f"DEBUG: {e}") # Debug çıktısı
+            return None
+        except Exception as e:
+            self._log(f"HATA: Dosya '{file_path}' okunurken hata oluştu: {e}") # Debug çıktısı
+            return None
 
-            if not lines:
-                print(f"DEBUG: '{file_path}' dosyası boş.") # Debug çıktısı
-                return None
+    def open_stream(self, file_path: str, chunk_bytes: int = DEFAULT_STREAM_CHUNK_BYTES) -> MeasurementStream:
+        """
+        Dosyanın yalnızca başlığını okuyup ölçüm noktalarını parça parça üretecek bir
+        MeasurementStream döndürür. Başlık geçersizse MeasurementParseError fırlatır.
+        """
+        return MeasurementStream(file_path, self.read_header(file_path), chunk_bytes, self.fast_path)
 
-            # İlk satırı başlık bilgisi olarak ayrıştır
-            header_line = lines[0].strip()
-            print(f"DEBUG: Başlık satırı: '{header_line}'") # Debug çıktısı
-            header_info = self._parse_header(header_line)
-            if not header_info:
-                print(f"DEBUG: Başlık bilgisi ayrıştırılamadı: '{header_line}'") # Debug çıktısı
-                return None
-            print(f"DEBUG: Başlık bilgisi: {header_info}") # Debug çıktısı
-
-            # Diğer satırları ölçüm noktaları olarak ayrıştır
-            points = []
-            for i, line in enumerate(lines[1:]):
-                point = self._parse_measurement_point(line.strip())
-                if point:
-                    points.append(point)
-                else:
-                    print(f"DEBUG: Ölçüm noktası ayrıştırılamadı: Satır {i+2}: '{line.strip()}'") # Debug çıktısı
+    def read_header(self, file_path: str) -> Dict[str, any]:
+        """
+        Dosyanın yalnızca ilk satırını okuyup başlık bilgisini (id, tip, yer, tarih) döndürür.
+        İkili dosyalarda alt bilgideki özet de 'statistics' anahtarıyla döner.
+        Dosya boşsa veya başlık geçersizse MeasurementParseError fırlatır.
+        """
+        if is_binary_file(file_path):
+            try:
+                return read_binary_header(file_path)
+            except BinaryFormatError as e:
+                raise MeasurementParseError(str(e)) from e
+        with open(file_path, 'r', encoding='utf-8') as f:
+            header_line = f.readline().strip()
+        if not header_line:
+            raise MeasurementParseError(f"'{file_path}' dosyası boş.")
+        header_info = self._parse_header(header_line)
+        if not header_info:
+            raise MeasurementParseError(f"Başlık bilgisi ayrıştırılamadı: '{header_line}'")
+        return header_info
 
-            if not points:
-                print(f"DEBUG: '{file_path}' dosyasında geçerli ölçüm noktası bulunamadı.") # Debug çıktısı
-                return None
+    def _parse_file_checked(self, file_path: str) -> MeasurementData:
+        """
+        Dosyayı ayrıştırır; dosya kullanılamazsa nedeniyle birlikte
+        MeasurementParseError fırlatır.
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
 
-            return MeasurementData(
-                id=header_info['id'],
-                measurement_type=header_info['measurement_type'],
-                location=header_info['location'],
-                date=header_info['date'],
-                points=points
-            )
-        except Exception as e:
-            print(f"HATA: Dosya '{file_path}' okunurken hata oluştu: {e}") # Debug çıktısı
-            return None
+        if not lines:
+            raise MeasurementParseError(f"'{file_path}' dosyası boş.")
+
+        # İlk satırı başlık bilgisi olarak ayrıştır
+        header_line = lines[0].strip()
+        self._log(f"DEBUG: Başlık satırı: '{header_line}'") # Debug çıktısı
+        header_info = self._parse_header(header_line)
+        if not header_info:
+            raise MeasurementParseError(f"Başlık bilgisi ayrıştırılamadı: '{header_line}'")
+        self._log(f"DEBUG: Başlık bilgisi: {header_info}") # Debug çıktısı
+
+        # Diğer satırları ölçüm noktaları olarak doğrudan zaman ve değer sütunlarına ayrıştır
+        time_column, value_column, rejected_count = self._parse_body(lines[1:])
+        if rejected_count:
+            self.rejected_lines[file_path] = rejected_count
+        data = MeasurementData(
+            id=header_info['id'],
+            measurement_type=header_info['measurement_type'],
+            location=header_info['location'],
+            date=header_info['date'],
+            time_column=time_column,
+            value_column=value_column,
+            file_path=file_path
+        )
+
+        if not len(data):
+            raise MeasurementParseError(f"'{file_path}' dosyasında geçerli ölçüm noktası bulunamadı.")
+
+        return data
+
+    def _parse_body(self, body_lines: List[str], first_line_number: int = 2) -> Tuple[array, array, int]:
+        """
+        Ölçüm satırlarını (HH:MM:SS,değer) zaman ve değer sütunlarına ayrıştırır.
+        first_line_number: body_lines[0] satırının dosyadaki numarası (log mesajları için).
+        Dönüş değeri: (zaman sütunu, değer sütunu, ayrıştırılamayan satır sayısı)
+
+        Önce tüm gövde tek seferde hızlı yoldan ayrıştırılmaya çalışılır: zaman
+        sabit genişlikli tablolardan toplanarak, değerler toplu float() ile çevrilir.
+        Herhangi bir satır bu biçime uymazsa satır satır ayrıştırmaya geçilir ve
+        yalnızca hızlı yola uymayan satırlar strptime kullanan yavaş yoldan geçer.
+        """
+        if self.fast_path:
+            try:
+                time_column = array(TIME_TYPECODE, [
+                    _HOUR_MINUTE_SECONDS[line[:6]] + _SECOND_SECONDS[line[6:9]] for line in body_lines
+                ])
+                value_column = array(VALUE_TYPECODE, map(float, [line[9:] for line in body_lines]))
+                return time_column, value_column, 0
+            except (KeyError, ValueError):
+                pass # Biçime uymayan satır var: satır satır ayrıştır
+
+        time_column = array(TIME_TYPECODE)
+        value_column = array(VALUE_TYPECODE)
+        rejected_count = 0
+        for i, line in enumerate(body_lines):
+            if self.fast_path:
+                try:
+                    seconds = _HOUR_MINUTE_SECONDS[line[:6]] + _SECOND_SECONDS[line[6:9]]
+                    value = float(line[9:])
+                    time_column.append(seconds)
+                    value_column.append(value)
+                    continue
+                except (KeyError, ValueError):
+                    pass # Yavaş yola düş
+            point = self._parse_measurement_point(line.strip())
+            if point:
+                time_column.append(seconds_of_day(point.time))
+                value_column.append(point.value)
+            else:
+                rejected_count += 1
+                self._log(f"DEBUG: Ölçüm noktası ayrıştırılamadı: Satır {i + first_line_number}: '{line.strip()}'") # Debug çıktısı
+        return time_column, value_column, rejected_count
 
     def _parse_header(self, header_line: str) -> Optional[Dict[str, any]]:
         """Başlık satırını ayrıştırır ve bir sözlük döndürür."""
         # Örnek: id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011
-        # Burada 'sıcaklık' ve 'nem' kelimelerindeki Türkçe karakterlerin Regex'te doğru eşleştiğinden emin olmalıyız.
+        # Burada 'sıcaklık' ve 'basınç' gibi kelimelerdeki Türkçe karakterlerin Regex'te doğru eşleştiğinden emin olmalıyız.
         # Python'ın re modülü genellikle UTF-8 ile iyi çalışır, ancak yine de dikkat etmekte fayda var.
         match = re.match(r"id:(\d+) ölçüm: (.+?) - yer: (.+?) - tarih: (\d{2}\.\d{2}\.\d{4})", header_line)
         if match:
             try:
                 date_obj = datetime.datetime.strptime(match.group(4), '%d.%m.%Y').date()
                 # Ölçüm tipi de düzgünce alınmalı
-                measurement_type_str = match.group(2).strip()
-                if measurement_type_str not in ['sıcaklık', 'nem']:
-                    print(f"HATA: Geçersiz ölçüm tipi '{measurement_type_str}' bulundu.")
+                # Kayıtlı tiplerin diğer yazımları (örn. 'basinc') kayıtlı ada çevrilir (bkz. measurement_types)
+                measurement_type_str = resolve_measurement_type(match.group(2))
+                if measurement_type_str is None:
+                    self._log(f"HATA: Geçersiz ölçüm tipi '{match.group(2).strip()}' bulundu.")
                     return None
 
                 return {
@@ -75,9 +269,9 @@ class MeasurementParser:
                     'date': date_obj
                 }
             except ValueError as e:
-                print(f"HATA: Tarih ayrıştırma hatası: {e} in '{header_line}'") # Debug çıktısı
+                self._log(f"HATA: Tarih ayrıştırma hatası: {e} in '{header_line}'") # Debug çıktısı
                 return None
-        print(f"DEBUG: Başlık satırı Regex ile eşleşmedi: '{header_line}'") # Debug çıktısı
+        self._log(f"DEBUG: Başlık satırı Regex ile eşleşmedi: '{header_line}'") # Debug çıktısı
         return None
 
     def _parse_measurement_point(self, line: str) -> Optional[MeasurementPoint]:
@@ -89,55 +283,232 @@ class MeasurementParser:
                 value = float(parts[1].strip())
                 return MeasurementPoint(time=time_obj, value=value)
             except ValueError as e:
-                print(f"HATA: Ölçüm noktası ayrıştırma hatası: {e} in '{line}'") # Debug çıktısı
+                self._log(f"HATA: Ölçüm noktası ayrıştırma hatası: {e} in '{line}'") # Debug çıktısı
                 return None
-        print(f"DEBUG: Ölçüm noktası formatı geçersiz: '{line}'") # Debug çıktısı
+        self._log(f"DEBUG: Ölçüm noktası formatı geçersiz: '{line}'") # Debug çıktısı
         return None
 
-    def get_all_measurements_in_folder(self, root_folder: str) -> Dict[str, List[MeasurementData]]:
-        """
-        Kök klasördeki tüm sıcaklık ve nem ölçüm dosyalarını okur.
-        Dönüş değeri: {'sıcaklık': [MeasurementData, ...], 'nem': [MeasurementData, ...]}
-        """
-        print(f"DEBUG: 'get_all_measurements_in_folder' çağrıldı, kök klasör: {root_folder}") # Debug çıktısı
-        all_measurements = {'sıcaklık': [], 'nem': []}
-
-        temp_folder = os.path.join(root_folder, 'sıcaklık')
-        humidity_folder = os.path.join(root_folder, 'nem')
-
-        if os.path.isdir(temp_folder):
-            print(f"DEBUG: Sıcaklık klasörü bulundu: {temp_folder}") # Debug çıktısı
-            for filename in os.listdir(temp_folder):
-                print(f"DEBUG: Sıcaklık klasöründe dosya: {filename}") # Debug çıktısı
-                if filename.endswith('.txt'):
-                    file_path = os.path.join(temp_folder, filename)
-                    data = self.parse_file(file_path)
-                    if data and data.measurement_type == 'sıcaklık':
-                        all_measurements['sıcaklık'].append(data)
-                        print(f"DEBUG: Sıcaklık dosyası okundu: {filename}")
-                    else:
-                        print(f"UYARI: Sıcaklık klasöründe geçersiz dosya veya tür: {filename}") # Debug çıktısı
-                else:
-                    print(f"UYARI: Sıcaklık klasöründe .txt uzantılı olmayan dosya atlandı: {filename}") # Debug çıktısı
+    def _parse_job(self, file_path: str, expected_type: str
+                   ) -> Tuple[Optional[Union[MeasurementData, MeasurementStream]], Optional[ParseFailure]]:
+        """
+        Tek bir klasör dosyasını ayrıştırır; başarısızsa nedenini ParseFailure olarak döndürür.
+        Metin dosyası stream_threshold_bytes değerinden büyükse yalnızca başlığı okunur (MeasurementStream);
+        ikili dosyalar belleğe eşlendiği için akış moduna gerek duymaz.
+        """
+        try:
+            if (self.stream_threshold_bytes is not None and not is_binary_file(file_path)
+                    and os.path.getsize(file_path) > self.stream_threshold_bytes):
+                data = self.open_stream(file_path)
+            else:
+                data = self.load_or_parse(file_path)
+        except Exception as e:
+            return None, ParseFailure(file_path, str(e))
+        if data.measurement_type != expected_type:
+            return None, ParseFailure(
+                file_path, f"Ölçüm tipi '{data.measurement_type}', '{expected_type}' klasörü ile uyuşmuyor."
+            )
+        return data, None
+
+    def load_or_parse(self, file_path: str) -> MeasurementData:
+        """
+        Dosyayı self.cache ayarlıysa önbellekten yükler, yoksa ayrıştırıp önbelleğe yazar.
+        İkili dosyalar önbellek kullanılmadan doğrudan yüklenir.
+        Dosya kullanılamazsa MeasurementParseError fırlatır.
+        """
+        if is_binary_file(file_path):
+            try:
+                data = load_binary(file_path, self.memory_map)
+            except BinaryFormatError as e:
+                raise MeasurementParseError(str(e)) from e
+            if not len(data):
+                raise MeasurementParseError(f"'{file_path}' dosyasında geçerli ölçüm noktası bulunamadı.")
+            return data
+        cached = self.cache.load(file_path) if self.cache else None
+        if cached is None:
+            data = self._parse_file_checked(file_path)
+            if self.cache:
+                self.cache.store(file_path, data, self.rejected_lines.get(file_path, 0))
+            return data
+        # Önbellekten gelen dosyanın hatalı satırları da ayrıştırılmış gibi raporlanır
+        data, rejected_count = cached
+        if rejected_count:
+            self.rejected_lines[file_path] = rejected_count
+        return data
+
+    def _collect_file_jobs(self, root_folder: str,
+                           suffixes: Tuple[str, ...] = ('.txt', BINARY_SUFFIX)) -> List[Tuple[str, str]]:
+        """
+        Kök klasör altındaki tüm ölçüm tipi klasörlerinden okunacak .txt ve ikili (.olc) dosyaları toplar.
+        Dönüş değeri: [(dosya yolu, ölçüm tipi), ...]; bulunan tipler self.discovered_types listesine yazılır.
+        """
+        return [(entry.path, measurement_type)
+                for entry, measurement_type in self._discover_files(root_folder, suffixes)]
+
+    def _discover_files(self, root_folder: str,
+                        suffixes: Tuple[str, ...] = ('.txt', BINARY_SUFFIX)) -> List[Tuple[os.DirEntry, str]]:
+        """
+        Kök klasörü tek bir özyinelemeli os.scandir geçişiyle dolaşır. Adı kayıtlı bir ölçüm tipi olan
+        (bkz. measurement_types) her klasör bir tip klasörüdür; bir dosyanın tipi onu içeren en yakın tip
+        klasörüdür. Böylece sıcaklık/YER/2024/... ve YER/2024/basınç/... düzenleri birlikte desteklenir
+        ve tip sayısı arttıkça klasör ağacı yeniden dolaşılmaz.
+
+        Dosya ve klasör ayrımı dizin girdisinden okunur (ek stat çağrısı yapılmaz); yalnızca aynı
+        klasörde aynı adlı .txt ve .olc dosyaları birlikte varsa değiştirilme zamanları için girdi
+        başına bir kez stat yapılır ve daha yeni olanı (eşitse ikili olanı) okunur.
+        Tip klasörü dışındaki dosyalar, '.' ile başlayan klasörler, SKIPPED_FOLDER_NAMES ve
+        klasör bağlantıları (os.walk'taki gibi) atlanır.
+        """
+        discovered = []
+        found_types = set()
+        stack = [(root_folder, None)] # (klasör, içinde bulunduğu tip klasörünün tipi)
+        while stack:
+            folder, measurement_type = stack.pop()
+            try:
+                with os.scandir(folder) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError as e:
+                self._log(f"UYARI: Klasör okunamadı: {folder}: {e}") # Debug çıktısı
+                continue
+            selected = {} # Uzantısız ad -> dizin girdisi
+            subfolders = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith('.') or entry.name in SKIPPED_FOLDER_NAMES:
+                        continue
+                    folder_type = resolve_measurement_type(entry.name)
+                    if folder_type:
+                        found_types.add(folder_type)
+                        self._log(f"DEBUG: {folder_type.capitalize()} klasörü bulundu: {entry.path}") # Debug çıktısı
+                    subfolders.append((entry.path, folder_type or measurement_type))
+                elif measurement_type is not None and entry.is_file():
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix not in suffixes:
+                        self._log(f"UYARI: {measurement_type.capitalize()} klasöründe desteklenmeyen dosya atlandı: {entry.path}") # Debug çıktısı
+                        continue
+                    previous = selected.get(stem)
+                    if previous is None or self._is_preferred(entry, previous):
+                        selected[stem] = entry
+            discovered.extend((entry, measurement_type) for entry in sorted(selected.values(), key=lambda entry: entry.name))
+            stack.extend(reversed(subfolders)) # Alt klasörler ad sırasıyla dolaşılır
+
+        self.discovered_types = ordered_type_names(found_types)
+        if not found_types:
+            self._log(f"UYARI: Ölçüm tipi klasörü bulunamadı: {root_folder}") # Debug çıktısı
+        return discovered
+
+    @staticmethod
+    def _is_preferred(candidate: os.DirEntry, previous: os.DirEntry) -> bool:
+        """Aynı adlı iki dosyadan (.txt ve .olc) hangisinin okunacağı: daha yeni olan, eşitse ikili olan."""
+        candidate_mtime = candidate.stat().st_mtime_ns
+        previous_mtime = previous.stat().st_mtime_ns
+        if candidate_mtime != previous_mtime:
+            return candidate_mtime > previous_mtime
+        return is_binary_file(candidate.path)
+
+    def get_all_measurements_in_folder(self, root_folder: str, workers: Optional[int] = 1,
+                                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                       progress: Optional[Callable[[int, int], None]] = None,
+                                       is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, List[MeasurementData]]:
+        """
+        Kök klasör altındaki tüm tip klasörlerinde (bkz. _discover_files) bulunan ölçüm dosyalarını okur.
+        Dönüş değeri: {'sıcaklık': [MeasurementData, ...], 'nem': [MeasurementData, ...], ...}
+        Anahtarlar bulunan tip klasörleridir (kayıt sırasıyla); dosyası olmayan tip klasörü boş liste döner.
+
+        Args:
+            root_folder: Ölçüm kök klasörü.
+            workers: Paralel okuma için süreç sayısı. 1 ise tek çekirdekte okunur,
+                     None ise işlemci sayısı kadar süreç kullanılır.
+            chunk_size: Her işçiye tek seferde gönderilen dosya sayısı.
+            progress: Verilirse (okunan dosya, toplam dosya) ile çağrılır.
+            is_cancelled: Verilirse dosyalar (paralel modda gruplar) arasında kontrol edilir;
+                          True dönerse IngestionCancelled fırlatılır.
+
+        self.cache ayarlıysa yalnızca yeni veya değişmiş dosyalar ayrıştırılır.
+        self.stream_threshold_bytes ayarlıysa daha büyük dosyalar listede MeasurementStream olarak yer alır.
+
+        Listeler işçilerin bitirme sırasından bağımsız olarak id ve tarihe göre sıralıdır.
+        Ayrıştırılamayan dosyalar self.parse_failures listesinde toplanır ve sonda raporlanır.
+        """
+        self._log(f"DEBUG: 'get_all_measurements_in_folder' çağrıldı, kök klasör: {root_folder}") # Debug çıktısı
+        with self.instrumentation.stage('ayrıştırma'):
+            all_measurements = self._read_folder(root_folder, workers, chunk_size, progress, is_cancelled)
 
+        if self.instrumentation.enabled:
+            self._record_folder_statistics(all_measurements)
+
+        if self.parse_failures:
+            self._log(f"UYARI: {len(self.parse_failures)} dosya ayrıştırılamadı:")
+            for failure in self.parse_failures:
+                self._log(f"  - {failure.file_path}: {failure.reason}")
+
+        return all_measurements
+
+    def _record_folder_statistics(self, all_measurements: Dict[str, List[MeasurementData]]):
+        """Son klasör okumasının sayaçlarını ölçüm nesnesine ekler."""
+        instrumentation = self.instrumentation
+        measurements = [data for measurement_list in all_measurements.values() for data in measurement_list]
+        instrumentation.count('files', len(measurements) + len(self.parse_failures))
+        instrumentation.count('points', sum(len(data) for data in measurements if isinstance(data, MeasurementData)))
+        instrumentation.count('bytes_read', sum(os.path.getsize(path) for path, _ in self._last_file_jobs))
+        for failure in self.parse_failures:
+            instrumentation.record_failure(failure.file_path, failure.reason)
+        for file_path, line_count in self.rejected_lines.items():
+            instrumentation.record_rejected_lines(file_path, line_count)
+
+    def _read_folder(self, root_folder: str, workers: Optional[int], chunk_size: int,
+                     progress: Optional[Callable[[int, int], None]],
+                     is_cancelled: Optional[Callable[[], bool]]) -> Dict[str, List[MeasurementData]]:
+        """get_all_measurements_in_folder için asıl okuma işi."""
+        self.parse_failures = []
+        self.rejected_lines = {}
+
+        # Tüm tiplerin dosyaları tek listede toplanır ve aynı işçi havuzunda birlikte ayrıştırılır;
+        # her tip için ayrı bir okuma geçişi yapılmaz
+        file_jobs = self._last_file_jobs = self._collect_file_jobs(root_folder)
+        all_measurements = {measurement_type: [] for measurement_type in self.discovered_types}
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        total_files = len(file_jobs)
+        processed_files = 0
+        if progress:
+            progress(processed_files, total_files)
+
+        if workers > 1 and len(file_jobs) > chunk_size:
+            chunks = [file_jobs[i:i + chunk_size] for i in range(0, len(file_jobs), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_parse_file_batch, chunk, self.cache, self.stream_threshold_bytes)
+                           for chunk in chunks]
+                for future in as_completed(futures):
+                    if is_cancelled and is_cancelled():
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        raise IngestionCancelled("Klasör okuması iptal edildi.")
+                    parsed, failures, rejected_lines = future.result()
+                    for data in parsed:
+                        all_measurements[data.measurement_type].append(data)
+                    self.parse_failures.extend(failures)
+                    self.rejected_lines.update(rejected_lines)
+                    processed_files += len(parsed) + len(failures)
+                    if progress:
+                        progress(processed_files, total_files)
         else:
-            print(f"UYARI: Sıcaklık klasörü bulunamadı: {temp_folder}") # Debug çıktısı
-
-        if os.path.isdir(humidity_folder):
-            print(f"DEBUG: Nem klasörü bulundu: {humidity_folder}") # Debug çıktısı
-            for filename in os.listdir(humidity_folder):
-                print(f"DEBUG: Nem klasöründe dosya: {filename}") # Debug çıktısı
-                if filename.endswith('.txt'):
-                    file_path = os.path.join(humidity_folder, filename)
-                    data = self.parse_file(file_path)
-                    if data and data.measurement_type == 'nem':
-                        all_measurements['nem'].append(data)
-                        print(f"DEBUG: Nem dosyası okundu: {filename}")
-                    else:
-                        print(f"UYARI: Nem klasöründe geçersiz dosya veya tür: {filename}") # Debug çıktısı
+            for file_path, measurement_type in file_jobs:
+                if is_cancelled and is_cancelled():
+                    raise IngestionCancelled("Klasör okuması iptal edildi.")
+                data, failure = self._parse_job(file_path, measurement_type)
+                if data:
+                    all_measurements[measurement_type].append(data)
+                    self._log(f"DEBUG: {measurement_type.capitalize()} dosyası okundu: {os.path.basename(file_path)}")
                 else:
-                    print(f"UYARI: Nem klasöründe .txt uzantılı olmayan dosya atlandı: {filename}") # Debug çıktısı
-        else:
-            print(f"UYARI: Nem klasörü bulunamadı: {humidity_folder}") # Debug çıktısı
+                    self.parse_failures.append(failure)
+                processed_files += 1
+                if progress:
+                    progress(processed_files, total_files)
+
+        if self.cache:
+            self.cache.enforce_size_limit()
 
+        for measurements in all_measurements.values():
+            measurements.sort(key=_measurement_sort_key)
+        self.parse_failures.sort(key=lambda failure: failure.file_path)
         return all_measurements
\ No newline at end of file
@@ -0,0 +1,227 @@
+# decimation.py
+#
+# Çok büyük ölçüm serilerini ekrana çizilebilecek kadar noktaya indirger (arayüzden bağımsız).
+# İki yöntem vardır: piksel başına min/maks (tepe değerler hiç kaybolmaz) ve
+# Largest-Triangle-Three-Buckets (LTTB, serinin görsel şeklini daha az noktayla korur).
+
+import datetime
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+from calculation_strategies import SeriesSummary
+from measurement import VALUE_TYPECODE
+
+DECIMATION_METHODS = ('minmax', 'lttb')
+# Her önbellek karosu bu kadar kova (yaklaşık piksel) içerir
+DEFAULT_TILE_BUCKETS = 256
+DEFAULT_MAX_CACHED_TILES = 4096
+# En ince yakınlaştırma seviyesinde bir kovanın genişliği (saniye)
+_BASE_BUCKET_SECONDS = 1.0
+_SECONDS_PER_DAY = 86400
+# LTTB karosu bundan fazla nokta içeriyorsa önce kova başına bu kadar kat ince min/maks indirgemesi yapılır
+_LTTB_PREREDUCE_FACTOR = 8
+
+def absolute_seconds(date: datetime.date, seconds_of_day: int) -> int:
+    """Tarih ve gün içi saniyeyi tek eksende (proleptik Gregoryen gün sırası * 86400 + saniye) birleştirir."""
+    return date.toordinal() * _SECONDS_PER_DAY + seconds_of_day
+
+def format_axis_time(x: float, with_date: bool = True) -> str:
+    """absolute_seconds eksenindeki değeri 'gg.aa ss:dd' (veya yalnızca saat) olarak yazar."""
+    x = int(x)
+    date = datetime.date.fromordinal(max(1, x // _SECONDS_PER_DAY))
+    seconds = x % _SECONDS_PER_DAY
+    clock = f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}"
+    return f"{date.strftime('%d.%m')} {clock}" if with_date else clock
+
+class PlotSeries:
+    """
+    Çizilecek tek bir seri: zamana göre sıralı x (absolute_seconds) ve y sütunları.
+    Birden fazla dosya verilirse tarih sırasıyla tek seride birleştirilir.
+    """
+
+    def __init__(self, label: str, measurements: Sequence):
+        self.label = label
+        self.x = array('q')
+        self.y = array(VALUE_TYPECODE)
+        overlapping = False # Aynı güne ait birden fazla dosya varsa dosyalar birbirine karışabilir
+        for data in sorted(measurements, key=lambda data: data.date):
+            values = data.values # İndeksten gelen dosyalar burada yüklenir
+            times = data.time_column
+            order = SeriesSummary(values, times).time_order
+            if order is not None:
+                times = [times[i] for i in order]
+                values = [values[i] for i in order]
+            offset = absolute_seconds(data.date, 0)
+            if len(self.x) and len(times) and offset + times[0] < self.x[-1]:
+                overlapping = True
+            self.x.extend(map(offset.__add__, times))
+            self.y.extend(values)
+        if overlapping:
+            order = sorted(range(len(self.x)), key=self.x.__getitem__)
+            self.x = array('q', (self.x[i] for i in order))
+            self.y = array(VALUE_TYPECODE, (self.y[i] for i in order))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def index_range(self, x0: float, x1: float) -> Tuple[int, int]:
+        """[x0, x1) aralığındaki noktaların indeks aralığı (ikili arama)."""
+        return bisect_left(self.x, x0), bisect_left(self.x, x1)
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """(x min, x max, y min, y max); seri boşsa None."""
+        if not len(self.x):
+            return None
+        return self.x[0], self.x[-1], min(self.y), max(self.y)
+
+def min_max_buckets(x: Sequence[int], y: Sequence[float], edges: Sequence[int]) -> Tuple[array, array]:
+    """
+    Ardışık kenar indeksleri arasındaki her kovadan en küçük ve en büyük noktayı zaman sırasıyla alır.
+    edges[i]..edges[i + 1] i. kovanın indeks aralığıdır; boş kovalar atlanır.
+    """
+    xs = array('q')
+    ys = array(VALUE_TYPECODE)
+    for start, end in zip(edges, edges[1:]):
+        if start >= end:
+            continue
+        if end - start <= 2:
+            xs.extend(x[start:end])
+            ys.extend(y[start:end])
+            continue
+        chunk = y[start:end]
+        low, high = min(chunk), max(chunk)
+        low_at, high_at = chunk.index(low), chunk.index(high)
+        first, second = sorted((low_at, high_at))
+        xs.append(x[start + first])
+        ys.append(chunk[first])
+        if second != first:
+            xs.append(x[start + second])
+            ys.append(chunk[second])
+    return xs, ys
+
+def lttb(x: Sequence[int], y: Sequence[float], threshold: int) -> Tuple[array, array]:
+    """
+    Largest-Triangle-Three-Buckets (Steinarsson, 2013): ilk ve son nokta korunur, aradaki
+    noktalar threshold - 2 kovaya bölünür ve her kovadan bir önceki seçilen nokta ile sonraki
+    kovanın ortalamasıyla en büyük üçgeni oluşturan nokta seçilir. O(n).
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return array('q', x), array(VALUE_TYPECODE, y)
+    xs = array('q', [x[0]])
+    ys = array(VALUE_TYPECODE, [y[0]])
+    bucket_size = (n - 2) / (threshold - 2)
+    selected = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        # Sonraki kovanın ortalama noktası (son kova için son nokta)
+        if end < next_end:
+            avg_x = sum(x[end:next_end]) / (next_end - end)
+            avg_y = sum(y[end:next_end]) / (next_end - end)
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        ax, ay = x[selected], y[selected]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        xs.append(x[best])
+        ys.append(y[best])
+        selected = best
+    xs.append(x[n - 1])
+    ys.append(y[n - 1])
+    return xs, ys
+
+class SeriesDecimator:
+    """
+    Görünen aralık için indirgenmiş noktaları üretir ve yakınlaştırma seviyesine göre önbellekler.
+
+    Yakınlaştırma seviyesi L'de bir kova 2^L saniyedir ve kovalar sıfırdan başlayan sabit bir
+    ızgaraya oturur; ardışık tile_buckets kova bir karo oluşturur. Görünen aralık yalnızca
+    kesiştiği karoların birleşimidir: kaydırmada yalnızca yeni giren karolar, yakınlaştırmada
+    yalnızca görünen aralığın yeni seviyedeki karoları hesaplanır. Karolar (seviye, karo no)
+    anahtarıyla LRU önbellekte tutulur. Aralıkta piksel sayısının iki katından az nokta varsa
+    indirgeme yapılmaz.
+    """
+
+    def __init__(self, series: PlotSeries, method: str = 'minmax', tile_buckets: int = DEFAULT_TILE_BUCKETS,
+                 max_cached_tiles: int = DEFAULT_MAX_CACHED_TILES):
+        if method not in DECIMATION_METHODS:
+            raise ValueError(f"Bilinmeyen indirgeme yöntemi: '{method}'. Geçerli yöntemler: {', '.join(DECIMATION_METHODS)}")
+        self.series = series
+        self.method = method
+        self.tile_buckets = tile_buckets
+        self.max_cached_tiles = max_cached_tiles
+        self.tiles_computed = 0
+        self._tiles: 'OrderedDict[Tuple[int, int], Tuple[array, array]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def level_for(self, x0: float, x1: float, pixels: int) -> int:
+        """Bir kovanın yaklaşık bir piksele denk geldiği yakınlaştırma seviyesi."""
+        seconds_per_pixel = max((x1 - x0) / max(pixels, 1), _BASE_BUCKET_SECONDS)
+        return max(0, math.ceil(math.log2(seconds_per_pixel / _BASE_BUCKET_SECONDS)))
+
+    def decimate(self, x0: float, x1: float, pixels: int) -> Tuple[array, array]:
+        """[x0, x1) aralığını pixels genişliğinde çizmek için noktalar (aralığın hemen dışındaki komşular dahil)."""
+        series = self.series
+        start, end = series.index_range(x0, x1)
+        # Çizginin kenarlarda kesilmemesi için aralığın iki yanındaki birer nokta da alınır
+        start, end = max(0, start - 1), min(len(series), end + 1)
+        if end - start <= 2 * pixels:
+            return series.x[start:end], series.y[start:end]
+
+        level = self.level_for(x0, x1, pixels)
+        tile_seconds = self.tile_buckets * _BASE_BUCKET_SECONDS * (1 << level)
+        first_tile = math.floor(series.x[start] / tile_seconds)
+        last_tile = math.floor(series.x[end - 1] / tile_seconds)
+        xs = array('q')
+        ys = array(VALUE_TYPECODE)
+        for tile in range(first_tile, last_tile + 1):
+            tile_x, tile_y = self._tile(level, tile, tile_seconds)
+            xs.extend(tile_x)
+            ys.extend(tile_y)
+        return xs, ys
+
+    def _tile(self, level: int, tile: int, tile_seconds: float) -> Tuple[array, array]:
+        key = (level, tile)
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return self._tiles[key]
+
+        series = self.series
+        tile_start = tile * tile_seconds
+        if self.method == 'minmax':
+            result = self._min_max_tile(tile_start, tile_seconds, self.tile_buckets)
+        else:
+            start, end = series.index_range(tile_start, tile_start + tile_seconds)
+            if end - start > _LTTB_PREREDUCE_FACTOR * 2 * self.tile_buckets:
+                # Kaba seviyelerde LTTB, tepe noktalarını koruyan daha ince bir min/maks indirgemesi üzerinde
+                # çalışır; böylece karo maliyeti nokta sayısından bağımsız kalır
+                tile_x, tile_y = self._min_max_tile(tile_start, tile_seconds, _LTTB_PREREDUCE_FACTOR * self.tile_buckets)
+            else:
+                tile_x, tile_y = series.x[start:end], series.y[start:end]
+            result = lttb(tile_x, tile_y, self.tile_buckets)
+
+        with self._lock:
+            self.tiles_computed += 1
+            self._tiles[key] = result
+            while len(self._tiles) > self.max_cached_tiles:
+                self._tiles.popitem(last=False)
+        return result
+
+    def _min_max_tile(self, tile_start: float, tile_seconds: float, buckets: int) -> Tuple[array, array]:
+        series = self.series
+        bucket_seconds = tile_seconds / buckets
+        edges = [bisect_left(series.x, tile_start + i * bucket_seconds) for i in range(buckets + 1)]
+        return min_max_buckets(series.x, series.y, edges)
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
@@ -0,0 +1,15 @@
+# group_fields.py
+#
+# Gruplu sorguların gruplama alanları. Bağımlılığı yoktur; komut satırı bu modülü
+# argüman ayrıştırıcıyı kurarken strateji ve ayrıştırıcı modüllerini yüklemeden kullanır.
+
+from typing import Callable, Dict, Tuple
+
+# Gruplama alanı -> (dosyadan sıralanabilir grup anahtarı, anahtarın etiketi)
+GROUP_FIELDS: Dict[str, Tuple[Callable[[object], object], Callable[[object], str]]] = {
+    'tip': (lambda data: data.measurement_type, str),
+    'yer': (lambda data: data.location, str),
+    'gün': (lambda data: data.date, lambda date: date.strftime('%d.%m.%Y')),
+    'hafta': (lambda data: tuple(data.date.isocalendar())[:2], lambda week: f"{week[0]}-H{week[1]:02d}"),
+    'ay': (lambda data: (data.date.year, data.date.month), lambda month: f"{month[1]:02d}.{month[0]}"),
+}
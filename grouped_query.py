@@ -0,0 +1,207 @@
+# grouped_query.py
+
+import datetime
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from calculation_strategies import FusedCalculationEngine, ICalculationStrategy, SeriesSummary
+from data_parser import MeasurementParseError, MeasurementStream
+from group_fields import GROUP_FIELDS
+from instrumentation import NULL_INSTRUMENTATION
+from measurement import VALUE_TYPECODE, ColumnStatistics
+
+def validate_group_by(group_by: Sequence[str]) -> List[str]:
+    """Gruplama alanlarını doğrular; bilinmeyen bir alan varsa ValueError fırlatır."""
+    unknown = [name for name in group_by if name not in GROUP_FIELDS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen gruplama alanı: {', '.join(unknown)}. Geçerli alanlar: {', '.join(GROUP_FIELDS)}")
+    return list(dict.fromkeys(group_by))
+
+def group_key(data, group_by: Sequence[str]) -> tuple:
+    """Ölçüm dosyasının grup anahtarı (yalnızca başlık alanları kullanılır)."""
+    return tuple(GROUP_FIELDS[name][0](data) for name in group_by)
+
+def format_group_label(group_by: Sequence[str], key: tuple) -> str:
+    """Sonuç dosyalarında kullanılan grup başlığı. Örn: 'tip: sıcaklık - yer: YER - ay: 11.2011'"""
+    if not group_by:
+        return "tümü"
+    return " - ".join(f"{name}: {GROUP_FIELDS[name][1](value)}" for name, value in zip(group_by, key))
+
+@dataclass
+class MeasurementFilter:
+    """
+    Dosyaları başlık alanlarına göre süzer. None olan koşul uygulanmaz.
+    Tarih aralığı iki uçta da kapalıdır.
+    """
+    measurement_types: Optional[Set[str]] = None
+    locations: Optional[Set[str]] = None
+    start_date: Optional[datetime.date] = None
+    end_date: Optional[datetime.date] = None
+
+    def matches(self, data) -> bool:
+        if self.measurement_types is not None and data.measurement_type not in self.measurement_types:
+            return False
+        if self.locations is not None and data.location not in self.locations:
+            return False
+        if self.start_date is not None and data.date < self.start_date:
+            return False
+        if self.end_date is not None and data.date > self.end_date:
+            return False
+        return True
+
+class SegmentedValues:
+    """
+    Grupların değerlerini tek bir bitişik float64 tamponda tutar.
+    i. grubun değerleri values[offsets[i]:offsets[i + 1]] aralığındadır.
+    """
+
+    def __init__(self):
+        self.keys: List[tuple] = []
+        self.offsets = array('q', [0])
+        self.values = array(VALUE_TYPECODE)
+        self.file_counts: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def segment(self, i: int) -> memoryview:
+        """i. grubun değerlerini kopyalamadan döndürür."""
+        return memoryview(self.values)[self.offsets[i]:self.offsets[i + 1]].toreadonly()
+
+    def append(self, key: tuple, values: Sequence[float]):
+        """Bir dosyanın değerlerini key grubuna ekler; gruplar sırayla eklenmelidir."""
+        if not self.keys or self.keys[-1] != key:
+            if self.keys:
+                self.offsets.append(len(self.values))
+            self.keys.append(key)
+            self.file_counts.append(0)
+        self.values.extend(values)
+        self.file_counts[-1] += 1
+
+    def statistics(self) -> List[ColumnStatistics]:
+        """
+        Tamponun ofsetler boyunca tek taramasında her segmentin adet, toplam, min ve max değerleri.
+        Toplamlar calculate() ile aynı sırada toplanır; M2 istenirse squared_deviation_sum ile eklenir.
+        """
+        view = memoryview(self.values)
+        offsets = self.offsets
+        statistics = []
+        for i in range(len(self.keys)):
+            segment = view[offsets[i]:offsets[i + 1]]
+            if len(segment):
+                statistics.append(ColumnStatistics(len(segment), sum(segment), min(segment), max(segment)))
+            else:
+                statistics.append(ColumnStatistics(0, 0.0, 0.0, 0.0))
+        return statistics
+
+    def squared_deviation_sum(self, i: int, statistics: ColumnStatistics) -> float:
+        """i. segmentin ortalamadan sapmalarının kareleri toplamı (iki geçişli M2, calculate() ile aynı)."""
+        mean = statistics.total / statistics.count
+        return sum((x - mean) ** 2 for x in self.segment(i))
+
+class GroupedQuery:
+    """
+    Ölçüm dosyalarını süzüp başlık alanlarına göre gruplar ve seçili stratejileri grup başına bir kez hesaplar.
+
+    Süzme ve gruplama yalnızca başlık alanlarıyla yapılır; bu yüzden indeksten gelen
+    (LazyMeasurementData) dosyalardan eşleşmeyenler hiç ayrıştırılmaz. Eşleşen dosyaların
+    değerleri grup sırasıyla tek bir tampona eklenir ve her grup bu tampondaki bitişik
+    bir dilim (segment) üzerinden, birleşik hesaplama motoruyla indirgenir.
+    """
+
+    def __init__(self, group_by: Sequence[str], measurement_filter: Optional[MeasurementFilter] = None,
+                 instrumentation=NULL_INSTRUMENTATION):
+        self.group_by = validate_group_by(group_by)
+        self.measurement_filter = measurement_filter or MeasurementFilter()
+        self.instrumentation = instrumentation
+
+    def select(self, all_measurements_by_type: Dict[str, list]) -> List[Tuple[tuple, object]]:
+        """Filtreye uyan dosyaları (grup anahtarı, dosya) çiftleri olarak grup sırasına göre döndürür."""
+        selected = [
+            (group_key(data, self.group_by), data)
+            for measurements in all_measurements_by_type.values()
+            for data in measurements
+            if self.measurement_filter.matches(data)
+        ]
+        selected.sort(key=lambda item: item[0]) # Kararlı sıralama: grup içinde dosya sırası korunur
+        return selected
+
+    def build_segments(self, selected: Iterable[Tuple[tuple, object]],
+                       log: Callable[[str], None] = print,
+                       is_cancelled: Optional[Callable[[], bool]] = None) -> SegmentedValues:
+        """
+        Seçili dosyaların değerlerini grup sırasıyla tek tampona ekler. Ayrıştırılamayan dosyalar
+        (akışta yarıda kalanlar dahil) hiç eklenmez; hiçbir dosyası okunamayan grup oluşmaz.
+        """
+        segments = SegmentedValues()
+        with self.instrumentation.stage('gruplama'):
+            for key, data in selected:
+                if is_cancelled and is_cancelled():
+                    break
+                try:
+                    if isinstance(data, MeasurementStream):
+                        values = array(VALUE_TYPECODE)
+                        for _, value_column in data.iter_batches():
+                            values.extend(value_column)
+                    else:
+                        values = data.value_column
+                except MeasurementParseError as e:
+                    log(f"Uyarı ({data.measurement_type} - {data.id}): Dosya ayrıştırılamadı: {e}")
+                    continue
+                segments.append(key, values)
+            if segments.keys:
+                segments.offsets.append(len(segments.values))
+        return segments
+
+    def reduce(self, segments: SegmentedValues, strategies: List[ICalculationStrategy]
+               ) -> Dict[tuple, Tuple[Dict[str, object], Dict[str, Exception]]]:
+        """
+        Her segment için seçili stratejileri hesaplar. Dönüş: {grup anahtarı: (sonuçlar, hatalar)}
+
+        Segmentlerin adet, toplam, min ve max değerleri tamponun tek taramasında bulunur; bu özetten
+        hesaplanabilen stratejiler (partial_from_statistics, örn. ortalama, min, max) segment başına
+        SeriesSummary oluşturulmadan sonuçlanır. M2 yalnızca bir strateji isterse (standart sapma)
+        segment için bir kez eklenir. Sıra istatistiği veya sayım gerektiren stratejiler (medyan,
+        frekans) birleşik hesaplama motoruyla segment üzerinde hesaplanır.
+        """
+        grouped_results = {}
+        with self.instrumentation.stage('hesaplama'):
+            all_statistics = segments.statistics()
+            for i, key in enumerate(segments.keys):
+                grouped_results[key] = self._reduce_segment(segments, i, all_statistics[i], strategies)
+        return grouped_results
+
+    def _reduce_segment(self, segments: SegmentedValues, i: int, statistics: ColumnStatistics,
+                        strategies: List[ICalculationStrategy]
+                        ) -> Tuple[Dict[str, object], Dict[str, Exception]]:
+        results = {}
+        errors = {}
+        remaining = []
+        for strategy in strategies:
+            partial = strategy.partial_from_statistics(statistics)
+            if partial is None and statistics.count and statistics.squared_deviation_sum is None:
+                statistics.squared_deviation_sum = segments.squared_deviation_sum(i, statistics)
+                partial = strategy.partial_from_statistics(statistics)
+            if partial is None:
+                remaining.append(strategy)
+                continue
+            try:
+                results[strategy.name] = strategy.calculate_from_partial(partial)
+            except ValueError as e:
+                errors[strategy.name] = e
+        if remaining:
+            remaining_results, remaining_errors = FusedCalculationEngine(
+                remaining, self.instrumentation).calculate_summary(SeriesSummary(segments.segment(i)))
+            results.update(remaining_results)
+            errors.update(remaining_errors)
+        # Sonuçlar stratejilerin seçim sırasıyla döner
+        return ({strategy.name: results[strategy.name] for strategy in strategies if strategy.name in results},
+                errors)
+
+    def run(self, all_measurements_by_type: Dict[str, list], strategies: List[ICalculationStrategy],
+            log: Callable[[str], None] = print,
+            is_cancelled: Optional[Callable[[], bool]] = None
+            ) -> Dict[tuple, Tuple[Dict[str, object], Dict[str, Exception]]]:
+        """Süzme, gruplama ve hesaplamayı sırayla yapar."""
+        segments = self.build_segments(self.select(all_measurements_by_type), log, is_cancelled)
+        return self.reduce(segments, strategies)
@@ -0,0 +1,203 @@
+# gui_workers.py
+
+import threading
+from typing import Dict, List, Tuple
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+
+from calculation_strategies import ICalculationStrategy
+from data_parser import MeasurementParser, IngestionCancelled
+from decimation import PlotSeries
+from instrumentation import NULL_INSTRUMENTATION
+from measurement import MeasurementData
+from measurement_index import DEFAULT_MEMORY_BUDGET_BYTES, MeasurementIndex
+from output_writer import OutputWriter
+from pipeline import CalculationPipeline, CalculationCancelled
+from query_client import QueryClient, calculate_remote
+from watch import DEFAULT_POLL_INTERVAL, IncrementalCalculator
+
+# Mesajlar arayüze bu kadar mesaj birikince veya bu kadar süre geçince toplu gönderilir
+MESSAGE_BATCH_SIZE = 200
+MESSAGE_BATCH_INTERVAL = 0.1 # saniye
+
+class BackgroundWorker(QThread):
+    """
+    Uzun süren işleri arayüz iş parçacığının dışında çalıştıran temel sınıf.
+    Mesajları toplu halde, ilerlemeyi ve sonucu sinyallerle bildirir; cancel() ile iptal edilebilir.
+
+    Alt sınıflar work() metodunu ezmek zorundadır; temel sınıfın work() metodu NotImplementedError fırlatır.
+    Biriken mesajlar iş sürerken arayüz iş parçacığındaki bir zamanlayıcıyla MESSAGE_BATCH_INTERVAL
+    aralıklarla, iş bitince de (başarı, hata veya iptal) bir kez gönderilir; böylece uzun süre log
+    yazmayan bir işin son mesajları bekletilmez.
+    """
+    messages = pyqtSignal(list) # Toplu log mesajları
+    progress = pyqtSignal(int, int) # (tamamlanan, toplam)
+    succeeded = pyqtSignal(object) # İşin sonucu
+    failed = pyqtSignal(str) # Hata mesajı
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None, instrumentation=NULL_INSTRUMENTATION):
+        super().__init__(parent)
+        self.instrumentation = instrumentation # profile açıksa work() bu iş parçacığında profillenir
+        self._cancel_event = threading.Event()
+        self._pending_messages: List[str] = []
+        self._messages_lock = threading.Lock() # Mesajlar iş ve arayüz iş parçacıklarından gönderilebilir
+        self._last_progress = 0
+        # Zamanlayıcı QThread nesnesiyle birlikte arayüz iş parçacığında yaşar; iş sürdükçe çalışır
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(int(MESSAGE_BATCH_INTERVAL * 1000))
+        self._flush_timer.timeout.connect(self.flush_messages)
+        self.started.connect(self._flush_timer.start)
+        self.finished.connect(self._flush_timer.stop)
+
+    def cancel(self):
+        """İşin bir sonraki kontrol noktasında durmasını ister."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def log(self, message: str):
+        """Mesajı biriktirir; yeterince birikince hemen, aksi halde zamanlayıcıyla arayüze gönderir."""
+        with self._messages_lock:
+            self._pending_messages.append(message)
+            batch_full = len(self._pending_messages) >= MESSAGE_BATCH_SIZE
+        if batch_full:
+            self.flush_messages()
+
+    def flush_messages(self):
+        """Biriken mesajları gönderir; kilit altında gönderildiği için mesaj sırası korunur."""
+        with self._messages_lock:
+            if self._pending_messages:
+                self.messages.emit(self._pending_messages)
+                self._pending_messages = []
+
+    def report_progress(self, done: int, total: int):
+        """İlerlemeyi en fazla yaklaşık %1 adımlarla arayüze bildirir."""
+        step = max(1, total // 100)
+        if done == total or done < self._last_progress or done - self._last_progress >= step:
+            self._last_progress = done
+            self.progress.emit(done, total)
+
+    def run(self):
+        try:
+            with self.instrumentation.profiling():
+                result = self.work()
+        except (IngestionCancelled, CalculationCancelled):
+            self.flush_messages()
+            self.cancelled.emit()
+        except Exception as e:
+            self.flush_messages()
+            self.failed.emit(str(e))
+        else:
+            self.flush_messages()
+            self.succeeded.emit(result)
+
+    def work(self):
+        """Asıl iş; her alt sınıf bu metodu ezmelidir. Dönüş değeri succeeded sinyaliyle gönderilir."""
+        raise NotImplementedError(f"{type(self).__name__} work() metodunu ezmelidir.")
+
+class FolderLoadWorker(BackgroundWorker):
+    """Seçilen klasördeki tüm ölçüm dosyalarını arka planda okur."""
+
+    def __init__(self, parser: MeasurementParser, folder: str, workers: int = None, parent=None):
+        super().__init__(parent, parser.instrumentation)
+        self.parser = parser
+        self.folder = folder
+        self.workers = workers
+
+    def work(self) -> Dict[str, List[MeasurementData]]:
+        return self.parser.get_all_measurements_in_folder(
+            self.folder, workers=self.workers,
+            progress=self.report_progress, is_cancelled=self.is_cancelled
+        )
+
+class FolderScanWorker(BackgroundWorker):
+    """Seçilen klasördeki dosyaların yalnızca başlıklarını arka planda okuyup indeks oluşturur."""
+
+    def __init__(self, parser: MeasurementParser, folder: str,
+                 memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES, parent=None):
+        super().__init__(parent, parser.instrumentation)
+        self.parser = parser
+        self.folder = folder
+        self.memory_budget_bytes = memory_budget_bytes
+
+    def work(self) -> MeasurementIndex:
+        return MeasurementIndex.scan(
+            self.parser, self.folder, self.memory_budget_bytes,
+            progress=self.report_progress, is_cancelled=self.is_cancelled
+        )
+
+class CalculationWorker(BackgroundWorker):
+    """Seçili hesaplamaları arka planda yapar ve sonuçları yazar."""
+
+    def __init__(self, output_writer: OutputWriter,
+                 all_measurements_by_type: Dict[str, List[MeasurementData]],
+                 selected_strategies_local: List[ICalculationStrategy],
+                 selected_strategies_global: List[ICalculationStrategy], parent=None,
+                 instrumentation=NULL_INSTRUMENTATION, result_cache=None):
+        super().__init__(parent, instrumentation)
+        self.pipeline = CalculationPipeline(
+            output_writer, log=self.log, progress=self.report_progress, is_cancelled=self.is_cancelled,
+            instrumentation=instrumentation, result_cache=result_cache
+        )
+        self.all_measurements_by_type = all_measurements_by_type
+        self.selected_strategies_local = selected_strategies_local
+        self.selected_strategies_global = selected_strategies_global
+
+    def work(self) -> str:
+        return self.pipeline.run(
+            self.all_measurements_by_type, self.selected_strategies_local, self.selected_strategies_global
+        )
+
+class RemoteCalculationWorker(BackgroundWorker):
+    """Seçili hesaplamaların sonuçlarını sorgu sunucusundan alır ve yazar (klasör yerelde ayrıştırılmaz)."""
+
+    def __init__(self, client: QueryClient, output_writer: OutputWriter,
+                 selected_strategies_local: List[ICalculationStrategy],
+                 selected_strategies_global: List[ICalculationStrategy], parent=None):
+        super().__init__(parent)
+        self.client = client
+        self.output_writer = output_writer
+        self.selected_strategies_local = selected_strategies_local
+        self.selected_strategies_global = selected_strategies_global
+
+    def work(self) -> str:
+        return calculate_remote(
+            self.client, self.output_writer, self.selected_strategies_local, self.selected_strategies_global,
+            log=self.log, is_cancelled=self.is_cancelled
+        )
+
+class SeriesLoadWorker(BackgroundWorker):
+    """Seçilen dosyaları çizim için sütunlara (PlotSeries) dönüştürür; gerekirse dosyalar burada yüklenir."""
+
+    def __init__(self, selections: List[Tuple[str, List[MeasurementData]]], parent=None):
+        super().__init__(parent)
+        self.selections = selections # [(seri etiketi, dosyalar), ...]
+
+    def work(self) -> List[PlotSeries]:
+        series_list = []
+        for done, (label, measurements) in enumerate(self.selections, 1):
+            if self.is_cancelled():
+                raise CalculationCancelled("Seri yükleme iptal edildi.")
+            series_list.append(PlotSeries(label, measurements))
+            self.report_progress(done, len(self.selections))
+        return series_list
+
+class WatchWorker(BackgroundWorker):
+    """
+    Klasörü periyodik olarak tarar ve yalnızca değişen dosyalardan etkilenen sonuçları günceller.
+    cancel() çağrılana kadar çalışır.
+    """
+
+    def __init__(self, calculator: IncrementalCalculator, interval: float = DEFAULT_POLL_INTERVAL, parent=None):
+        super().__init__(parent, calculator.instrumentation)
+        self.calculator = calculator
+        self.calculator.log = self.log
+        self.interval = interval
+
+    def work(self) -> str:
+        while not self.is_cancelled():
+            self.calculator.poll()
+            self.flush_messages()
+            self._cancel_event.wait(self.interval) # İptal edilirse beklemeden çıkar
+        return "İzleme durduruldu."
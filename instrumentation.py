@@ -0,0 +1,180 @@
+# instrumentation.py
+
+import contextlib
+import cProfile
+import json
+import pstats
+import io
+import sys
+import time
+from typing import Dict, List, Optional
+
+try:
+    import resource # Windows'ta bulunmaz
+except ImportError:
+    resource = None
+
+class StageTiming:
+    """Bir aşamanın toplam duvar saati ve CPU süresi ile çağrı sayısı."""
+    __slots__ = ('wall', 'cpu', 'calls')
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.calls = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {'wall_s': self.wall, 'cpu_s': self.cpu, 'calls': self.calls}
+
+class _StageTimer:
+    """RunInstrumentation.stage() tarafından döndürülen zamanlayıcı bağlam yöneticisi."""
+    __slots__ = ('timing', 'wall_start', 'cpu_start')
+
+    def __init__(self, timing: StageTiming):
+        self.timing = timing
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timing.wall += time.perf_counter() - self.wall_start
+        self.timing.cpu += time.process_time() - self.cpu_start
+        self.timing.calls += 1
+        return False
+
+class NullInstrumentation:
+    """
+    Ölçüm kapalıyken kullanılan boş uygulama. Tüm metotlar hiçbir şey yapmaz;
+    böylece ölçüm noktaları kapalıyken neredeyse hiç maliyet getirmez.
+    """
+    enabled = False
+    _null_context = contextlib.nullcontext()
+
+    def stage(self, name: str):
+        return self._null_context
+
+    def count(self, name: str, amount: int = 1):
+        pass
+
+    def record_failure(self, file_path: str, reason: str):
+        pass
+
+    def record_rejected_lines(self, file_path: str, line_count: int):
+        pass
+
+    def profiling(self):
+        return self._null_context
+
+# Paylaşılan tek boş örnek; ölçüm istenmeyen her yerde varsayılan olarak kullanılır
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+class RunInstrumentation(NullInstrumentation):
+    """
+    Bir çalıştırmanın aşama bazında ölçümlerini toplar:
+    aşama başına duvar saati/CPU süresi, sayaçlar (dosya, nokta, okunan/yazılan bayt),
+    dosya bazında ayrıştırma hataları ve en yüksek bellek kullanımı.
+    profile=True ise profiling() bağlamında cProfile çalıştırılır.
+    """
+    enabled = True
+
+    def __init__(self, profile: bool = False):
+        self.stages: Dict[str, StageTiming] = {}
+        self.counters: Dict[str, int] = {}
+        self.failures: List[Dict[str, str]] = []
+        self.rejected_lines: Dict[str, int] = {}
+        self.profile = profile
+        self.profiler: Optional[cProfile.Profile] = None
+        self.started_at = time.perf_counter()
+
+    def stage(self, name: str) -> _StageTimer:
+        """Aşamanın süresini ölçen bir bağlam yöneticisi döndürür; aynı ad tekrar kullanılırsa süreler toplanır."""
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming()
+        return _StageTimer(timing)
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_failure(self, file_path: str, reason: str):
+        self.failures.append({'file_path': file_path, 'reason': reason})
+
+    def record_rejected_lines(self, file_path: str, line_count: int):
+        if line_count:
+            self.rejected_lines[file_path] = self.rejected_lines.get(file_path, 0) + line_count
+
+    @contextlib.contextmanager
+    def profiling(self):
+        """profile açıksa bağlam içinde cProfile çalıştırır (yalnızca çağıran iş parçacığı profillenir)."""
+        if not self.profile:
+            yield
+            return
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+
+    @staticmethod
+    def peak_memory_bytes() -> Optional[int]:
+        """Sürecin en yüksek bellek kullanımı (RSS); desteklenmiyorsa None."""
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux'ta KB, macOS'ta bayt cinsindendir
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    def to_dict(self) -> Dict[str, object]:
+        """Yapılandırılmış rapor."""
+        return {
+            'total_wall_s': time.perf_counter() - self.started_at,
+            'stages': {name: timing.to_dict() for name, timing in self.stages.items()},
+            'counters': dict(self.counters),
+            'peak_memory_bytes': self.peak_memory_bytes(),
+            'parse_failures': list(self.failures),
+            'rejected_lines': dict(self.rejected_lines),
+        }
+
+    def write_json(self, file_path: str):
+        """Raporu JSON dosyasına yazar."""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def dump_profile(self, file_path: str) -> bool:
+        """Toplanan cProfile verisini pstats dosyasına yazar; profil yoksa False döner."""
+        if self.profiler is None:
+            return False
+        self.profiler.dump_stats(file_path)
+        return True
+
+    def profile_summary(self, limit: int = 15) -> str:
+        """En çok süre harcayan fonksiyonların kısa özeti."""
+        if self.profiler is None:
+            return ""
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def format_summary(self) -> str:
+        """Arayüzde gösterilecek okunabilir özet."""
+        report = self.to_dict()
+        lines = ["--- Performans Raporu ---", f"Toplam süre: {report['total_wall_s']:.3f} s"]
+        for name, timing in report['stages'].items():
+            lines.append(f"{name}: {timing['wall_s']:.3f} s (CPU {timing['cpu_s']:.3f} s, {timing['calls']} çağrı)")
+        counter_names = {
+            'files': "Dosya", 'points': "Nokta", 'bytes_read': "Okunan bayt", 'bytes_written': "Yazılan bayt",
+        }
+        for name, value in report['counters'].items():
+            lines.append(f"{counter_names.get(name, name)}: {value}")
+        if report['peak_memory_bytes'] is not None:
+            lines.append(f"En yüksek bellek: {report['peak_memory_bytes'] / (1024 * 1024):.1f} MB")
+        if report['parse_failures']:
+            lines.append(f"Ayrıştırılamayan dosya: {len(report['parse_failures'])}")
+        if report['rejected_lines']:
+            lines.append(f"Hatalı satır içeren dosya: {len(report['rejected_lines'])} "
+                         f"(toplam {sum(report['rejected_lines'].values())} satır)")
+        return "\n".join(lines)
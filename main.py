@@ -4,34 +4,35 @@ import sys
 import os
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                             QPushButton, QLineEdit, QCheckBox, QLabel,
-                            QMessageBox, QFileDialog, QScrollArea)
-from PyQt5.QtCore import Qt, pyqtSignal
+                            QMessageBox, QFileDialog, QPlainTextEdit, QProgressBar)
+from PyQt5.QtCore import Qt
 
 # Kendi modüllerimizi import et
 from data_parser import MeasurementParser
-from calculation_strategies import (ICalculationStrategy, AverageCalculationStrategy,
-                                    MaximumCalculationStrategy, MinimumCalculationStrategy,
-                                    StandardDeviationCalculationStrategy, FrequencyCalculationStrategy,
-                                    MedianCalculationStrategy)
+from strategy_registry import load_all_strategies
+from gui_workers import FolderLoadWorker, FolderScanWorker, CalculationWorker, RemoteCalculationWorker, WatchWorker
+from instrumentation import NULL_INSTRUMENTATION, RunInstrumentation
+from measurement_types import format_file_counts
 from output_writer import OutputWriter
-from measurement import MeasurementData # MeasurementData tipini kullanabilmek için
+from parse_cache import ParsedDataCache
+from query_client import DEFAULT_SERVER_URL, QueryClient
+from result_cache import ResultCache
+from watch import IncrementalCalculator
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.measurement_parser = MeasurementParser()
         self.output_writer = None # Klasör seçildikten sonra başlatılacak
-        self.all_measurements_by_type = {'sıcaklık': [], 'nem': []} # Okunan tüm ölçüm verileri
-
-        # Strateji nesnelerini bir sözlükte tutalım
-        self.calculation_strategies = {
-            'Ortalama': AverageCalculationStrategy(),
-            'Maksimum': MaximumCalculationStrategy(),
-            'Minimum': MinimumCalculationStrategy(),
-            'Standart Sapma': StandardDeviationCalculationStrategy(),
-            'Frekans': FrequencyCalculationStrategy(),
-            'Medyan': MedianCalculationStrategy()
-        }
+        self.result_cache = None # Hesapla tıklamaları arasında lokal sonuçları saklar (klasör başına)
+        self.all_measurements_by_type = {} # Okunan tüm ölçüm verileri (tip klasörü -> dosyalar)
+        self.measurement_index = None # Yalnızca başlık taramasında oluşturulan dosya indeksi
+        self.worker = None # Çalışan arka plan işi (klasör okuma veya hesaplama)
+        self.plot_window = None # Açık grafik penceresi
+        self.instrumentation = NULL_INSTRUMENTATION # Performans raporu istenirse bir çalıştırma boyunca ölçümler
+
+        # Strateji nesnelerini bir sözlükte tutalım (kayıt sırası checkbox sırasıdır)
+        self.calculation_strategies = load_all_strategies()
 
         self.initUI()
 
@@ -53,59 +54,160 @@ class MainWindow(QWidget):
         folderSelectLayout.addWidget(self.selectFolderButton)
         mainLayout.addLayout(folderSelectLayout)
 
+        # Büyük klasörler için: açılışta yalnızca başlıkları oku, noktaları hesaplama sırasında yükle
+        self.lazyLoadCheckBox = QCheckBox("Yalnızca başlıkları tara (veriler hesaplama sırasında yüklenir)", self)
+        self.lazyLoadCheckBox.setChecked(True)
+        mainLayout.addWidget(self.lazyLoadCheckBox)
+
+        # Sorgu sunucusu (query_server.py) çalışıyorsa veriler yerelde okunmaz, sonuçlar sunucudan alınır
+        serverLayout = QHBoxLayout()
+        self.serverCheckBox = QCheckBox("Sorgu sunucusunu kullan", self)
+        self.serverUrlLineEdit = QLineEdit(DEFAULT_SERVER_URL, self)
+        serverLayout.addWidget(self.serverCheckBox)
+        serverLayout.addWidget(self.serverUrlLineEdit)
+        mainLayout.addLayout(serverLayout)
+
         # 2. Bölüm: Hesaplama Checkbox'ları
         calculationGroupBox = QLabel("<h3>Yapılacak Hesaplamaları Seçin:</h3>")
         mainLayout.addWidget(calculationGroupBox)
 
         self.checkboxLayout = QVBoxLayout()
         # Checkbox'ları bir sözlükte tutarak erişimi kolaylaştıralım
+        # Her hesaplama için bir lokal (dosya bazında) ve bir global (tüm dosyalar birleşik) checkbox
         self.calculation_checkboxes = {}
+        self.global_calculation_checkboxes = {}
         for name in self.calculation_strategies.keys():
+            rowLayout = QHBoxLayout()
             cb = QCheckBox(name, self)
-            self.checkboxLayout.addWidget(cb)
+            cb_global = QCheckBox("Global (Tüm Dosyaları Birleştir)", self)
+            cb_global.setEnabled(self.calculation_strategies[name].supports_global)
+            rowLayout.addWidget(cb)
+            rowLayout.addWidget(cb_global)
+            rowLayout.addStretch(1)
+            self.checkboxLayout.addLayout(rowLayout)
             self.calculation_checkboxes[name] = cb
-
-        self.globalCalculationCheckBox = QCheckBox("Global Hesaplama Yap (Tüm Dosyaları Birleştir)", self)
-        self.checkboxLayout.addWidget(self.globalCalculationCheckBox) # Global checkbox'ı ekle
+            self.global_calculation_checkboxes[name] = cb_global
 
         mainLayout.addLayout(self.checkboxLayout)
 
-        # 3. Bölüm: Hesapla Butonu
+        # Performans ölçümü seçenekleri
+        instrumentationLayout = QHBoxLayout()
+        self.reportCheckBox = QCheckBox("Performans raporu oluştur", self)
+        self.profileCheckBox = QCheckBox("Profil çıkar (cProfile)", self)
+        instrumentationLayout.addWidget(self.reportCheckBox)
+        instrumentationLayout.addWidget(self.profileCheckBox)
+        instrumentationLayout.addStretch(1)
+        mainLayout.addLayout(instrumentationLayout)
+
+        # Metin dosyalarına ek olarak dosya başına bir satırlık makine tarafından okunabilir tablolar
+        formatLayout = QHBoxLayout()
+        self.csvCheckBox = QCheckBox("CSV tablosu yaz", self)
+        self.jsonlCheckBox = QCheckBox("JSON Lines tablosu yaz", self)
+        formatLayout.addWidget(self.csvCheckBox)
+        formatLayout.addWidget(self.jsonlCheckBox)
+        formatLayout.addStretch(1)
+        mainLayout.addLayout(formatLayout)
+
+        # 3. Bölüm: Hesapla ve İptal Butonları
         self.calculateButton = QPushButton('Hesapla', self)
         self.calculateButton.setFixedSize(150, 50)
         # Fonksiyon adını _perform_calculations olarak değiştirdik
         self.calculateButton.clicked.connect(self._perform_calculations) 
 
+        # İzleme: klasöre yeni gelen veya değişen dosyaların sonuçlarını otomatik günceller
+        self.watchButton = QPushButton('İzle', self)
+        self.watchButton.setFixedSize(150, 50)
+        self.watchButton.clicked.connect(self._start_watch)
+
+        # Grafik: okunan serileri zamana göre çizen pencere
+        self.plotButton = QPushButton('Grafik', self)
+        self.plotButton.setFixedSize(150, 50)
+        self.plotButton.clicked.connect(self._show_plot)
+
+        self.cancelButton = QPushButton('İptal', self)
+        self.cancelButton.setFixedSize(150, 50)
+        self.cancelButton.setEnabled(False)
+        self.cancelButton.clicked.connect(self._cancel_worker)
+
         buttonLayout = QHBoxLayout()
         buttonLayout.addStretch(1)
         buttonLayout.addWidget(self.calculateButton)
+        buttonLayout.addWidget(self.watchButton)
+        buttonLayout.addWidget(self.plotButton)
+        buttonLayout.addWidget(self.cancelButton)
         buttonLayout.addStretch(1)
         mainLayout.addLayout(buttonLayout)
 
-        # 4. Bölüm: Mesaj İçeriği
-        self.messageLabel = QLabel("Mesajlar burada görüntülenecek...", self)
-        self.messageLabel.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self.messageLabel.setStyleSheet("border: 1px solid gray; padding: 10px; background-color: #f0f0f0;")
-        self.messageLabel.setWordWrap(True) # Uzun metinleri sarmala
+        # İlerleme çubuğu
+        self.progressBar = QProgressBar(self)
+        self.progressBar.setValue(0)
+        mainLayout.addWidget(self.progressBar)
 
-        # Mesaj alanını kaydırılabilir yap
-        scroll_area = QScrollArea(self)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.messageLabel)
-        mainLayout.addWidget(scroll_area)
+        # 4. Bölüm: Mesaj İçeriği (yalnızca sona ekleme yapılan, kaydırılabilir log alanı)
+        self.messageLog = QPlainTextEdit(self)
+        self.messageLog.setReadOnly(True)
+        self.messageLog.setPlaceholderText("Mesajlar burada görüntülenecek...")
+        self.messageLog.setStyleSheet("border: 1px solid gray; padding: 10px; background-color: #f0f0f0;")
+        mainLayout.addWidget(self.messageLog)
 
         self.setLayout(mainLayout)
 
-    # Yardımcı metod: Mesaj etiketini güncellemek için
+    # Yardımcı metod: Mesaj alanını güncellemek için
     def _update_message_label(self, message: str):
-        """QLabel'in metnine yeni bir mesaj ekler."""
-        current_text = self.messageLabel.text()
-        # İlk boş mesaj için sadece yeni metni kullan
-        if current_text == "Mesajlar burada görüntülenecek...":
-            self.messageLabel.setText(message)
-        else:
-            self.messageLabel.setText(current_text + "\n" + message)
-        QApplication.processEvents() # UI'ın güncellenmesini sağla
+        """Mesaj alanının sonuna yeni bir mesaj ekler."""
+        self.messageLog.appendPlainText(message)
+
+    def _append_messages(self, messages: list):
+        """Arka plan işinden toplu gelen mesajları tek seferde ekler."""
+        self.messageLog.appendPlainText("\n".join(messages))
+
+    def _on_progress(self, done: int, total: int):
+        self.progressBar.setMaximum(max(total, 1))
+        self.progressBar.setValue(done)
+
+    def _set_busy(self, busy: bool):
+        """Arka plan işi çalışırken butonları kilitler."""
+        self.selectFolderButton.setEnabled(not busy)
+        self.calculateButton.setEnabled(not busy)
+        self.watchButton.setEnabled(not busy)
+        self.plotButton.setEnabled(not busy)
+        self.cancelButton.setEnabled(busy)
+
+    def _start_worker(self, worker, on_succeeded):
+        """Arka plan işinin sinyallerini bağlar ve işi başlatır."""
+        self.worker = worker
+        worker.messages.connect(self._append_messages)
+        worker.progress.connect(self._on_progress)
+        worker.succeeded.connect(on_succeeded)
+        worker.failed.connect(self._on_worker_failed)
+        worker.cancelled.connect(self._on_worker_cancelled)
+        worker.finished.connect(self._on_worker_finished)
+        self.progressBar.setValue(0)
+        self._set_busy(True)
+        worker.start()
+
+    def _cancel_worker(self):
+        if self.worker:
+            self._update_message_label("İptal ediliyor...")
+            self.cancelButton.setEnabled(False)
+            self.worker.cancel()
+
+    def _on_worker_failed(self, error_message: str):
+        self._update_message_label(f"Hata: {error_message}")
+
+    def _on_worker_cancelled(self):
+        self._update_message_label("İşlem iptal edildi.")
+
+    def _on_worker_finished(self):
+        self.worker = None
+        self._set_busy(False)
+
+    def closeEvent(self, event):
+        # Pencere kapanırken arka plan işinin bitmesini bekle
+        if self.worker:
+            self.worker.cancel()
+            self.worker.wait()
+        super().closeEvent(event)
 
     def selectFolder(self):
         folder = QFileDialog.getExistingDirectory(self, "Ölçüm Kök Klasörünü Seç", "")
@@ -113,193 +215,171 @@ class MainWindow(QWidget):
             self.folderPathLineEdit.setText(folder)
             self._update_message_label(f"Klasör seçildi: {folder}\nVeriler okunuyor...")
 
-            # Seçilen klasöre göre OutputWriter'ı başlat
+            # Seçilen klasöre göre OutputWriter'ı ve ayrıştırma önbelleğini başlat
             self.output_writer = OutputWriter(folder) 
-
-            # Tüm ölçüm verilerini oku
-            self.all_measurements_by_type = self.measurement_parser.get_all_measurements_in_folder(folder)
-
-            temp_count = len(self.all_measurements_by_type['sıcaklık'])
-            hum_count = len(self.all_measurements_by_type['nem'])
-
-            self._update_message_label(
-                f"Klasör seçildi: {folder}\n"
-                f"Toplam {temp_count} sıcaklık dosyası ve {hum_count} nem dosyası bulundu.\n"
-                f"Hesaplamak istediğiniz işlemleri seçip 'Hesapla' butonuna basın."
-            )
+            self.measurement_parser.cache = ParsedDataCache.for_root(folder)
+            self.result_cache = ResultCache.for_root(folder)
+            self.all_measurements_by_type = {}
+            self.measurement_index = None
+            self.instrumentation = self._new_instrumentation()
+            self.measurement_parser.instrumentation = self.instrumentation
+
+            if self.serverCheckBox.isChecked():
+                # Veriler sunucuda tutulduğu için yerelde okunmaz
+                self._update_message_label(f"Sonuçlar sorgu sunucusundan alınacak: {self.serverUrlLineEdit.text()}\n"
+                                           f"Hesaplamak istediğiniz işlemleri seçip 'Hesapla' butonuna basın.")
+            elif self.lazyLoadCheckBox.isChecked():
+                # Yalnızca başlıkları arka planda tara; noktalar hesaplama sırasında yüklenir
+                self._start_worker(FolderScanWorker(self.measurement_parser, folder, parent=self),
+                                   self._on_folder_scanned)
+            else:
+                # Tüm ölçüm verilerini arka planda oku (tüm çekirdekler kullanılarak)
+                self._start_worker(FolderLoadWorker(self.measurement_parser, folder, workers=None, parent=self),
+                                   self._on_folder_loaded)
         else:
-            self.messageLabel.setText("Klasör seçimi iptal edildi.")
-            self.all_measurements_by_type = {'sıcaklık': [], 'nem': []}
+            self._update_message_label("Klasör seçimi iptal edildi.")
+            self.all_measurements_by_type = {}
+            self.measurement_index = None
             self.output_writer = None
+            self.result_cache = None
 
-    # Refactored performCalculations method
-    # main.py içindeki _perform_calculations metodu
-
-# main.py içindeki _perform_calculations metodu
-
-def _perform_calculations(self):
-    if not self.folderPathLineEdit.text():
-        self._update_message_label("Lütfen önce bir klasör seçin.")
-        return
-
-    if not self.output_writer:
-        self._update_message_label("Hata: Çıktı yazıcısı başlatılamadı. Klasör seçimi hatası olabilir.")
-        return
+    def _on_folder_scanned(self, measurement_index):
+        self.measurement_index = measurement_index
+        self._on_folder_loaded(measurement_index.measurements_by_type())
 
-    selected_strategies_local = []
-    selected_strategies_global = []
+    def _on_folder_loaded(self, all_measurements_by_type: dict):
+        self.all_measurements_by_type = all_measurements_by_type
 
-    # Her bir hesaplama türü için lokal ve global seçimleri kontrol et
-    for name, cb_local in self.calculation_checkboxes.items():
-        cb_global = self.global_calculation_checkboxes[name]
-
-        if cb_local.isChecked():
-            selected_strategies_local.append(self.calculation_strategies[name])
-
-        if cb_global.isChecked():
-            selected_strategies_global.append(self.calculation_strategies[name])
-
-    # Eğer hiçbir lokal veya global hesaplama seçilmemişse
-    if not selected_strategies_local and not selected_strategies_global:
-        self._update_message_label("Lütfen en az bir lokal veya global hesaplama türü seçin.")
-        return
+        self._update_message_label(
+            f"{format_file_counts(self.all_measurements_by_type)}\n"
+            f"Hesaplamak istediğiniz işlemleri seçip 'Hesapla' butonuna basın."
+        )
+        failures = self.measurement_parser.parse_failures
+        if failures:
+            self._update_message_label(
+                f"Uyarı: {len(failures)} dosya ayrıştırılamadı:\n" +
+                "\n".join(f"- {os.path.basename(failure.file_path)}: {failure.reason}" for failure in failures)
+            )
 
-    self._update_message_label("Hesaplamalar başlatılıyor...\n")
+    def _perform_calculations(self):
+        selected = self._selected_strategies()
+        if selected is None:
+            return
+        selected_strategies_local, selected_strategies_global = selected
+
+        self._update_message_label("Hesaplamalar başlatılıyor...\n")
+        self.output_writer.formats = ('txt',) + (('csv',) if self.csvCheckBox.isChecked() else ()) \
+            + (('jsonl',) if self.jsonlCheckBox.isChecked() else ())
+
+        if self.serverCheckBox.isChecked():
+            client = QueryClient(self.serverUrlLineEdit.text().strip() or DEFAULT_SERVER_URL)
+            self._start_worker(
+                RemoteCalculationWorker(client, self.output_writer, selected_strategies_local,
+                                        selected_strategies_global, parent=self),
+                self._on_calculations_finished
+            )
+            return
 
-    overall_status_message = ""
+        # Klasör okuması ölçülmediyse bu çalıştırma için yeni bir ölçüm başlat
+        if not self.instrumentation.enabled:
+            self.instrumentation = self._new_instrumentation()
 
-    for measurement_type, measurements_list in self.all_measurements_by_type.items():
-        # _process_measurement_type metodunu güncelleyelim, artık hem lokal hem global stratejileri alacak
-        overall_status_message += self._process_measurement_type(
-            measurement_type, measurements_list, selected_strategies_local, selected_strategies_global
+        self._start_worker(
+            CalculationWorker(self.output_writer, self.all_measurements_by_type,
+                              selected_strategies_local, selected_strategies_global, parent=self,
+                              instrumentation=self.instrumentation, result_cache=self.result_cache),
+            self._on_calculations_finished
         )
 
-    self._update_message_label("\n--- Hesaplamalar tamamlandı! ---")
-    if overall_status_message: 
-        self._update_message_label(overall_status_message)
-    QMessageBox.information(self, "Hesaplama Tamamlandı", "Tüm hesaplamalar tamamlandı ve sonuçlar kaydedildi.")
-
-# Yeni _process_measurement_type tanımı
-    def _process_measurement_type(self, measurement_type: str, measurements_list: list[MeasurementData], 
-                                    selected_strategies_local: list[ICalculationStrategy], 
-                                    selected_strategies_global: list[ICalculationStrategy]) -> str:
-        """Belirli bir ölçüm türü için hesaplamaları yönetir."""
-        status_message = ""
-        if not measurements_list:
-            status_message += f"'{measurement_type}' için dosya bulunamadı. Hesaplama atlandı.\n"
-            return status_message
-
-        self._update_message_label(f"\n--- {measurement_type.capitalize()} Hesaplamaları ---")
-
-        # Global hesaplama için tüm değerleri birleştir (eğer herhangi bir global hesaplama seçilmişse)
-        global_values = []
-        if selected_strategies_global: # Sadece global strateji seçilmişse global_values'ı doldur
-            for data in measurements_list:
-                global_values.extend(data.values)
-
-        for strategy in selected_strategies_local:
-            # Lokal (dosya bazında) hesaplamalar
-            self._calculate_and_write_local_results(measurement_type, measurements_list, strategy)
-
-        for strategy in selected_strategies_global:
-            # Global hesaplamalar (sadece seçili olanlar için)
-            self._calculate_and_write_global_results(measurement_type, global_values, strategy)
-
-        return status_message
-# Yeni _process_measurement_type tanımı
-    def _process_measurement_type(self, measurement_type: str, measurements_list: list[MeasurementData], 
-                                    selected_strategies_local: list[ICalculationStrategy], 
-                                    selected_strategies_global: list[ICalculationStrategy]) -> str:
-        """Belirli bir ölçüm türü için hesaplamaları yönetir."""
-        status_message = ""
-        if not measurements_list:
-            status_message += f"'{measurement_type}' için dosya bulunamadı. Hesaplama atlandı.\n"
-            return status_message
-
-        self._update_message_label(f"\n--- {measurement_type.capitalize()} Hesaplamaları ---")
-
-        # Global hesaplama için tüm değerleri birleştir (eğer herhangi bir global hesaplama seçilmişse)
-        global_values = []
-        if selected_strategies_global: # Sadece global strateji seçilmişse global_values'ı doldur
-            for data in measurements_list:
-                global_values.extend(data.values)
-
-        for strategy in selected_strategies_local:
-            # Lokal (dosya bazında) hesaplamalar
-            self._calculate_and_write_local_results(measurement_type, measurements_list, strategy)
-
-        for strategy in selected_strategies_global:
-            # Global hesaplamalar (sadece seçili olanlar için)
-            self._calculate_and_write_global_results(measurement_type, global_values, strategy)
-
-        return status_message
-    
-    
-    def _process_measurement_type(self, measurement_type: str, measurements_list: list[MeasurementData], 
-                                selected_strategies: list[ICalculationStrategy], is_global_calculation_enabled: bool) -> str:
-        """Belirli bir ölçüm türü için hesaplamaları yönetir."""
-        status_message = ""
-        if not measurements_list:
-            status_message += f"'{measurement_type}' için dosya bulunamadı. Hesaplama atlandı.\n"
-            return status_message
-
-        self._update_message_label(f"\n--- {measurement_type.capitalize()} Hesaplamaları ---")
-
-        # Global hesaplama için tüm değerleri birleştir
-        global_values = []
-        if is_global_calculation_enabled:
-            for data in measurements_list:
-                global_values.extend(data.values)
-
-        for strategy in selected_strategies:
-            # Lokal (dosya bazında) hesaplamalar
-            self._calculate_and_write_local_results(measurement_type, measurements_list, strategy)
-
-            # Global hesaplamalarin
-            if is_global_calculation_enabled:
-                self._calculate_and_write_global_results(measurement_type, global_values, strategy)
-
-        return status_message # Dış fonksiyona eklenmesi gereken mesajlar
-
-    def _calculate_and_write_local_results(self, measurement_type: str, measurements_list: list[MeasurementData], strategy: ICalculationStrategy):
-        """Lokal (dosya bazında) hesaplamaları yapar ve sonuçları yazar."""
-        local_results = {}
-        for data in measurements_list:
-            try:
-                result = strategy.calculate(data.values)
-                header_info = f"id:{data.id} ölçüm: {data.measurement_type} - yer: {data.location} - tarih: {data.date.strftime('%d.%m.%Y')}"
-                local_results[header_info] = result
-            except ValueError as e:
-                self._update_message_label(f"Uyarı ({measurement_type} - {data.id} - {strategy.name}): {e}")
-
-        if local_results:
-            output_path = self.output_writer.write_results(
-                local_results, measurement_type, strategy.name, is_global=False
-            )
-            if output_path:
-                    self._update_message_label(f"- {measurement_type.capitalize()} {strategy.name} (Lokal) sonuçları kaydedildi: {os.path.basename(output_path)}")
-            else:
-                self._update_message_label(f"- {measurement_type.capitalize()} {strategy.name} (Lokal) kaydedilemedi.")
-
-    def _calculate_and_write_global_results(self, measurement_type: str, global_values: list[float], strategy: ICalculationStrategy):
-        """Global hesaplamaları yapar ve sonuçları yazar."""
-        if not global_values:
-            self._update_message_label(f"Uyarı ({measurement_type} - Global - {strategy.name}): Global hesaplama için veri bulunamadı.")
+    def _start_watch(self):
+        selected = self._selected_strategies()
+        if selected is None:
             return
+        selected_strategies_local, selected_strategies_global = selected
+        self._update_message_label("İzleme başlatıldı. Yeni veya değişen dosyalar otomatik işlenecek; "
+                                   "durdurmak için 'İptal' butonuna basın.")
+        calculator = IncrementalCalculator(
+            self.folderPathLineEdit.text(), self.output_writer,
+            selected_strategies_local, selected_strategies_global,
+            parser=MeasurementParser(verbose=False, cache=self.measurement_parser.cache),
+            result_cache=self.result_cache
+        )
+        self._start_worker(WatchWorker(calculator, parent=self), self._update_message_label)
 
-        try:
-            global_result = strategy.calculate(global_values)
-            global_results_dict = {f"Tüm {measurement_type} değerlerinin {strategy.name.lower()}": global_result}
+    def _show_plot(self):
+        """Okunan ölçüm dosyalarını seçip çizmek için grafik penceresini açar."""
+        if not any(self.all_measurements_by_type.values()):
+            self._update_message_label("Grafik için önce ölçüm verilerinin olduğu bir klasör seçin "
+                                       "(sorgu sunucusu kullanılırken veriler yerelde okunmaz).")
+            return
+        from plot_panel import PlotWindow # Grafik yalnızca istenirse yüklenir
+        if self.plot_window is not None:
+            self.plot_window.close()
+        self.plot_window = PlotWindow(self.all_measurements_by_type, parent=self)
+        self.plot_window.show()
+
+    def _selected_strategies(self):
+        """
+        Seçili lokal ve global stratejileri döndürür. Klasör seçilmemişse veya hiçbir
+        hesaplama seçilmemişse kullanıcıyı bilgilendirip None döndürür.
+        """
+        if not self.folderPathLineEdit.text():
+            self._update_message_label("Lütfen önce bir klasör seçin.")
+            return None
+
+        if not self.output_writer:
+            self._update_message_label("Hata: Çıktı yazıcısı başlatılamadı. Klasör seçimi hatası olabilir.")
+            return None
+
+        selected_strategies_local = []
+        selected_strategies_global = []
+
+        # Her bir hesaplama türü için lokal ve global seçimleri kontrol et
+        for name, cb_local in self.calculation_checkboxes.items():
+            cb_global = self.global_calculation_checkboxes[name]
+
+            if cb_local.isChecked():
+                selected_strategies_local.append(self.calculation_strategies[name])
+
+            if cb_global.isChecked():
+                selected_strategies_global.append(self.calculation_strategies[name])
+
+        # Eğer hiçbir lokal veya global hesaplama seçilmemişse
+        if not selected_strategies_local and not selected_strategies_global:
+            self._update_message_label("Lütfen en az bir lokal veya global hesaplama türü seçin.")
+            return None
+
+        return selected_strategies_local, selected_strategies_global
+
+    def _new_instrumentation(self):
+        """Seçeneklere göre bir ölçüm nesnesi (veya kapalıysa boş uygulama) döndürür."""
+        if self.reportCheckBox.isChecked() or self.profileCheckBox.isChecked():
+            return RunInstrumentation(profile=self.profileCheckBox.isChecked())
+        return NULL_INSTRUMENTATION
+
+    def _write_instrumentation_report(self):
+        """Çalıştırmanın performans raporunu ve profilini sonuç klasörüne yazar, özeti gösterir."""
+        instrumentation = self.instrumentation
+        self.instrumentation = NULL_INSTRUMENTATION
+        self.measurement_parser.instrumentation = NULL_INSTRUMENTATION
+        if not instrumentation.enabled:
+            return
 
-            output_path = self.output_writer.write_results(
-                global_results_dict, measurement_type, strategy.name, is_global=True
-            )
-            if output_path:
-                self._update_message_label(f"- {measurement_type.capitalize()} {strategy.name} (Global) sonuçları kaydedildi: {os.path.basename(output_path)}")
-            else:
-                self._update_message_label(f"- {measurement_type.capitalize()} {strategy.name} (Global) kaydedilemedi.")
-        except ValueError as e:
-            self._update_message_label(f"Uyarı ({measurement_type} - Global - {strategy.name}): {e}")
+        self._update_message_label(instrumentation.format_summary())
+        report_path = os.path.join(self.output_writer.output_root_folder, "performans_raporu.json")
+        instrumentation.write_json(report_path)
+        self._update_message_label(f"Performans raporu kaydedildi: {report_path}")
+        profile_path = os.path.join(self.output_writer.output_root_folder, "profil.prof")
+        if instrumentation.dump_profile(profile_path):
+            self._update_message_label(instrumentation.profile_summary())
+            self._update_message_label(f"Profil kaydedildi: {profile_path}")
+
+    def _on_calculations_finished(self, overall_status_message: str):
+        self._update_message_label("\n--- Hesaplamalar tamamlandı! ---")
+        if overall_status_message: 
+            self._update_message_label(overall_status_message)
+        self._write_instrumentation_report()
+        QMessageBox.information(self, "Hesaplama Tamamlandı", "Tüm hesaplamalar tamamlandı ve sonuçlar kaydedildi.")
 
 
 if __name__ == '__main__':
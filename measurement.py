@@ -1,9 +1,31 @@
 # measurement.py
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Iterator, List, Iterable, Optional
 import datetime
 
+# Sütun tipleri: değerler float64 ('d'), zamanlar gün başından itibaren saniye (int32, 'i')
+VALUE_TYPECODE = 'd'
+TIME_TYPECODE = 'i'
+
+def seconds_of_day(time_obj: datetime.time) -> int:
+    """datetime.time nesnesini gün başından itibaren geçen saniyeye çevirir."""
+    return time_obj.hour * 3600 + time_obj.minute * 60 + time_obj.second
+
+def time_from_seconds(seconds: int) -> datetime.time:
+    """Gün başından itibaren geçen saniyeyi datetime.time nesnesine çevirir."""
+    return datetime.time(seconds // 3600, (seconds // 60) % 60, seconds % 60)
+
+@dataclass
+class ColumnStatistics:
+    """Bir dosyanın değer sütunu için önceden hesaplanmış özet (ikili biçimin alt bilgisi)."""
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    squared_deviation_sum: Optional[float] = None # Ortalamadan sapmaların kareleri toplamı (M2); alt bilgide yok
+
 @dataclass
 class MeasurementPoint:
     """Tek bir ölçüm noktasını (zaman ve değer) temsil eder."""
@@ -12,14 +34,54 @@ class MeasurementPoint:
 
 @dataclass
 class MeasurementData:
-    """Tek bir ölçüm dosyasındaki tüm veriyi temsil eder."""
+    """
+    Tek bir ölçüm dosyasındaki tüm veriyi temsil eder.
+
+    Ölçüm noktaları nesne listesi yerine iki bitişik sütunda tutulur:
+    zamanlar gün başından itibaren saniye (int32), değerler float64. İkili biçimden
+    (bkz. binary_format) yüklenen dosyalarda sütunlar, dosyaya eşlenmiş belleğin salt okunur
+    görünümleridir (memoryview) ve statistics alt bilgideki hazır özeti taşır.
+    """
     id: str
-    measurement_type: str # 'sıcaklık' veya 'nem'
+    measurement_type: str # Kayıtlı ölçüm tipi (bkz. measurement_types), örn. 'sıcaklık'
     location: str
     date: datetime.date
-    points: List[MeasurementPoint] = field(default_factory=list) # Ölçüm noktaları listesi
+    time_column: array = field(default_factory=lambda: array(TIME_TYPECODE)) # Gün başından itibaren saniye
+    value_column: array = field(default_factory=lambda: array(VALUE_TYPECODE)) # Ölçüm değerleri
+    statistics: Optional[ColumnStatistics] = None # Varsa sayı, toplam, min ve max noktalar okunmadan bilinir
+    file_path: str = '' # Kaynak dosyanın yolu; aynı id ve tarihli dosyaları sıralarken kullanılır
+
+    @classmethod
+    def from_points(cls, id: str, measurement_type: str, location: str, date: datetime.date,
+                    points: Iterable[MeasurementPoint]) -> 'MeasurementData':
+        """MeasurementPoint listesinden sütunlu bir MeasurementData oluşturur."""
+        data = cls(id=id, measurement_type=measurement_type, location=location, date=date)
+        for point in points:
+            data.append(point.time, point.value)
+        return data
+
+    def append(self, time_obj: datetime.time, value: float):
+        """
+        Sütunların sonuna yeni bir ölçüm noktası ekler.
+        Not: 'values' ile alınmış bir görünüm hâlâ tutuluyorsa dizi büyütülemez (BufferError).
+        """
+        self.time_column.append(seconds_of_day(time_obj))
+        self.value_column.append(value)
+
+    def __len__(self) -> int:
+        return len(self.value_column)
+
+    @property
+    def values(self) -> memoryview:
+        """Tüm ölçüm değerlerini kopyalamadan, salt okunur bir görünüm olarak döndürür."""
+        return memoryview(self.value_column).toreadonly()
+
+    def iter_points(self) -> Iterator[MeasurementPoint]:
+        """Ölçüm noktalarını ihtiyaç anında MeasurementPoint nesnesi olarak üretir."""
+        for seconds, value in zip(self.time_column, self.value_column):
+            yield MeasurementPoint(time=time_from_seconds(seconds), value=value)
 
     @property
-    def values(self) -> List[float]:
-        """Tüm ölçüm değerlerini bir liste olarak döndürür."""
-        return [p.value for p in self.points]
\ No newline at end of file
+    def points(self) -> List[MeasurementPoint]:
+        """Geriye dönük uyumluluk için ölçüm noktalarını liste olarak döndürür (her çağrıda oluşturulur)."""
+        return list(self.iter_points())
\ No newline at end of file
@@ -0,0 +1,248 @@
+# measurement_index.py
+
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Union
+from data_parser import (MeasurementParser, MeasurementParseError, MeasurementStream, ParseFailure,
+                         IngestionCancelled)
+from binary_format import is_binary_file
+from measurement import ColumnStatistics, MeasurementData, MeasurementPoint
+
+# Bellekte aynı anda tutulacak yüklenmiş ölçüm verilerinin varsayılan üst sınırı
+DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024 # 256 MB
+
+@dataclass
+class MeasurementFileEntry:
+    """İndeksteki tek bir ölçüm dosyası: yalnızca başlıktan okunan bilgiler ve dosya boyutu."""
+    file_path: str
+    id: str
+    measurement_type: str # Kayıtlı ölçüm tipi (bkz. measurement_types), örn. 'sıcaklık'
+    location: str
+    date: datetime.date
+    size: int # Bayt
+    statistics: Optional[ColumnStatistics] = None # İkili dosyaların alt bilgisindeki hazır özet
+
+class LazyMeasurementData:
+    """
+    Noktaları ilk erişimde indeks üzerinden yüklenen ölçüm dosyası.
+
+    Başlık alanları (id, tip, yer, tarih) doğrudan indeksten gelir; values, time_column
+    ve value_column gibi nokta verisine erişen her şey MeasurementIndex.load() çağırır.
+    Yüklenen veri bellek bütçesi aşılırsa indeks tarafından bırakılabilir ve bir
+    sonraki erişimde (varsa önbellekten) yeniden yüklenir.
+    """
+
+    def __init__(self, index: 'MeasurementIndex', entry: MeasurementFileEntry):
+        self.index = index
+        self.entry = entry
+
+    @property
+    def id(self) -> str:
+        return self.entry.id
+
+    @property
+    def measurement_type(self) -> str:
+        return self.entry.measurement_type
+
+    @property
+    def location(self) -> str:
+        return self.entry.location
+
+    @property
+    def date(self) -> datetime.date:
+        return self.entry.date
+
+    @property
+    def statistics(self) -> Optional[ColumnStatistics]:
+        return self.entry.statistics
+
+    @property
+    def file_path(self) -> str:
+        return self.entry.file_path
+
+    def load(self) -> MeasurementData:
+        """Ölçüm verisini yükler; dosya ayrıştırılamazsa MeasurementParseError fırlatır."""
+        return self.index.load(self.entry)
+
+    @property
+    def time_column(self):
+        return self.load().time_column
+
+    @property
+    def value_column(self):
+        return self.load().value_column
+
+    @property
+    def values(self) -> memoryview:
+        return self.load().values
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def iter_points(self) -> Iterator[MeasurementPoint]:
+        return self.load().iter_points()
+
+    @property
+    def points(self) -> List[MeasurementPoint]:
+        return self.load().points
+
+class MeasurementIndex:
+    """
+    Bir ölçüm klasöründeki dosyaların yalnızca başlıklarından oluşturulan indeks.
+
+    Dosyalar tip, yer, tarih ve id'ye göre aranabilir. Nokta verisi bir hesaplama
+    dosyaya ilk eriştiğinde yüklenir (parser.cache ayarlıysa önbellekten) ve en son
+    kullanılanlar bellekte tutulur; yüklenen verinin toplam boyutu memory_budget_bytes
+    değerini aşarsa en uzun süredir kullanılmayanlar bırakılır.
+    """
+
+    def __init__(self, parser: MeasurementParser, memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES):
+        self.parser = parser
+        self.memory_budget_bytes = memory_budget_bytes
+        self.entries: List[MeasurementFileEntry] = []
+        self.by_type: Dict[str, List[MeasurementFileEntry]] = {}
+        self.by_location: Dict[str, List[MeasurementFileEntry]] = {}
+        self.by_date: Dict[datetime.date, List[MeasurementFileEntry]] = {}
+        self.by_id: Dict[str, List[MeasurementFileEntry]] = {}
+        self.scan_failures: List[ParseFailure] = [] # Başlığı okunamayan dosyalar
+        self.load_failures: List[ParseFailure] = [] # Başlığı geçerli olup noktaları ayrıştırılamayan dosyalar
+        self._loaded: 'OrderedDict[str, MeasurementData]' = OrderedDict() # Dosya yolu -> veri (LRU sırasında)
+        self._loaded_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def scan(cls, parser: MeasurementParser, root_folder: str,
+             memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+             progress: Optional[Callable[[int, int], None]] = None,
+             is_cancelled: Optional[Callable[[], bool]] = None) -> 'MeasurementIndex':
+        """
+        Kök klasör altındaki tüm tip klasörlerindeki dosyaların yalnızca ilk satırlarını okuyarak indeks oluşturur.
+        Başlığı okunamayan dosyalar scan_failures ve parser.parse_failures listelerinde toplanır.
+        is_cancelled True dönerse IngestionCancelled fırlatılır.
+        """
+        index = cls(parser, memory_budget_bytes)
+        parser.parse_failures = []
+        parser.rejected_lines = {}
+        with parser.instrumentation.stage('tarama'):
+            discovered = parser._discover_files(root_folder)
+            parser._last_file_jobs = [(entry.path, measurement_type) for entry, measurement_type in discovered]
+            index.by_type = {measurement_type: [] for measurement_type in parser.discovered_types}
+            total_files = len(discovered)
+            if progress:
+                progress(0, total_files)
+            entries = []
+            for processed_files, (dir_entry, expected_type) in enumerate(discovered, 1):
+                if is_cancelled and is_cancelled():
+                    raise IngestionCancelled("Klasör taraması iptal edildi.")
+                file_path = dir_entry.path
+                try:
+                    header_info = parser.read_header(file_path)
+                    if header_info['measurement_type'] != expected_type:
+                        raise MeasurementParseError(
+                            f"Ölçüm tipi '{header_info['measurement_type']}', '{expected_type}' klasörü ile uyuşmuyor."
+                        )
+                    entries.append(MeasurementFileEntry(file_path=file_path, size=dir_entry.stat().st_size,
+                                                        **header_info))
+                except Exception as e:
+                    index.scan_failures.append(ParseFailure(file_path, str(e)))
+                if progress:
+                    progress(processed_files, total_files)
+
+        entries.sort(key=lambda entry: (int(entry.id), entry.date, entry.file_path))
+        for entry in entries:
+            index.add_entry(entry)
+        parser.parse_failures = list(index.scan_failures)
+
+        instrumentation = parser.instrumentation
+        if instrumentation.enabled:
+            instrumentation.count('files', total_files)
+            for failure in index.scan_failures:
+                instrumentation.record_failure(failure.file_path, failure.reason)
+        return index
+
+    def add_entry(self, entry: MeasurementFileEntry):
+        """Bir dosyayı indekse ekler."""
+        self.entries.append(entry)
+        self.by_type.setdefault(entry.measurement_type, []).append(entry)
+        self.by_location.setdefault(entry.location, []).append(entry)
+        self.by_date.setdefault(entry.date, []).append(entry)
+        self.by_id.setdefault(entry.id, []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def loaded_bytes(self) -> int:
+        """Bellekte tutulan yüklenmiş verinin yaklaşık boyutu."""
+        return self._loaded_bytes
+
+    @staticmethod
+    def _data_size(data: MeasurementData) -> int:
+        return (data.time_column.itemsize + data.value_column.itemsize) * len(data)
+
+    def load(self, entry: MeasurementFileEntry) -> MeasurementData:
+        """
+        Dosyanın ölçüm verisini döndürür; bellekte yoksa yükler ve gerekirse eski verileri bırakır.
+        Dosya ayrıştırılamazsa MeasurementParseError fırlatır.
+        """
+        with self._lock:
+            data = self._loaded.get(entry.file_path)
+            if data is not None:
+                self._loaded.move_to_end(entry.file_path)
+                return data
+
+        instrumentation = self.parser.instrumentation
+        try:
+            with instrumentation.stage('ayrıştırma'):
+                data = self.parser.load_or_parse(entry.file_path)
+        except Exception as e:
+            failure = ParseFailure(entry.file_path, str(e))
+            self.load_failures.append(failure)
+            instrumentation.record_failure(failure.file_path, failure.reason)
+            raise MeasurementParseError(str(e)) from e
+        if instrumentation.enabled:
+            instrumentation.count('points', len(data))
+            instrumentation.count('bytes_read', entry.size)
+            instrumentation.record_rejected_lines(entry.file_path, self.parser.rejected_lines.get(entry.file_path, 0))
+
+        with self._lock:
+            self._loaded[entry.file_path] = data
+            self._loaded_bytes += self._data_size(data)
+            # Yeni yüklenen veri bütçeden büyük olsa bile tutulur; yalnızca eskiler bırakılır
+            while self._loaded_bytes > self.memory_budget_bytes and len(self._loaded) > 1:
+                _, evicted = self._loaded.popitem(last=False)
+                self._loaded_bytes -= self._data_size(evicted)
+        return data
+
+    def evict(self, file_path: str):
+        """Dosyanın yüklenmiş verisini bellekten bırakır (indeks kaydı kalır)."""
+        with self._lock:
+            data = self._loaded.pop(file_path, None)
+            if data is not None:
+                self._loaded_bytes -= self._data_size(data)
+
+    def clear_loaded(self):
+        """Yüklenmiş tüm verileri bellekten bırakır."""
+        with self._lock:
+            self._loaded.clear()
+            self._loaded_bytes = 0
+
+    def measurements_by_type(self) -> Dict[str, List[Union[LazyMeasurementData, MeasurementStream]]]:
+        """
+        Hesaplama hattının beklediği {'sıcaklık': [...], 'nem': [...], ...} yapısını döndürür.
+        parser.stream_threshold_bytes değerinden büyük metin dosyaları MeasurementStream olarak döner.
+        """
+        threshold = self.parser.stream_threshold_bytes
+        result = {}
+        for measurement_type, entries in self.by_type.items():
+            result[measurement_type] = [
+                MeasurementStream(entry.file_path, {'id': entry.id, 'measurement_type': entry.measurement_type,
+                                                    'location': entry.location, 'date': entry.date},
+                                  fast_path=self.parser.fast_path)
+                if threshold is not None and entry.size > threshold and not is_binary_file(entry.file_path)
+                else LazyMeasurementData(self, entry)
+                for entry in entries
+            ]
+        return result
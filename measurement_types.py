@@ -0,0 +1,70 @@
+# measurement_types.py
+#
+# Ölçüm tiplerinin kaydı. Yeni bir kaydedici tipi eklemek için MEASUREMENT_TYPES'a bir kayıt
+# eklemek (veya register_measurement_type çağırmak) yeterlidir: klasör keşfi, başlık doğrulaması,
+# frekans çıktısındaki birim ve varsayılan histogram kutu genişliği buradan okunur.
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sized, Tuple
+
+@dataclass(frozen=True)
+class MeasurementType:
+    """Bir ölçüm tipinin ayarları."""
+    name: str # Başlıklarda, klasör adlarında ve sonuç klasörlerinde kullanılan ad (örn. 'sıcaklık')
+    unit: str # Frekans ve histogram çıktısında değerden sonra yazılan birim (örn. 'Derece')
+    histogram_bin_width: Optional[float] = None # None ise histogram varsayılan genişliği kullanır
+    aliases: Tuple[str, ...] = () # Klasör adı ve başlıkta kabul edilen diğer yazımlar (örn. 'basinc')
+
+# Tip adı -> ayarlar (sıra, dosya sayısı mesajlarındaki ve hesaplamalardaki tip sırasıdır)
+MEASUREMENT_TYPES: Dict[str, MeasurementType] = {measurement_type.name: measurement_type for measurement_type in (
+    MeasurementType('sıcaklık', 'Derece', 0.5, aliases=('sicaklik',)),
+    MeasurementType('nem', '%', 1.0),
+    MeasurementType('basınç', 'hPa', 1.0, aliases=('basinc',)),
+    MeasurementType('co2', 'ppm', 10.0, aliases=('co₂',)),
+    MeasurementType('rüzgar', 'm/s', 0.5, aliases=('ruzgar', 'rüzgâr')),
+    # Birleşik sıcaklık-nem serilerinden türetilen büyüklükler (bkz. series_join.DERIVED_METRICS)
+    MeasurementType('çiy noktası', 'Derece', 0.5),
+    MeasurementType('hissedilen sıcaklık', 'Derece', 0.5),
+)}
+
+_NAMES_BY_SPELLING: Dict[str, str] = {}
+
+def _index_spellings(measurement_type: MeasurementType):
+    for spelling in (measurement_type.name,) + measurement_type.aliases:
+        _NAMES_BY_SPELLING[spelling.casefold()] = measurement_type.name
+
+for _measurement_type in MEASUREMENT_TYPES.values():
+    _index_spellings(_measurement_type)
+
+def register_measurement_type(measurement_type: MeasurementType):
+    """Yeni bir ölçüm tipi ekler veya aynı adlı kaydı değiştirir."""
+    MEASUREMENT_TYPES[measurement_type.name] = measurement_type
+    _index_spellings(measurement_type)
+
+def resolve_measurement_type(spelling: str) -> Optional[str]:
+    """Klasör adını veya başlıktaki yazımı kayıtlı tip adına çevirir; kayıtlı değilse None."""
+    return _NAMES_BY_SPELLING.get(spelling.strip().casefold())
+
+def unit_for(measurement_type: str) -> str:
+    """Tipin çıktı birimi; kayıtlı değilse boş metin."""
+    registered = MEASUREMENT_TYPES.get(measurement_type)
+    return registered.unit if registered else ''
+
+def histogram_bin_width(measurement_type: str) -> Optional[float]:
+    """Tipin varsayılan histogram kutu genişliği; tanımlı değilse None."""
+    registered = MEASUREMENT_TYPES.get(measurement_type)
+    return registered.histogram_bin_width if registered else None
+
+def ordered_type_names(measurement_types: Iterable[str]) -> List[str]:
+    """Tipleri kayıt sırasına, kayıtlı olmayanları sonda alfabetik sıraya dizer."""
+    order = {name: i for i, name in enumerate(MEASUREMENT_TYPES)}
+    return sorted(set(measurement_types), key=lambda name: (order.get(name, len(order)), name))
+
+def format_file_counts(all_measurements_by_type: Mapping[str, Sized]) -> str:
+    """Örn: 'Toplam 2 sıcaklık dosyası ve 2 nem dosyası bulundu.'"""
+    parts = [f"{len(measurements)} {measurement_type} dosyası"
+             for measurement_type, measurements in all_measurements_by_type.items()]
+    if not parts:
+        return "Hiç ölçüm dosyası bulunamadı."
+    counts = parts[0] if len(parts) == 1 else f"{', '.join(parts[:-1])} ve {parts[-1]}"
+    return f"Toplam {counts} bulundu."
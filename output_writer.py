@@ -1,16 +1,120 @@
 # output_writer.py
 
+import csv
+import io
+import json
 import os
-from typing import Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence
 from measurement import MeasurementData
+from measurement_types import unit_for
+
+# Sonuçların metin dosyasındaki yerleşimleri (stratejinin output_layout özniteliği):
+# 'value' başlık başına tek değer, 'single_line' tek satıra yazılan sözlük (örn. 'p5: 1.2, p95: 3.4'),
+# 'frequency' başlık başına değer/adet bloğu, 'series' başlık başına zaman etiketli satır bloğu
+OUTPUT_LAYOUTS = ('value', 'single_line', 'frequency', 'series')
+
+# Desteklenen çıktı biçimleri: strateji başına Türkçe metin dosyaları ve ölçüm tipi başına,
+# her satırı bir dosya ve her sütunu bir hesaplama olan makine tarafından okunabilir tablolar
+OUTPUT_FORMATS = ('txt', 'csv', 'jsonl')
+TABLE_FORMATS = ('csv', 'jsonl')
+DEFAULT_WRITE_WORKERS = 4
+
+# Tablolarda her satırın başındaki dosya bilgisi sütunları
+TABLE_KEY_COLUMNS = ('id', 'ölçüm', 'yer', 'tarih')
+
+# Eşzamanlı yazmada konsol mesajlarının satır ortasında karışmaması için
+_print_lock = threading.Lock()
+
+def _report(message: str):
+    with _print_lock:
+        print(message)
+
+class OutputWriteError(Exception):
+    """Sonuç dosyası yazılamadığında fırlatılır; var olan dosya bozulmadan kalır."""
+    pass
+
+@dataclass
+class WriteJob:
+    """write_batch ile yazılacak tek bir sonuç dosyası (write_results argümanları)."""
+    results: Dict[str, any]
+    measurement_type: str
+    calculation_name: str
+    is_global: bool = False
+    layout: str = 'value'
+
+@dataclass
+class WriteOutcome:
+    """Bir yazma işinin sonucu: başarılıysa dosya yolu, değilse hata."""
+    job: WriteJob
+    path: Optional[str] = None
+    error: Optional[Exception] = None
+
+def format_result_value(value: any) -> str:
+    """Sonuç değerini yazar; sözlükler 'anahtar: değer, ...' biçiminde tek satıra yazılır."""
+    if isinstance(value, dict):
+        return ", ".join(f"{key}: {item}" for key, item in value.items())
+    return str(value)
+
+def table_row(data: MeasurementData, results: Dict[str, any]) -> Dict[str, any]:
+    """Dosya bilgisi sütunları ve hesaplama sonuçlarından bir tablo satırı oluşturur."""
+    return {'id': data.id, 'ölçüm': data.measurement_type, 'yer': data.location,
+            'tarih': data.date.isoformat(), **results}
+
+def atomic_write(file_path: str, content: str):
+    """
+    İçeriği aynı klasördeki geçici dosyaya tek seferde yazar ve hedefin yerine koyar.
+    Yazma yarıda kalırsa hedef dosya eski haliyle kalır; geçici dosya silinir. Geçici dosya
+    yeniden adlandırılmadan önce diske zorlanır (fsync); böylece sistem çökse de hedef ya eski
+    ya da yeni içeriğin tamamını taşır, hiçbir zaman boş veya yarım kalmaz.
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 class OutputWriter:
-    """Hesaplama sonuçlarını dosyalara yazmak için sınıf."""
+    """
+    Hesaplama sonuçlarını dosyalara yazmak için sınıf.
+
+    Her dosyanın içeriği önce bellekte oluşturulur ve geçici dosya + yeniden adlandırma ile
+    tek seferde yazılır; yarıda kalan bir çalıştırma kısmi dosya bırakmaz. Birbirinden bağımsız
+    dosyalar write_batch ile iş parçacıklarında eşzamanlı yazılabilir.
+
+    formats: 'txt' (strateji başına metin dosyaları), 'csv' ve 'jsonl' (ölçüm tipi başına,
+    her dosya için bir satır ve her hesaplama için bir sütun içeren tablolar).
+    """
 
-    def __init__(self, output_root_folder: str):
+    def __init__(self, output_root_folder: str, formats: Sequence[str] = ('txt',),
+                 max_workers: int = DEFAULT_WRITE_WORKERS):
+        unknown = [name for name in formats if name not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {', '.join(unknown)}. Geçerli biçimler: {', '.join(OUTPUT_FORMATS)}")
         self.output_root_folder = os.path.join(output_root_folder, "sonuc")
+        self.formats = tuple(dict.fromkeys(formats))
+        self.max_workers = max_workers
         os.makedirs(self.output_root_folder, exist_ok=True) # Sonuç klasörünü oluştur
 
+    @property
+    def writes_text(self) -> bool:
+        return 'txt' in self.formats
+
+    @property
+    def table_formats(self) -> List[str]:
+        """Seçili tablo biçimleri (csv, jsonl)."""
+        return [name for name in self.formats if name in TABLE_FORMATS]
+
     def _get_output_path(self, measurement_type: str, calculation_name: str, is_global: bool = False) -> str:
         """
         Çıktı dosyasının tam yolunu oluşturur.
@@ -26,48 +130,236 @@ class OutputWriter:
 
         return os.path.join(type_folder, filename)
 
+    def render_results(self, results: Dict[str, any], calculation_name: str, is_global: bool = False,
+                       measurement_type: Optional[str] = None, layout: str = 'value') -> str:
+        """
+        write_results'ın dosyaya yazacağı metni oluşturur (biçim için bkz. write_results).
+        Biçimi layout (stratejinin output_layout veya global_output_layout değeri) belirler.
+        Frekans ve histogram satırlarındaki birim measurement_type'ın kayıtlı biriminden alınır.
+        """
+        if layout not in OUTPUT_LAYOUTS:
+            raise ValueError(f"Geçersiz çıktı yerleşimi: '{layout}'")
+        f = io.StringIO()
+        unit = unit_for(measurement_type) if measurement_type else ''
+        if layout == 'frequency':
+            # Frekans çıktısı özel format istiyor (global histogram da lokal ile aynı biçimde, tek blok)
+            # Örnek:
+            # id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011
+            # 9 Derece 8 defa ölçüldü
+            # 10 Derece 14 defa ölçüldü
+            # ---------------
+            self._write_frequency_blocks(f, results, unit)
+        elif layout == 'series':
+            # Zaman serisi sonuçları (Saatlik Özet, Kayan Pencere, Boşluk Tespiti; globalde saatlik profil)
+            # Örnek:
+            # id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011
+            # 08:00:00 , ortalama: 12.5, minimum: 11.0, maksimum: 14.0
+            # ---------------
+            self._write_series_blocks(f, results)
+        elif is_global:
+            # Global sonuçlar genellikle tek bir anahtar-değer çifti içerir
+            for key, value in results.items(): # Global sonuç {'max': 21} veya {'ortalama': 15.5} gibi
+                f.write(f"{key}: {format_result_value(value) if layout == 'single_line' else value}\n")
+        else:
+            # Diğer sonuçlar (Ortalama, Maksimum, Minimum, Medyan, Standart Sapma)
+            # Örnek: id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011 , max: 20
+            for header_info, value in results.items():
+                f.write(f"{header_info} , {calculation_name.lower()}: {format_result_value(value)}\n")
+        return f.getvalue()
+
     def write_results(self, 
                       results: Dict[str, Dict[str, any]], 
                       measurement_type: str, 
                       calculation_name: str, 
-                      is_global: bool = False):
+                      is_global: bool = False,
+                      skip_unchanged: bool = False,
+                      layout: str = 'value'):
         """
         Hesaplama sonuçlarını ilgili dosyaya yazar.
 
         Args:
             results: Hesaplama sonuçlarını içeren sözlük. Formatı hesaplama türüne göre değişir.
                      Örn: {'id:1 ölçüm: sıcaklık ...': 'max: 20', ...} veya frekans için daha karmaşık.
-            measurement_type: 'sıcaklık' veya 'nem'.
+            measurement_type: Ölçüm tipi (örn. 'sıcaklık'); sonuç klasörünü ve frekans birimini belirler.
             calculation_name: Hesaplama stratejisinin adı (Ortalama, Maksimum vb.).
             is_global: Global bir hesaplama sonucu mu olduğu.
+            skip_unchanged: True ise dosya zaten aynı içeriğe sahipse dosyaya hiç dokunulmaz.
+            layout: Sonuçların yerleşimi (bkz. OUTPUT_LAYOUTS); stratejinin output_layout değeri.
+
+        Dönüş değeri: yazılan dosyanın yolu. Dosya yazılamazsa OutputWriteError fırlatılır.
         """
+        content = self.render_results(results, calculation_name, is_global, measurement_type, layout)
         output_file_path = self._get_output_path(measurement_type, calculation_name, is_global)
+        if skip_unchanged and self._has_content(output_file_path, content):
+            _report(f"Sonuçlar değişmedi, dosyaya dokunulmadı: {output_file_path}")
+            return output_file_path
+        self._write_file(output_file_path, content)
+        return output_file_path
 
+    @staticmethod
+    def _write_file(output_file_path: str, content: str):
         try:
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                if is_global:
-                    # Global sonuçlar genellikle tek bir anahtar-değer çifti içerir
-                    for key, value in results.items(): # Global sonuç {'max': 21} veya {'ortalama': 15.5} gibi
-                        f.write(f"{key}: {value}\n")
-                elif calculation_name == "Frekans":
-                    # Frekans çıktısı özel format istiyor
-                    # Örnek:
-                    # id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011
-                    # 9 Derece 8 defa ölçüldü
-                    # 10 Derece 14 defa ölçüldü
-                    # ---------------
-                    for header_info, freq_data in results.items():
-                        f.write(f"{header_info}\n")
-                        for value, count in freq_data.items():
-                            f.write(f"{value} Derece {count} defa ölçüldü\n")
-                        f.write("---------------\n")
+            atomic_write(output_file_path, content)
+        except OSError as e:
+            _report(f"Sonuçlar '{output_file_path}' dosyasına yazılırken hata oluştu: {e}")
+            raise OutputWriteError(f"'{output_file_path}' yazılamadı: {e}") from e
+        _report(f"Sonuçlar başarıyla yazıldı: {output_file_path}")
+
+    def write_batch(self, jobs: Sequence[WriteJob], skip_unchanged: bool = False) -> List[WriteOutcome]:
+        """
+        Birbirinden bağımsız sonuç dosyalarını max_workers iş parçacığıyla eşzamanlı yazar.
+        Bir dosyanın hatası diğerlerini durdurmaz; sonuçlar işlerin sırasıyla döner.
+        """
+        def write(job: WriteJob) -> WriteOutcome:
+            try:
+                return WriteOutcome(job, path=self.write_results(
+                    job.results, job.measurement_type, job.calculation_name, job.is_global, skip_unchanged, job.layout
+                ))
+            except OutputWriteError as e:
+                return WriteOutcome(job, error=e)
+
+        if self.max_workers <= 1 or len(jobs) <= 1:
+            return [write(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            return list(executor.map(write, jobs))
+
+    def _get_table_path(self, measurement_type: str, file_format: str, is_global: bool = False) -> str:
+        """
+        Tablo dosyasının tam yolunu oluşturur.
+        Örn: sonuc/sıcaklık/lokal_sonuclar.csv veya sonuc/sıcaklık/global_sonuclar.jsonl
+        """
+        type_folder = os.path.join(self.output_root_folder, measurement_type)
+        os.makedirs(type_folder, exist_ok=True)
+        return os.path.join(type_folder, f"{'global' if is_global else 'lokal'}_sonuclar.{file_format}")
+
+    def write_table(self, rows: List[Dict[str, any]], measurement_type: str,
+                    calculation_names: Sequence[str], is_global: bool = False,
+                    layouts: Optional[Mapping[str, str]] = None) -> List[str]:
+        """
+        Seçili tablo biçimlerinde (csv, jsonl) tek dosya yazar: her satır bir girdi dosyası
+        (global tabloda tek satır), sütunlar dosya bilgileri ve hesaplamalardır.
+
+        JSON Lines'ta sonuçlar olduğu gibi (sözlükler iç içe nesne olarak) yazılır. CSV'de
+        layouts'ta 'single_line' yerleşimli sözlük sonuçlar (örn. Persentil) 'Persentil p5' gibi
+        ayrı sütunlara açılır; seri ve frekans sonuçları hücreye JSON metni olarak yazılır.
+        Dönüş değeri: yazılan dosyaların yolları. Yazılamayan dosya için OutputWriteError fırlatılır.
+        """
+        written_paths = []
+        for file_format in self.table_formats:
+            if file_format == 'csv':
+                content = self.render_csv(rows, calculation_names, layouts)
+            else:
+                content = self.render_jsonl(rows, calculation_names)
+            output_file_path = self._get_table_path(measurement_type, file_format, is_global)
+            self._write_file(output_file_path, content)
+            written_paths.append(output_file_path)
+        return written_paths
+
+    @staticmethod
+    def render_jsonl(rows: List[Dict[str, any]], calculation_names: Sequence[str]) -> str:
+        """Her satır için bir JSON nesnesi (anahtar sütunlar, ardından hesaplamalar)."""
+        lines = []
+        for row in rows:
+            record = {column: row[column] for column in TABLE_KEY_COLUMNS if column in row}
+            record.update((name, row[name]) for name in calculation_names if name in row)
+            lines.append(json.dumps(record, ensure_ascii=False, default=str))
+        return "".join(f"{line}\n" for line in lines)
+
+    @staticmethod
+    def render_csv(rows: List[Dict[str, any]], calculation_names: Sequence[str],
+                   layouts: Optional[Mapping[str, str]] = None) -> str:
+        """
+        Başlık satırı ve her girdi dosyası için bir satır; eksik sonuçlar boş bırakılır.
+        layouts: {hesaplama adı: yerleşim}; verilmeyen hesaplamalar 'value' sayılır.
+        """
+        layouts = layouts or {}
+        key_columns = [column for column in TABLE_KEY_COLUMNS if any(column in row for row in rows)]
+        # Tek satırlık sözlük sonuçların alt anahtarları ilk görüldükleri sırayla sütun olur
+        expanded = {
+            name: list(dict.fromkeys(key for row in rows if isinstance(row.get(name), dict) for key in row[name]))
+            for name in calculation_names if layouts.get(name) == 'single_line'
+        }
+        header = list(key_columns)
+        for name in calculation_names:
+            if name in expanded:
+                header.extend(f"{name} {key}" for key in expanded[name])
+            else:
+                header.append(name)
+
+        f = io.StringIO()
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        for row in rows:
+            cells = [row.get(column, '') for column in key_columns]
+            for name in calculation_names:
+                value = row.get(name)
+                if name in expanded:
+                    cells.extend((value or {}).get(key, '') for key in expanded[name])
+                elif value is None:
+                    cells.append('')
+                elif isinstance(value, dict):
+                    cells.append(json.dumps(value, ensure_ascii=False, default=str))
                 else:
-                    # Diğer sonuçlar (Ortalama, Maksimum, Minimum, Medyan, Standart Sapma)
-                    # Örnek: id:1 ölçüm: sıcaklık - yer: YER - tarih: 11.11.2011 , max: 20
-                    for header_info, value in results.items():
-                        f.write(f"{header_info} , {calculation_name.lower()}: {value}\n")
-            print(f"Sonuçlar başarıyla yazıldı: {output_file_path}")
-            return output_file_path
-        except Exception as e:
-            print(f"Sonuçlar '{output_file_path}' dosyasına yazılırken hata oluştu: {e}")
-            return None
\ No newline at end of file
+                    cells.append(value)
+            writer.writerow(cells)
+        return f.getvalue()
+
+    @staticmethod
+    def _has_content(file_path: str, content: str) -> bool:
+        """Dosya var ve içeriği verilen metinle aynı mı."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read() == content
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_frequency_blocks(f, results: Dict[str, Dict[any, int]], unit: str = ''):
+        """
+        Her başlık için frekans bloğu: başlık satırı, her değer (veya kutu) için bir satır ve ayraç.
+        unit boşsa (tipi belirsiz gruplu sonuçlar) satırda birim yerine 'değeri' yazılır.
+        """
+        unit = unit or 'değeri'
+        for header_info, freq_data in results.items():
+            f.write(f"{header_info}\n")
+            for value, count in freq_data.items():
+                f.write(f"{value} {unit} {count} defa ölçüldü\n")
+            f.write("---------------\n")
+
+    @staticmethod
+    def _write_series_blocks(f, results: Dict[str, Dict[str, any]]):
+        """Her başlık için bir blok: başlık satırı, her zaman etiketi için bir satır ve ayraç."""
+        for header_info, series in results.items():
+            f.write(f"{header_info}\n")
+            for label, value in series.items():
+                f.write(f"{label} , {format_result_value(value)}\n")
+            f.write("---------------\n")
+
+    def _get_grouped_output_path(self, group_by: List[str], calculation_name: str) -> str:
+        """
+        Gruplu sonuç dosyasının tam yolunu oluşturur.
+        Örn: sonuc/gruplu/yer_ay/ortalamalar.txt (gruplama yoksa sonuc/gruplu/tümü/...)
+        """
+        group_folder = os.path.join(self.output_root_folder, "gruplu", "_".join(group_by) or "tümü")
+        os.makedirs(group_folder, exist_ok=True)
+        return os.path.join(group_folder, f"{calculation_name.lower().replace(' ', '')}lar.txt")
+
+    def write_grouped_results(self, results: Dict[str, any], group_by: List[str], calculation_name: str,
+                              measurement_type: Optional[str] = None, layout: str = 'value'):
+        """
+        Gruplu hesaplama sonuçlarını yazar.
+
+        Args:
+            results: {grup başlığı: sonuç}. Örn: {'yer: YER - ay: 11.2011': 15.2, ...}
+            group_by: Gruplama alanları (klasör adını belirler).
+            calculation_name: Hesaplama stratejisinin adı.
+            measurement_type: Gruplardaki dosyaların tek ortak tipi varsa o tip (frekans birimi için).
+            layout: Sonuçların yerleşimi (bkz. OUTPUT_LAYOUTS).
+
+        Biçim lokal sonuçlarla aynıdır; yalnızca dosya başlığı yerine grup başlığı yazılır.
+        Dosya yazılamazsa OutputWriteError fırlatılır.
+        """
+        output_file_path = self._get_grouped_output_path(group_by, calculation_name)
+        self._write_file(output_file_path, self.render_results(results, calculation_name, is_global=False,
+                                                                   measurement_type=measurement_type, layout=layout))
+        return output_file_path
\ No newline at end of file
@@ -0,0 +1,221 @@
+# parse_cache.py
+
+import datetime
+import hashlib
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Optional, Tuple
+from measurement import MeasurementData, TIME_TYPECODE, VALUE_TYPECODE
+
+# Önbellek dosya biçimi (küçük endian):
+#   magic (4 bayt) | sürüm (uint16) | anahtar uzunluğu (uint16) | anahtar (utf-8)
+#   | başlık uzunluğu (uint32) | başlık (utf-8, alanlar '\x1f' ile ayrılır)
+#   | ayrıştırılamayan satır sayısı (uint32)
+#   | nokta sayısı (uint32) | zaman sütunu (int32 * n) | değer sütunu (float64 * n)
+#   | crc32 (uint32, kendisinden önceki tüm baytlar üzerinden)
+CACHE_MAGIC = b'MPC\x00'
+CACHE_VERSION = 2 # 2: ayrıştırılamayan satır sayısı da saklanır
+CACHE_SUFFIX = '.mpc'
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024 # 512 MB
+
+_PREFIX = struct.Struct('<4sHH')
+_UINT32 = struct.Struct('<I')
+_FIELD_SEPARATOR = '\x1f'
+
+class CacheCorruptError(ValueError):
+    """Önbellek dosyası okunamadığında veya sağlama toplamı tutmadığında fırlatılır."""
+    pass
+
+class ParsedDataCache:
+    """
+    Ayrıştırılmış MeasurementData nesnelerini diskte ikili biçimde saklar.
+
+    Her kaynak dosya için ayrı bir önbellek dosyası tutulur. Anahtar varsayılan olarak
+    dosya yolu, boyutu ve değiştirilme zamanıdır; key_mode='content' ile dosya içeriğinin
+    SHA-256 özeti kullanılır. Sürümü, anahtarı veya sağlama toplamı tutmayan kayıtlar
+    yok sayılır ve dosya yeniden ayrıştırılır. Toplam boyut max_bytes değerini aşarsa en
+    uzun süredir kullanılmayan kayıtlar silinir.
+
+    Nesne yalnızca ayarları tuttuğu için paralel okumada işçi süreçlere gönderilebilir.
+    """
+
+    def __init__(self, cache_folder: str, key_mode: str = 'stat', max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        if key_mode not in ('stat', 'content'):
+            raise ValueError(f"Geçersiz önbellek anahtar modu: '{key_mode}'")
+        self.cache_folder = cache_folder
+        self.key_mode = key_mode
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_folder, exist_ok=True)
+
+    @classmethod
+    def for_root(cls, root_folder: str, **kwargs) -> 'ParsedDataCache':
+        """Ölçüm kök klasörü için varsayılan konumda (sonuc/.cache) bir önbellek oluşturur."""
+        return cls(os.path.join(root_folder, 'sonuc', '.cache'), **kwargs)
+
+    def _entry_path(self, file_path: str) -> str:
+        """Kaynak dosyaya karşılık gelen önbellek dosyasının yolunu döndürür."""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_folder, digest + CACHE_SUFFIX)
+
+    def _source_key(self, file_path: str) -> str:
+        """Kaynak dosyanın güncel önbellek anahtarını hesaplar."""
+        if self.key_mode == 'content':
+            sha = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    sha.update(block)
+            return f"sha256:{sha.hexdigest()}"
+        stat = os.stat(file_path)
+        return f"stat:{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def load(self, file_path: str) -> Optional[Tuple[MeasurementData, int]]:
+        """
+        Kaynak dosya değişmemişse önbellekteki (veri, ayrıştırılamayan satır sayısı) çiftini
+        döndürür, aksi halde None. Bozuk kayıtlar silinir.
+        """
+        entry_path = self._entry_path(file_path)
+        try:
+            with open(entry_path, 'rb') as f:
+                blob = f.read()
+        except OSError:
+            return None
+
+        try:
+            key, data, rejected_count = self._decode(blob)
+        except CacheCorruptError:
+            self._remove(entry_path)
+            return None
+
+        if key != self._source_key(file_path):
+            return None # Kaynak dosya değişmiş
+
+        try:
+            os.utime(entry_path) # LRU tahliyesi için son kullanım zamanını güncelle
+        except OSError:
+            pass
+        data.file_path = file_path
+        return data, rejected_count
+
+    def store(self, file_path: str, data: MeasurementData, rejected_count: int = 0):
+        """
+        Ayrıştırılmış veriyi ve ayrıştırılamayan satır sayısını önbelleğe yazar
+        (geçici dosya + yeniden adlandırma ile).
+        """
+        entry_path = self._entry_path(file_path)
+        blob = self._encode(self._source_key(file_path), data, rejected_count)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            self._remove(tmp_path)
+
+    def enforce_size_limit(self) -> int:
+        """Toplam boyut max_bytes değerini aşıyorsa en eski kayıtları siler; silinen kayıt sayısını döndürür."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_folder) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(CACHE_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Tüm önbellek kayıtlarını siler."""
+        with os.scandir(self.cache_folder) as it:
+            for entry in it:
+                if entry.name.endswith(CACHE_SUFFIX):
+                    self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _encode(key: str, data: MeasurementData, rejected_count: int = 0) -> bytes:
+        """MeasurementData nesnesini önbellek biçimine çevirir."""
+        key_bytes = key.encode('utf-8')
+        header_bytes = _FIELD_SEPARATOR.join(
+            (data.id, data.measurement_type, data.location, data.date.isoformat())
+        ).encode('utf-8')
+        time_column = array(TIME_TYPECODE, data.time_column)
+        value_column = array(VALUE_TYPECODE, data.value_column)
+        if sys.byteorder == 'big':
+            time_column.byteswap()
+            value_column.byteswap()
+
+        body = b''.join((
+            _PREFIX.pack(CACHE_MAGIC, CACHE_VERSION, len(key_bytes)), key_bytes,
+            _UINT32.pack(len(header_bytes)), header_bytes,
+            _UINT32.pack(rejected_count),
+            _UINT32.pack(len(value_column)), time_column.tobytes(), value_column.tobytes(),
+        ))
+        return body + _UINT32.pack(zlib.crc32(body))
+
+    @staticmethod
+    def _decode(blob: bytes) -> Tuple[str, MeasurementData, int]:
+        """Önbellek baytlarını (anahtar, MeasurementData, ayrıştırılamayan satır sayısı) olarak çözer."""
+        try:
+            if len(blob) < _PREFIX.size + _UINT32.size:
+                raise CacheCorruptError("Önbellek dosyası çok kısa.")
+            body, (checksum,) = blob[:-_UINT32.size], _UINT32.unpack_from(blob, len(blob) - _UINT32.size)
+            if zlib.crc32(body) != checksum:
+                raise CacheCorruptError("Önbellek sağlama toplamı tutmuyor.")
+
+            magic, version, key_length = _PREFIX.unpack_from(body, 0)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                raise CacheCorruptError("Önbellek biçimi veya sürümü uyumsuz.")
+            offset = _PREFIX.size
+            key = body[offset:offset + key_length].decode('utf-8')
+            offset += key_length
+
+            (header_length,) = _UINT32.unpack_from(body, offset)
+            offset += _UINT32.size
+            id_, measurement_type, location, date_str = body[offset:offset + header_length].decode('utf-8').split(_FIELD_SEPARATOR)
+            offset += header_length
+
+            (rejected_count,) = _UINT32.unpack_from(body, offset)
+            offset += _UINT32.size
+            (count,) = _UINT32.unpack_from(body, offset)
+            offset += _UINT32.size
+            time_column = array(TIME_TYPECODE)
+            value_column = array(VALUE_TYPECODE)
+            time_end = offset + count * time_column.itemsize
+            value_end = time_end + count * value_column.itemsize
+            if value_end != len(body):
+                raise CacheCorruptError("Önbellek sütun uzunlukları tutmuyor.")
+            time_column.frombytes(body[offset:time_end])
+            value_column.frombytes(body[time_end:value_end])
+            if sys.byteorder == 'big':
+                time_column.byteswap()
+                value_column.byteswap()
+        except (struct.error, UnicodeDecodeError, ValueError) as e:
+            if isinstance(e, CacheCorruptError):
+                raise
+            raise CacheCorruptError(f"Önbellek dosyası çözülemedi: {e}") from e
+
+        return key, MeasurementData(
+            id=id_,
+            measurement_type=measurement_type,
+            location=location,
+            date=datetime.date.fromisoformat(date_str),
+            time_column=time_column,
+            value_column=value_column
+        ), rejected_count
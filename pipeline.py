@@ -0,0 +1,389 @@
+# pipeline.py
+
+import os
+from typing import Callable, Dict, List, Optional
+from calculation_strategies import (ICalculationStrategy, FusedCalculationEngine,
+                                    GlobalAggregator, SeriesSummary)
+from data_parser import MeasurementParseError, MeasurementStream
+from grouped_query import GroupedQuery, format_group_label
+from instrumentation import NULL_INSTRUMENTATION
+from measurement import MeasurementData
+from output_writer import OutputWriteError, OutputWriter, WriteJob, table_row
+from result_cache import MISSING, ResultCache, file_content_key
+from series_join import (DEFAULT_JOIN_TOLERANCE, DERIVED_METRICS, JOINED_TYPE, CorrelationCalculationStrategy,
+                         PairedSeriesSummary, join_series, pair_measurements)
+
+class CalculationCancelled(Exception):
+    """Hesaplama kullanıcı tarafından iptal edildiğinde fırlatılır."""
+    pass
+
+def format_header_info(data: MeasurementData) -> str:
+    """Sonuç dosyalarında kullanılan ölçüm başlığını oluşturur."""
+    return f"id:{data.id} ölçüm: {data.measurement_type} - yer: {data.location} - tarih: {data.date.strftime('%d.%m.%Y')}"
+
+class CalculationPipeline:
+    """
+    Okunmuş ölçüm verileri üzerinde seçili lokal ve global hesaplamaları yapar
+    ve sonuçları OutputWriter ile yazar. Arayüzden bağımsızdır; mesajlar, ilerleme
+    ve iptal kontrolü dışarıdan verilen fonksiyonlarla iletilir.
+
+    result_cache (ResultCache) verilirse lokal sonuçlar (dosya içeriği, strateji) çiftine göre
+    saklanır; tekrar çalıştırmalarda yalnızca önbellekte olmayan çiftler hesaplanır.
+    """
+
+    def __init__(self, output_writer: OutputWriter,
+                 log: Callable[[str], None] = print,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 instrumentation=NULL_INSTRUMENTATION,
+                 result_cache: Optional[ResultCache] = None):
+        self.output_writer = output_writer
+        self.result_cache = result_cache
+        self.instrumentation = instrumentation
+        self.log = log
+        self.progress = progress
+        self.is_cancelled = is_cancelled
+        self._processed_files = 0
+        self._total_files = 0
+
+    def run(self, all_measurements_by_type: Dict[str, List[MeasurementData]],
+            selected_strategies_local: List[ICalculationStrategy],
+            selected_strategies_global: List[ICalculationStrategy]) -> str:
+        """
+        Tüm ölçüm türleri için hesaplamaları yapar.
+        Dönüş değeri: sonunda kullanıcıya gösterilecek durum mesajı.
+        İptal edilirse CalculationCancelled fırlatır.
+        """
+        self._processed_files = 0
+        self._total_files = sum(len(measurements) for measurements in all_measurements_by_type.values())
+        self._report_progress()
+        cache = self.result_cache
+        hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+        overall_status_message = ""
+        for measurement_type, measurements_list in all_measurements_by_type.items():
+            overall_status_message += self.process_measurement_type(
+                measurement_type, measurements_list, selected_strategies_local, selected_strategies_global
+            )
+        if cache is not None and selected_strategies_local:
+            self.log(f"Sonuç önbelleği: {cache.hits - hits} sonuç önbellekten alındı, "
+                     f"{cache.misses - misses} sonuç hesaplandı.")
+        return overall_status_message
+
+    def _report_progress(self):
+        if self.progress:
+            self.progress(self._processed_files, self._total_files)
+
+    def _check_cancelled(self):
+        if self.is_cancelled and self.is_cancelled():
+            raise CalculationCancelled("Hesaplama iptal edildi.")
+
+    def process_measurement_type(self, measurement_type: str, measurements_list: List[MeasurementData],
+                                 selected_strategies_local: List[ICalculationStrategy],
+                                 selected_strategies_global: List[ICalculationStrategy]) -> str:
+        """Belirli bir ölçüm türü için hesaplamaları yönetir."""
+        status_message = ""
+        if not measurements_list:
+            status_message += f"'{measurement_type}' için dosya bulunamadı. Hesaplama atlandı.\n"
+            return status_message
+
+        self.log(f"\n--- {measurement_type.capitalize()} Hesaplamaları ---")
+
+        # Tipe özel ayarı olan stratejiler (örn. histogram kutu genişliği) bu tip için yapılandırılır
+        selected_strategies_local = [strategy.for_measurement_type(measurement_type)
+                                     for strategy in selected_strategies_local]
+        selected_strategies_global = [strategy.for_measurement_type(measurement_type)
+                                      for strategy in selected_strategies_global]
+
+        # Global sonuçlar ham değerler birleştirilmeden, dosya bazındaki kısmi özetlerden hesaplanır
+        aggregator = (GlobalAggregator(selected_strategies_global, self.instrumentation)
+                      if selected_strategies_global else None)
+
+        # Lokal (dosya bazında) hesaplamalar: seçili tüm stratejiler her dosya için birlikte hesaplanır
+        self._calculate_and_write_local_results(measurement_type, measurements_list, selected_strategies_local, aggregator)
+
+        if aggregator:
+            self._calculate_and_write_global_results(measurement_type, aggregator)
+
+        return status_message
+
+    def _calculate_and_write_local_results(self, measurement_type: str, measurements_list: List[MeasurementData],
+                                           strategies: List[ICalculationStrategy],
+                                           aggregator: Optional[GlobalAggregator] = None):
+        """
+        Lokal (dosya bazında) hesaplamaları yapar ve sonuçları yazar.
+        aggregator verilirse her dosyanın özeti aynı geçişte global özetlere eklenir.
+        Lokal hesaplama yoksa ve dosyanın hazır özeti (ikili biçimin alt bilgisi) global
+        stratejilere yetiyorsa nokta verisi hiç okunmaz.
+        """
+        engine = FusedCalculationEngine(strategies, self.instrumentation, self.result_cache)
+        local_results = {strategy.name: {} for strategy in strategies}
+        table_rows = [] # Tablo biçimleri (csv, jsonl) için dosya başına bir satır
+        collect_rows = bool(strategies and self.output_writer.table_formats)
+        with self.instrumentation.stage('hesaplama'):
+            for data in measurements_list:
+                self._check_cancelled()
+                if not strategies and aggregator and aggregator.add_statistics(data.statistics):
+                    results, errors = {}, {} # Hazır özet yetti; nokta verisi okunmadı
+                elif isinstance(data, MeasurementStream):
+                    results, errors = self._calculate_stream(data, strategies, aggregator)
+                else:
+                    try:
+                        values = data.values # İndeksten gelen dosyalar burada yüklenir
+                    except MeasurementParseError as e:
+                        self.log(f"Uyarı ({measurement_type} - {data.id}): Dosya ayrıştırılamadı: {e}")
+                        self._processed_files += 1
+                        self._report_progress()
+                        continue
+                    summary = SeriesSummary(values, memoryview(data.time_column))
+                    if aggregator:
+                        aggregator.add(summary)
+                    results, errors = engine.calculate_summary(summary) if strategies else ({}, {})
+                if strategies:
+                    header_info = format_header_info(data)
+                    for strategy_name, result in results.items():
+                        local_results[strategy_name][header_info] = result
+                    for strategy_name, e in errors.items():
+                        self.log(f"Uyarı ({measurement_type} - {data.id} - {strategy_name}): {e}")
+                    if collect_rows and results:
+                        table_rows.append(table_row(data, results))
+                self._processed_files += 1
+                self._report_progress()
+
+        if self.output_writer.writes_text:
+            self._write_jobs([WriteJob(local_results[strategy.name], measurement_type, strategy.name,
+                                       layout=strategy.output_layout)
+                              for strategy in strategies if local_results[strategy.name]])
+        if table_rows:
+            self._write_table(table_rows, measurement_type, strategies, is_global=False)
+
+    def _calculate_stream(self, stream: MeasurementStream, strategies: List[ICalculationStrategy],
+                          aggregator: Optional[GlobalAggregator]):
+        """
+        Büyük bir dosyayı parça parça okuyarak lokal sonuçları hesaplar; tüm seri hiçbir zaman
+        belleğe alınmaz. Her parçanın özeti hem dosyanın kendi birleştiricisine hem de (varsa)
+        global birleştiriciye eklenir. Bellek kullanımı dosya boyutundan bağımsızdır.
+
+        Sonuç önbelleğinde anahtar dosya içeriğinin özetidir; tüm sonuçlar önbellekteyse ve
+        global hesaplama yoksa dosya hiç ayrıştırılmaz.
+        """
+        cache = self.result_cache
+        cached_results = {}
+        if cache is not None and strategies:
+            try:
+                series_key = file_content_key(stream.file_path)
+            except OSError:
+                cache = None # Okuma hatası akış sırasında raporlanır
+        if cache is not None and strategies:
+            for strategy in strategies:
+                result = cache.get(series_key, strategy)
+                if result is not MISSING:
+                    cached_results[strategy.name] = result
+            strategies = [strategy for strategy in strategies if strategy.name not in cached_results]
+            if not strategies and aggregator is None:
+                return cached_results, {}
+
+        local_aggregator = GlobalAggregator(strategies, self.instrumentation)
+        for time_column, value_column in stream.iter_batches():
+            self._check_cancelled()
+            summary = SeriesSummary(memoryview(value_column), memoryview(time_column))
+            local_aggregator.add(summary)
+            if aggregator:
+                aggregator.add(summary)
+        results, errors = local_aggregator.calculate()
+        if cache is not None:
+            for strategy in strategies:
+                if strategy.name in results:
+                    cache.put(series_key, strategy, results[strategy.name])
+        return {**cached_results, **results}, errors
+
+    def _calculate_and_write_global_results(self, measurement_type: str, aggregator: GlobalAggregator):
+        """Global hesaplamaları birleştirilmiş kısmi özetlerden yapar ve sonuçları yazar."""
+        if not aggregator.count:
+            for strategy in aggregator.strategies:
+                self.log(f"Uyarı ({measurement_type} - Global - {strategy.name}): Global hesaplama için veri bulunamadı.")
+            return
+
+        with self.instrumentation.stage('hesaplama'):
+            results, errors = aggregator.calculate()
+        for strategy_name, e in errors.items():
+            self.log(f"Uyarı ({measurement_type} - Global - {strategy_name}): {e}")
+
+        if self.output_writer.writes_text:
+            self._write_jobs([
+                WriteJob({f"Tüm {measurement_type} değerlerinin {strategy.name.lower()}": results[strategy.name]},
+                         measurement_type, strategy.name, is_global=True, layout=strategy.global_output_layout)
+                for strategy in aggregator.strategies if strategy.name in results
+            ])
+        if results and self.output_writer.table_formats:
+            self._write_table([{'ölçüm': measurement_type, **results}], measurement_type,
+                              aggregator.strategies, is_global=True)
+
+    def run_grouped(self, all_measurements_by_type: Dict[str, List[MeasurementData]],
+                    strategies: List[ICalculationStrategy], query: GroupedQuery) -> str:
+        """
+        Seçili stratejileri sorgunun filtresine uyan dosyalar üzerinde grup başına hesaplar
+        ve OutputWriter'ın gruplu düzeniyle yazar. İptal edilirse CalculationCancelled fırlatır.
+        """
+        selected = query.select(all_measurements_by_type)
+        self._processed_files = 0
+        self._total_files = len(selected)
+        self._report_progress()
+        if not selected:
+            return "Filtreye uyan dosya bulunamadı. Gruplu hesaplama atlandı.\n"
+
+        group_title = ", ".join(query.group_by) or "tümü"
+        self.log(f"\n--- Gruplu Hesaplamalar ({group_title}) ---")
+        segments = query.build_segments(self._count_progress(selected), self.log, self.is_cancelled)
+        self._check_cancelled()
+        grouped_results = query.reduce(segments, strategies)
+
+        # Tüm gruplar tek bir tipten oluşuyorsa frekans çıktısında o tipin birimi kullanılır
+        selected_types = {data.measurement_type for _, data in selected}
+        unit_type = next(iter(selected_types)) if len(selected_types) == 1 else None
+
+        results_by_strategy = {strategy.name: {} for strategy in strategies}
+        for key, (results, errors) in grouped_results.items():
+            group_label = format_group_label(query.group_by, key)
+            for strategy_name, result in results.items():
+                results_by_strategy[strategy_name][group_label] = result
+            for strategy_name, e in errors.items():
+                self.log(f"Uyarı ({group_label} - {strategy_name}): {e}")
+
+        for strategy in strategies:
+            if not results_by_strategy[strategy.name]:
+                continue
+            try:
+                with self.instrumentation.stage('yazma'):
+                    output_path = self.output_writer.write_grouped_results(
+                        results_by_strategy[strategy.name], query.group_by, strategy.name, unit_type,
+                        strategy.output_layout
+                    )
+            except OutputWriteError as e:
+                self.log(f"- {strategy.name} (Gruplu: {group_title}) kaydedilemedi: {e}")
+                continue
+            self.log(f"- {strategy.name} (Gruplu: {group_title}) sonuçları kaydedildi: {os.path.basename(output_path)}")
+        return f"{len(segments)} grup için {len(selected)} dosya hesaplandı.\n"
+
+    def run_joined(self, all_measurements_by_type: Dict[str, List[MeasurementData]],
+                   strategies: List[ICalculationStrategy], tolerance: int = DEFAULT_JOIN_TOLERANCE) -> str:
+        """
+        Aynı yer ve tarihli sıcaklık ve nem dosyalarını zamana göre eşleştirir; her çift için
+        sıcaklık-nem korelasyonunu ve türetilmiş büyüklüklerin (DERIVED_METRICS) serilerini hesaplar.
+        Seçili stratejiler her türetilmiş seriye lokal olarak, global destekleyenler ise tüm
+        çiftlerin birleşimine uygulanır. Sonuçlar her büyüklüğün kendi tip klasörüne, korelasyon
+        JOINED_TYPE klasörüne yazılır. İptal edilirse CalculationCancelled fırlatır.
+        """
+        pairs = pair_measurements(all_measurements_by_type)
+        self._processed_files = 0
+        self._total_files = len(pairs)
+        self._report_progress()
+        if not pairs:
+            return "Aynı yer ve tarihli sıcaklık ve nem dosyası bulunamadı. Birleşik hesaplama atlandı.\n"
+
+        self.log(f"\n--- Birleşik Sıcaklık-Nem Hesaplamaları ({len(pairs)} yer/tarih) ---")
+        correlation = CorrelationCalculationStrategy()
+        correlation_aggregator = GlobalAggregator([correlation], self.instrumentation)
+        correlations = {}
+        metric_strategies = {metric: [strategy.for_measurement_type(metric) for strategy in strategies]
+                             for metric in DERIVED_METRICS}
+        engines = {metric: FusedCalculationEngine(metric_strategies[metric], self.instrumentation, self.result_cache)
+                   for metric in DERIVED_METRICS}
+        aggregators = {metric: GlobalAggregator([strategy for strategy in metric_strategies[metric]
+                                                 if strategy.supports_global], self.instrumentation)
+                       for metric in DERIVED_METRICS}
+        local_results = {metric: {strategy.name: {} for strategy in strategies} for metric in DERIVED_METRICS}
+        matched_points = 0
+
+        with self.instrumentation.stage('hesaplama'):
+            for _, temperature_files, humidity_files in self._count_progress(pairs):
+                self._check_cancelled()
+                try:
+                    with self.instrumentation.stage('birleştirme'):
+                        joined = join_series(temperature_files, humidity_files, tolerance)
+                except MeasurementParseError as e:
+                    self.log(f"Uyarı ({temperature_files[0].location} - {temperature_files[0].date:%d.%m.%Y}): "
+                             f"Dosya ayrıştırılamadı: {e}")
+                    continue
+                header_info = joined.header_info
+                if not len(joined):
+                    self.log(f"Uyarı ({header_info}): Eşleşen ölçüm zamanı bulunamadı.")
+                    continue
+                matched_points += len(joined)
+
+                summary = PairedSeriesSummary(joined.temperature, joined.humidity, joined.times)
+                correlation_aggregator.add(summary)
+                try:
+                    correlations[header_info] = correlation.calculate_from_summary(summary)
+                except ValueError as e:
+                    self.log(f"Uyarı ({header_info} - {correlation.name}): {e}")
+
+                for metric, derive in DERIVED_METRICS.items():
+                    try:
+                        column = derive(joined.temperature, joined.humidity)
+                    except ValueError as e:
+                        self.log(f"Uyarı ({header_info} - {metric}): {e}")
+                        continue
+                    metric_summary = SeriesSummary(column, joined.times)
+                    aggregators[metric].add(metric_summary)
+                    results, errors = engines[metric].calculate_summary(metric_summary) if strategies else ({}, {})
+                    for strategy_name, result in results.items():
+                        local_results[metric][strategy_name][header_info] = result
+                    for strategy_name, e in errors.items():
+                        self.log(f"Uyarı ({header_info} - {metric} - {strategy_name}): {e}")
+
+        if self.output_writer.writes_text:
+            jobs = [WriteJob(correlations, JOINED_TYPE, correlation.name, layout=correlation.output_layout)
+                    ] if correlations else []
+            jobs.extend(WriteJob(local_results[metric][strategy.name], metric, strategy.name,
+                                 layout=strategy.output_layout)
+                        for metric in DERIVED_METRICS for strategy in strategies
+                        if local_results[metric][strategy.name])
+            self._write_jobs(jobs)
+        self._calculate_and_write_global_results(JOINED_TYPE, correlation_aggregator)
+        for metric, aggregator in aggregators.items():
+            if aggregator.strategies:
+                self._calculate_and_write_global_results(metric, aggregator)
+        return f"{len(pairs)} yer/tarih için {matched_points} eşleşen sıcaklık-nem ölçümü hesaplandı.\n"
+
+    def _count_progress(self, selected):
+        """Seçili dosyaları dolaşırken ilerlemeyi bildirir."""
+        for item in selected:
+            yield item
+            self._processed_files += 1
+            self._report_progress()
+
+    def _write_jobs(self, jobs: List[WriteJob]):
+        """Sonuç dosyalarını OutputWriter.write_batch ile eşzamanlı yazar ve her dosyanın durumunu bildirir."""
+        if not jobs:
+            return
+        with self.instrumentation.stage('yazma'):
+            outcomes = self.output_writer.write_batch(jobs)
+        for outcome in outcomes:
+            job = outcome.job
+            scope = "Global" if job.is_global else "Lokal"
+            title = f"{job.measurement_type.capitalize()} {job.calculation_name} ({scope})"
+            if outcome.error:
+                self.log(f"- {title} kaydedilemedi: {outcome.error}")
+                continue
+            self.log(f"- {title} sonuçları kaydedildi: {os.path.basename(outcome.path)}")
+            if self.instrumentation.enabled:
+                self.instrumentation.count('bytes_written', os.path.getsize(outcome.path))
+
+    def _write_table(self, rows: List[Dict[str, any]], measurement_type: str,
+                     strategies: List[ICalculationStrategy], is_global: bool):
+        """Seçili tablo biçimlerindeki (csv, jsonl) özet tabloyu yazar."""
+        scope = "Global" if is_global else "Lokal"
+        layouts = {strategy.name: strategy.global_output_layout if is_global else strategy.output_layout
+                   for strategy in strategies}
+        try:
+            with self.instrumentation.stage('yazma'):
+                output_paths = self.output_writer.write_table(rows, measurement_type, list(layouts), is_global,
+                                                              layouts)
+        except OutputWriteError as e:
+            self.log(f"- {measurement_type.capitalize()} ({scope}) tablosu kaydedilemedi: {e}")
+            return
+        for output_path in output_paths:
+            self.log(f"- {measurement_type.capitalize()} ({scope}) tablosu kaydedildi: {os.path.basename(output_path)}")
+            if self.instrumentation.enabled:
+                self.instrumentation.count('bytes_written', os.path.getsize(output_path))
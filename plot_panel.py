@@ -0,0 +1,233 @@
+# plot_panel.py
+#
+# Ölçüm serilerini zamana göre çizen arayüz paneli. Çizim QPainter ile yapılır; her yeniden
+# çizimde yalnızca görünen aralığın indirgenmiş (bkz. decimation.py) noktaları kullanılır.
+# Fare tekerleği yakınlaştırır, sürükleme kaydırır, çift tıklama tüm veriyi gösterir.
+
+from typing import Dict, List, Optional, Tuple
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                             QListWidget, QListWidgetItem, QComboBox, QSplitter)
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt5.QtCore import Qt, QPointF, QRectF
+
+from decimation import DECIMATION_METHODS, PlotSeries, SeriesDecimator, format_axis_time
+from gui_workers import SeriesLoadWorker
+from pipeline import format_header_info
+
+SERIES_COLORS = ['#1f77b4', '#d62728', '#2ca02c', '#ff7f0e', '#9467bd', '#8c564b', '#e377c2', '#17becf']
+ZOOM_STEP = 1.25 # Tekerleğin bir adımında yakınlaştırma oranı
+_MARGIN_LEFT, _MARGIN_RIGHT, _MARGIN_TOP, _MARGIN_BOTTOM = 60, 15, 10, 30
+_TICK_COUNT = 6
+
+class PlotWidget(QWidget):
+    """Bir veya daha fazla PlotSeries'i ortak zaman ekseninde çizer; y ekseni görünen veriye göre ölçeklenir."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(400, 250)
+        self.method = DECIMATION_METHODS[0]
+        self.decimators: List[SeriesDecimator] = []
+        self.view: Optional[Tuple[float, float]] = None # Görünen (x0, x1)
+        self.drawn_points = 0 # Son çizimde kullanılan nokta sayısı
+        self._full_range: Optional[Tuple[float, float]] = None
+        self._drag_start: Optional[Tuple[float, Tuple[float, float]]] = None
+
+    def set_series(self, series_list: List[PlotSeries]):
+        self.decimators = [SeriesDecimator(series, self.method) for series in series_list if len(series)]
+        bounds = [decimator.series.bounds() for decimator in self.decimators]
+        if bounds:
+            self._full_range = (min(b[0] for b in bounds), max(b[1] for b in bounds) + 1)
+        else:
+            self._full_range = None
+        self.view = self._full_range
+        self.update()
+
+    def set_method(self, method: str):
+        """İndirgeme yöntemini değiştirir (önbellekler yeni yöntemle baştan oluşur)."""
+        self.method = method
+        self.decimators = [SeriesDecimator(decimator.series, method) for decimator in self.decimators]
+        self.update()
+
+    def reset_view(self):
+        self.view = self._full_range
+        self.update()
+
+    def _plot_rect(self) -> QRectF:
+        return QRectF(_MARGIN_LEFT, _MARGIN_TOP, max(1, self.width() - _MARGIN_LEFT - _MARGIN_RIGHT),
+                      max(1, self.height() - _MARGIN_TOP - _MARGIN_BOTTOM))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        rect = self._plot_rect()
+        painter.setPen(QPen(Qt.gray))
+        painter.drawRect(rect)
+        if not self.decimators or not self.view:
+            painter.drawText(rect, Qt.AlignCenter, "Çizilecek seri seçilmedi.")
+            return
+
+        x0, x1 = self.view
+        pixels = int(rect.width())
+        points = [decimator.decimate(x0, x1, pixels) for decimator in self.decimators]
+        self.drawn_points = sum(len(xs) for xs, _ in points)
+        visible_y = [y for xs, ys in points for x, y in zip(xs, ys) if x0 <= x < x1]
+        if not visible_y:
+            painter.drawText(rect, Qt.AlignCenter, "Bu aralıkta ölçüm yok.")
+            return
+        y0, y1 = min(visible_y), max(visible_y)
+        if y0 == y1:
+            y0, y1 = y0 - 1, y1 + 1
+        padding = (y1 - y0) * 0.05
+        y0, y1 = y0 - padding, y1 + padding
+
+        sx = rect.width() / (x1 - x0)
+        sy = rect.height() / (y1 - y0)
+        self._draw_axes(painter, rect, x0, x1, y0, y1)
+
+        painter.setRenderHint(QPainter.Antialiasing, self.drawn_points < 20000)
+        painter.setClipRect(rect)
+        for i, (xs, ys) in enumerate(points):
+            painter.setPen(QPen(QColor(SERIES_COLORS[i % len(SERIES_COLORS)]), 1))
+            polygon = QPolygonF([QPointF(rect.left() + (x - x0) * sx, rect.bottom() - (y - y0) * sy)
+                                 for x, y in zip(xs, ys)])
+            painter.drawPolyline(polygon)
+        painter.setClipping(False)
+
+        # Açıklama (sol üst)
+        for i, decimator in enumerate(self.decimators):
+            painter.setPen(QColor(SERIES_COLORS[i % len(SERIES_COLORS)]))
+            painter.drawText(int(rect.left()) + 8, int(rect.top()) + 16 + i * 14,
+                             f"{decimator.series.label} ({len(decimator.series)} nokta)")
+
+    def _draw_axes(self, painter: QPainter, rect: QRectF, x0: float, x1: float, y0: float, y1: float):
+        painter.setPen(QPen(QColor('#666666')))
+        with_date = x1 - x0 > 86400 or int(x0) // 86400 != int(x1) // 86400
+        for i in range(_TICK_COUNT + 1):
+            fraction = i / _TICK_COUNT
+            px = rect.left() + fraction * rect.width()
+            py = rect.bottom() - fraction * rect.height()
+            painter.drawLine(QPointF(px, rect.bottom()), QPointF(px, rect.bottom() + 4))
+            painter.drawText(QRectF(px - 50, rect.bottom() + 5, 100, 20), Qt.AlignHCenter | Qt.AlignTop,
+                             format_axis_time(x0 + fraction * (x1 - x0), with_date))
+            painter.drawLine(QPointF(rect.left() - 4, py), QPointF(rect.left(), py))
+            painter.drawText(QRectF(0, py - 10, _MARGIN_LEFT - 6, 20), Qt.AlignRight | Qt.AlignVCenter,
+                             f"{y0 + fraction * (y1 - y0):.4g}")
+
+    def wheelEvent(self, event):
+        if not self.view:
+            return
+        rect = self._plot_rect()
+        x0, x1 = self.view
+        # İmlecin altındaki zaman sabit kalacak şekilde yakınlaştır
+        anchor_fraction = min(max((event.pos().x() - rect.left()) / rect.width(), 0.0), 1.0)
+        anchor = x0 + anchor_fraction * (x1 - x0)
+        factor = 1 / ZOOM_STEP if event.angleDelta().y() > 0 else ZOOM_STEP
+        span = max((x1 - x0) * factor, 60.0) # En fazla bir dakikalık aralığa kadar yakınlaşılır
+        self._set_view(anchor - anchor_fraction * span, anchor + (1 - anchor_fraction) * span)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.view:
+            self._drag_start = (event.pos().x(), self.view)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is None:
+            return
+        start_x, (x0, x1) = self._drag_start
+        shift = (start_x - event.pos().x()) * (x1 - x0) / self._plot_rect().width()
+        self._set_view(x0 + shift, x1 + shift)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_start = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_view()
+
+    def _set_view(self, x0: float, x1: float):
+        """Görünen aralığı verinin sınırları içinde tutarak değiştirir."""
+        full_x0, full_x1 = self._full_range
+        span = min(x1 - x0, full_x1 - full_x0)
+        x0 = min(max(x0, full_x0), full_x1 - span)
+        self.view = (x0, x0 + span)
+        self.update()
+
+class PlotWindow(QWidget):
+    """Okunmuş ölçüm dosyalarından seçilenleri (veya bir tipin tüm dosyalarını) çizen pencere."""
+
+    def __init__(self, all_measurements_by_type: Dict[str, list], parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle('Ölçüm Grafiği')
+        self.setGeometry(150, 150, 1000, 600)
+        self.all_measurements_by_type = all_measurements_by_type
+        self.worker = None
+
+        layout = QVBoxLayout()
+        splitter = QSplitter(Qt.Horizontal, self)
+
+        # Seri seçimi: her tip için tüm dosyalar tek seri olarak veya dosyalar tek tek
+        self.seriesList = QListWidget(self)
+        for measurement_type, measurements in all_measurements_by_type.items():
+            if not measurements:
+                continue
+            item = QListWidgetItem(f"Tüm {measurement_type} dosyaları ({len(measurements)})")
+            item.setData(Qt.UserRole, (f"Tüm {measurement_type}", measurements))
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.seriesList.addItem(item)
+            for data in measurements:
+                item = QListWidgetItem(format_header_info(data))
+                item.setData(Qt.UserRole, (f"{measurement_type} id:{data.id}", [data]))
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                self.seriesList.addItem(item)
+        splitter.addWidget(self.seriesList)
+
+        self.plot = PlotWidget(self)
+        splitter.addWidget(self.plot)
+        splitter.setSizes([300, 700])
+        layout.addWidget(splitter)
+
+        controls = QHBoxLayout()
+        self.drawButton = QPushButton('Çiz', self)
+        self.drawButton.clicked.connect(self._draw_selected)
+        self.methodComboBox = QComboBox(self)
+        self.methodComboBox.addItems(["Min/Maks (piksel başına)", "LTTB"])
+        self.methodComboBox.currentIndexChanged.connect(
+            lambda index: self.plot.set_method(DECIMATION_METHODS[index])
+        )
+        resetButton = QPushButton('Tümünü Göster', self)
+        resetButton.clicked.connect(self.plot.reset_view)
+        self.statusLabel = QLabel("Tekerlek: yakınlaştır, sürükle: kaydır, çift tık: tümünü göster", self)
+        controls.addWidget(self.drawButton)
+        controls.addWidget(QLabel("İndirgeme:", self))
+        controls.addWidget(self.methodComboBox)
+        controls.addWidget(resetButton)
+        controls.addWidget(self.statusLabel, 1)
+        layout.addLayout(controls)
+        self.setLayout(layout)
+
+    def _draw_selected(self):
+        selections = [self.seriesList.item(i).data(Qt.UserRole) for i in range(self.seriesList.count())
+                      if self.seriesList.item(i).checkState() == Qt.Checked]
+        if not selections:
+            self.statusLabel.setText("Lütfen en az bir seri seçin.")
+            return
+        self.drawButton.setEnabled(False)
+        self.statusLabel.setText("Seriler yükleniyor...")
+        # Dosyalar (gerekirse ayrıştırılarak) arka planda sütunlara dönüştürülür
+        self.worker = SeriesLoadWorker(selections, parent=self)
+        self.worker.succeeded.connect(self._on_series_loaded)
+        self.worker.failed.connect(lambda message: self.statusLabel.setText(f"Hata: {message}"))
+        self.worker.finished.connect(lambda: self.drawButton.setEnabled(True))
+        self.worker.start()
+
+    def _on_series_loaded(self, series_list: List[PlotSeries]):
+        self.plot.set_series(series_list)
+        total = sum(len(series) for series in series_list)
+        self.statusLabel.setText(f"{len(series_list)} seri, toplam {total} nokta "
+                                 f"(çizimde en fazla piksel başına birkaç nokta kullanılır).")
+
+    def closeEvent(self, event):
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        super().closeEvent(event)
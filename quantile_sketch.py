@@ -0,0 +1,140 @@
+# quantile_sketch.py
+
+import math
+import random
+from typing import List, Optional, Sequence
+
+# Sıkıştırıcı kapasitesinin bir alt seviyeye inerken çarpıldığı oran (KLL makalesindeki c)
+_CAPACITY_RATIO = 2.0 / 3.0
+# k = 200 için normalize sıra hatası yaklaşık %1.65'tir (%99 güvenle); hata k ile ters orantılıdır
+_RANK_ERROR_CONSTANT = 3.3
+
+def k_for_rank_error(rank_error: float) -> int:
+    """İstenen normalize sıra hatasını (örn. 0.01 = %1) sağlayan yaklaşık k değeri."""
+    if not 0 < rank_error < 1:
+        raise ValueError("Sıra hatası 0 ile 1 arasında olmalıdır.")
+    return max(8, math.ceil(_RANK_ERROR_CONSTANT / rank_error))
+
+class KLLSketch:
+    """
+    Birleştirilebilir, sabit bellekli yaklaşık kantil özeti (Karnin-Lang-Liberty).
+
+    Değerler seviyelere ayrılmış sıkıştırıcılarda tutulur; h. seviyedeki her değer 2^h
+    değeri temsil eder. Bir seviye kapasitesini aşınca sıralanır ve değerlerin yarısı
+    (rastgele tek veya çift sıradakiler) bir üst seviyeye taşınır; değer sayısı tekse rastgele
+    seçilen biri seviyede kalır. Toplam boyut yaklaşık 3k ile sınırlıdır; normalize sıra hatası
+    yaklaşık _RANK_ERROR_CONSTANT / k'dır.
+
+    seed verilirse sonuçlar tekrarlanabilir. Özetler merge() ile birleştirilebilir; böylece
+    dosya bazındaki özetlerden global kantiller hesaplanır.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        if k < 8:
+            raise ValueError("k en az 8 olmalıdır.")
+        self.k = k
+        self.compactors: List[List[float]] = []
+        self.count = 0 # Eklenen toplam değer sayısı
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._size = 0
+        self._max_size = 0
+        self._random = random.Random(seed)
+        self._grow()
+
+    def _grow(self):
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(height) for height in range(len(self.compactors)))
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(_CAPACITY_RATIO ** depth * self.k)) + 1
+
+    def update(self, value: float):
+        """Tek bir değer ekler."""
+        self.extend((value,))
+
+    def extend(self, values: Sequence[float]):
+        """
+        Değerleri ekler; özet hiçbir zaman kapasitesinden fazla büyümez.
+        Değerler en alt seviyeye kalan kapasite kadar dilimler halinde toplu eklenir.
+        """
+        n = len(values)
+        if not n:
+            return
+        self.minimum = min(self.minimum, min(values))
+        self.maximum = max(self.maximum, max(values))
+        self.count += n
+        start = 0
+        while start < n:
+            chunk = values[start:start + max(1, self._max_size - self._size)]
+            self.compactors[0].extend(chunk)
+            self._size += len(chunk)
+            start += len(chunk)
+            if self._size >= self._max_size:
+                self._compress()
+
+    def _compress(self):
+        for height in range(len(self.compactors)):
+            level = self.compactors[height]
+            if len(level) >= self._capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self._grow()
+                level.sort()
+                # Tek sayıda değer varsa rastgele biri bu seviyede kalır; her zaman en küçüğü
+                # bırakmak üst seviyelere taşınan değerleri yukarı doğru kaydırırdı
+                keep = [level.pop(self._random.randrange(len(level)))] if len(level) % 2 else []
+                self.compactors[height + 1].extend(level[self._random.randrange(2)::2])
+                self.compactors[height] = keep
+        self._size = sum(len(compactor) for compactor in self.compactors)
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """Diğer özeti bu özete ekler ve kendisini döndürür."""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for height, level in enumerate(other.compactors):
+            self.compactors[height].extend(level)
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._size = sum(len(compactor) for compactor in self.compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        """
+        Verilen kesirler (0-1) için yaklaşık kantilleri tek bir sıralamayla döndürür.
+        Ağırlığı w olan değer w ardışık sırayı temsil eder; kantil, MergeableHistogram.quantiles
+        gibi komşu iki sıradaki değerler arasında doğrusal aradeğerle bulunur. Sıkıştırma
+        olmadıysa sonuç sıralı değerlerden hesaplanan kesin kantille aynıdır.
+        """
+        if not self.count:
+            raise ValueError("Boş özetten kantil hesaplanamaz.")
+        weighted = sorted(
+            (value, 1 << height) for height, level in enumerate(self.compactors) for value in level
+        )
+        total_weight = sum(weight for _, weight in weighted)
+        positions = [min(max(fraction, 0.0), 1.0) * (total_weight - 1) for fraction in fractions]
+        ranks = sorted({rank for position in positions for rank in (math.floor(position), math.ceil(position))})
+        values_at = {}
+        seen = 0
+        rank_iter = iter(ranks)
+        rank = next(rank_iter, None)
+        for value, weight in weighted:
+            seen += weight
+            while rank is not None and rank < seen:
+                values_at[rank] = value
+                rank = next(rank_iter, None)
+        results = []
+        for fraction, position in zip(fractions, positions):
+            if fraction <= 0:
+                results.append(self.minimum)
+            elif fraction >= 1:
+                results.append(self.maximum)
+            else:
+                lower = values_at[math.floor(position)]
+                upper = values_at[math.ceil(position)]
+                offset = position - math.floor(position)
+                results.append(lower + (upper - lower) * offset if offset else lower)
+        return results
@@ -0,0 +1,109 @@
+# query_client.py
+#
+# query_server.py ile çalışan yerel sorgu sunucusunun istemcisi. Arayüz, verileri kendisi
+# ayrıştırmak yerine sonuçları sunucudan alıp aynı çıktı düzeniyle yazabilir.
+
+import json
+import os
+from typing import Callable, Dict, List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from calculation_strategies import ICalculationStrategy
+from output_writer import OutputWriter, WriteJob
+
+DEFAULT_SERVER_URL = 'http://127.0.0.1:8765'
+DEFAULT_REQUEST_TIMEOUT = 300.0 # saniye
+
+class QueryClientError(Exception):
+    """Sunucuya ulaşılamadığında veya sunucu hata döndürdüğünde fırlatılır."""
+    pass
+
+class QueryClient:
+    """Sorgu sunucusunun JSON uç noktalarını çağırır."""
+
+    def __init__(self, base_url: str = DEFAULT_SERVER_URL, timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def _request(self, path: str, params: Optional[Dict[str, any]] = None, method: str = 'GET') -> dict:
+        url = self.base_url + path
+        if params:
+            url += '?' + urlencode({name: ','.join(value) if isinstance(value, (list, tuple)) else value
+                                    for name, value in params.items() if value not in (None, '', [], ())})
+        try:
+            with urlopen(Request(url, method=method), timeout=self.timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except HTTPError as e:
+            try:
+                message = json.loads(e.read().decode('utf-8')).get('hata', str(e))
+            except ValueError:
+                message = str(e)
+            raise QueryClientError(f"Sunucu hatası ({e.code}): {message}") from e
+        except (URLError, OSError) as e:
+            raise QueryClientError(f"Sorgu sunucusuna ulaşılamadı ({self.base_url}): {e}") from e
+
+    def status(self) -> dict:
+        return self._request('/durum')
+
+    def refresh(self) -> dict:
+        """Sunucunun klasörü hemen yeniden taramasını ister."""
+        return self._request('/yenile', method='POST')
+
+    def query(self, calculation_names: List[str], scope: str = 'global', **filters) -> dict:
+        """
+        /sorgu uç noktasını çağırır. filters: tip, yer, baslangic, bitis, son_gun, grupla
+        (liste değerler virgülle birleştirilir).
+        """
+        return self._request('/sorgu', {'hesaplama': calculation_names, 'kapsam': scope, **filters})
+
+def calculate_remote(client: QueryClient, output_writer: OutputWriter,
+                     selected_strategies_local: List[ICalculationStrategy],
+                     selected_strategies_global: List[ICalculationStrategy],
+                     log: Callable[[str], None] = print,
+                     is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+    """
+    Seçili lokal ve global hesaplamaları sunucudan ölçüm tipi başına alır ve
+    CalculationPipeline ile aynı dosya düzeniyle yazar.
+    Dönüş değeri: sonunda kullanıcıya gösterilecek durum mesajı.
+    """
+    local_layouts = {strategy.name: strategy.output_layout for strategy in selected_strategies_local}
+    global_layouts = {strategy.name: strategy.global_output_layout for strategy in selected_strategies_global}
+    local_names = list(local_layouts)
+    global_names = list(global_layouts)
+    status = client.status()
+    log(f"Sorgu sunucusu: {status['kök']} (sürüm {status['sürüm']})")
+
+    overall_status = ""
+    for measurement_type, file_count in status['dosyalar'].items():
+        if is_cancelled and is_cancelled():
+            break
+        if not file_count:
+            overall_status += f"{measurement_type.capitalize()} verisi bulunamadı. Hesaplamalar atlandı.\n"
+            continue
+        jobs = []
+        if local_names:
+            response = client.query(local_names, 'lokal', tip=measurement_type)
+            for message in response['hatalar']:
+                log(f"Uyarı ({message})")
+            jobs.extend(WriteJob(results, measurement_type, name, layout=local_layouts.get(name, 'value'))
+                        for name, results in response['sonuçlar'].items() if results)
+        if global_names:
+            response = client.query(global_names, 'global', tip=measurement_type)
+            for name, message in response['hatalar'].items():
+                log(f"Uyarı ({measurement_type} - Global - {name}): {message}")
+            jobs.extend(WriteJob({f"Tüm {measurement_type} değerlerinin {name.lower()}": value},
+                                 measurement_type, name, is_global=True,
+                                 layout=global_layouts.get(name, 'value'))
+                        for name, value in response['sonuçlar'].items())
+
+        for outcome in output_writer.write_batch(jobs):
+            job = outcome.job
+            title = f"{measurement_type.capitalize()} {job.calculation_name} ({'Global' if job.is_global else 'Lokal'})"
+            if outcome.error:
+                log(f"- {title} kaydedilemedi: {outcome.error}")
+            else:
+                log(f"- {title} sonuçları kaydedildi: {os.path.basename(outcome.path)}")
+        overall_status += f"{measurement_type.capitalize()} için {file_count} dosyanın sonuçları sunucudan alındı.\n"
+    return overall_status
@@ -0,0 +1,410 @@
+# query_server.py
+#
+# Ölçüm klasörünü bir kez okuyup bellekte tutan ve istatistik sorgularını HTTP (veya Unix soketi)
+# üzerinden yanıtlayan yerel sorgu sunucusu. Yeni veya değişen dosyalar periyodik olarak işlenir.
+# Örnek:
+#   python query_server.py olcumler --port 8765
+#   curl 'http://127.0.0.1:8765/sorgu?hesaplama=Maksimum&tip=sıcaklık&yer=YER&son_gun=7'
+#
+# Uç noktalar (yanıtlar JSON):
+#   GET  /durum          dosya sayıları, veri sürümü ve önbellek istatistikleri
+#   GET  /hesaplamalar   kayıtlı hesaplama adları
+#   GET  /sorgu          hesaplama=..&kapsam=global|lokal|gruplu&tip=..&yer=..&baslangic=gg.aa.yyyy
+#                        &bitis=gg.aa.yyyy&son_gun=N&grupla=yer,ay (çoklu değerler virgülle ayrılır)
+#   POST /yenile         klasörü hemen yeniden tarar
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from calculation_strategies import FusedCalculationEngine, GlobalAggregator, SeriesSummary
+from data_parser import MeasurementParser, _measurement_sort_key
+from grouped_query import GroupedQuery, MeasurementFilter, format_group_label
+from measurement import MeasurementData
+from measurement_types import resolve_measurement_type
+from pipeline import format_header_info
+from result_cache import ResultCache
+from strategy_registry import STRATEGY_CLASSES, find_strategy_name, load_strategy
+from watch import DEFAULT_POLL_INTERVAL, FolderChanges, diff_snapshots, snapshot_folder
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_QUERY_CACHE_ENTRIES = 256
+DEFAULT_QUERY_WORKERS = 4
+QUERY_SCOPES = ('global', 'lokal', 'gruplu')
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+class QueryError(ValueError):
+    """Sorgu parametreleri geçersiz olduğunda fırlatılır (HTTP 400)."""
+    pass
+
+class MeasurementStore:
+    """
+    Bir ölçüm kök klasörünün ayrıştırılmış verisini bellekte tutar.
+
+    refresh() klasörü tarar ve yalnızca eklenen veya değişen dosyaları ayrıştırır. Dosya
+    sözlüğü her yenilemede yenisiyle değiştirilir (yerinde değiştirilmez); böylece sorgular
+    kilit almadan o anki sözlüğün bir kopyası üzerinde çalışır. Her değişiklikte generation
+    artar ve buna bağlı önbellekler geçersiz olur.
+    """
+
+    def __init__(self, root_folder: str, parser: Optional[MeasurementParser] = None,
+                 log: Callable[[str], None] = print):
+        self.root_folder = root_folder
+        self.parser = parser or MeasurementParser(verbose=False)
+        self.log = log
+        self.files: Dict[str, MeasurementData] = {}
+        self.failures: Dict[str, str] = {} # Dosya yolu -> ayrıştırılamama nedeni
+        self.snapshot = {}
+        self.generation = 0
+        self._by_type: Dict[str, List[MeasurementData]] = {}
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self) -> FolderChanges:
+        """Klasörü tarar; değişiklik varsa yalnızca etkilenen dosyaları işler."""
+        with self._refresh_lock:
+            new_snapshot = snapshot_folder(self.parser, self.root_folder)
+            changes = diff_snapshots(self.snapshot, new_snapshot)
+            if not changes:
+                return changes
+            files = dict(self.files)
+            failures = dict(self.failures)
+            for file_path in changes.removed:
+                files.pop(file_path, None)
+                failures.pop(file_path, None)
+            for file_path in changes.added + changes.changed:
+                files.pop(file_path, None)
+                failures.pop(file_path, None)
+                data, failure = self.parser._parse_job(file_path, new_snapshot[file_path][0])
+                if data is None:
+                    failures[file_path] = failure.reason
+                elif isinstance(data, MeasurementData):
+                    files[file_path] = data
+                else: # Akış tutamacı: sunucu veriyi bellekte tutar
+                    files[file_path] = self.parser.load_or_parse(file_path)
+
+            by_type = {measurement_type: [] for measurement_type in self.parser.discovered_types}
+            for data in files.values():
+                by_type.setdefault(data.measurement_type, []).append(data)
+            for measurements in by_type.values():
+                measurements.sort(key=_measurement_sort_key)
+
+            self.files, self.failures, self._by_type = files, failures, by_type
+            self.snapshot = new_snapshot
+            self.generation += 1
+            self.log(f"{len(changes.added)} yeni, {len(changes.changed)} değişen, {len(changes.removed)} silinen dosya işlendi "
+                     f"(toplam {len(files)} dosya, sürüm {self.generation}).")
+            return changes
+
+    def measurements_by_type(self) -> Dict[str, List[MeasurementData]]:
+        """{'sıcaklık': [...], 'nem': [...], ...} (id ve tarihe göre sıralı)."""
+        return self._by_type
+
+def _split(params: Dict[str, List[str]], name: str) -> List[str]:
+    """Tekrarlanan veya virgülle ayrılmış parametre değerlerini tek listede toplar."""
+    return [item.strip() for value in params.get(name, []) for item in value.split(',') if item.strip()]
+
+def _parse_date(text: str) -> datetime.date:
+    try:
+        return datetime.datetime.strptime(text, '%d.%m.%Y').date()
+    except ValueError:
+        raise QueryError(f"Geçersiz tarih: '{text}' (beklenen biçim: gg.aa.yyyy)")
+
+class QueryServer:
+    """
+    MeasurementStore üzerindeki sorguları asyncio ile eşzamanlı yanıtlar.
+
+    Hesaplamalar olay döngüsünü bekletmemek için iş parçacığı havuzunda, mevcut
+    ICalculationStrategy uygulamalarıyla yapılır:
+      global  - filtreye uyan dosyaların kısmi özetleri birleştirilir (GlobalAggregator;
+                ikili dosyaların hazır özetleri varsa nokta verisi okunmaz)
+      lokal   - dosya başına sonuçlar (FusedCalculationEngine, içerik özetli ResultCache ile)
+      gruplu  - GroupedQuery ile grup başına sonuçlar
+    Tam sorgu yanıtları veri sürümüyle (generation) anahtarlanan bir LRU önbellekte tutulur.
+    """
+
+    def __init__(self, store: MeasurementStore, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 max_workers: int = DEFAULT_QUERY_WORKERS,
+                 cache_entries: int = DEFAULT_QUERY_CACHE_ENTRIES,
+                 result_cache: Optional[ResultCache] = None):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cache_entries = cache_entries
+        self.result_cache = result_cache if result_cache is not None else ResultCache()
+        self.query_cache_hits = 0
+        self.query_count = 0
+        self._query_cache: 'OrderedDict[tuple, dict]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    # --- Sorgular (iş parçacığı havuzunda çalışır) ---
+
+    def status(self) -> dict:
+        by_type = self.store.measurements_by_type()
+        return {
+            'kök': self.store.root_folder,
+            'sürüm': self.store.generation,
+            'dosyalar': {measurement_type: len(measurements) for measurement_type, measurements in by_type.items()},
+            'ayrıştırılamayan': len(self.store.failures),
+            'sorgu_sayısı': self.query_count,
+            'sorgu_önbelleği_isabet': self.query_cache_hits,
+            'sonuç_önbelleği': {'isabet': self.result_cache.hits, 'eksik': self.result_cache.misses},
+        }
+
+    def query(self, params: Dict[str, List[str]]) -> dict:
+        """Sorgu parametrelerini doğrular; yanıtı önbellekten veya hesaplayarak döndürür."""
+        self.query_count += 1
+        key = (self.store.generation,) + tuple(sorted((name, tuple(values)) for name, values in params.items()))
+        with self._cache_lock:
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                self.query_cache_hits += 1
+                return self._query_cache[key]
+
+        response = self._run_query(params)
+        with self._cache_lock:
+            self._query_cache[key] = response
+            while len(self._query_cache) > self.cache_entries:
+                self._query_cache.popitem(last=False)
+        return response
+
+    def _run_query(self, params: Dict[str, List[str]]) -> dict:
+        names = _split(params, 'hesaplama')
+        if not names:
+            raise QueryError("En az bir hesaplama (hesaplama=...) belirtilmelidir.")
+        try:
+            names = list(dict.fromkeys(find_strategy_name(name) for name in names))
+        except KeyError as e:
+            raise QueryError(f"Bilinmeyen hesaplama: '{e.args[0]}'. Geçerli hesaplamalar: {', '.join(STRATEGY_CLASSES)}")
+        scope = (params.get('kapsam') or ['global'])[0]
+        if scope not in QUERY_SCOPES:
+            raise QueryError(f"Geçersiz kapsam: '{scope}'. Geçerli kapsamlar: {', '.join(QUERY_SCOPES)}")
+
+        by_type = self.store.measurements_by_type() # Yenileme sırasında değişmeyen anlık görüntü
+        measurement_filter = self._build_filter(params, by_type)
+        strategies = [load_strategy(name) for name in names]
+        if scope == 'global':
+            return self._query_global(by_type, measurement_filter, strategies)
+        if scope == 'lokal':
+            return self._query_local(by_type, measurement_filter, strategies)
+        try:
+            query = GroupedQuery(_split(params, 'grupla'), measurement_filter)
+        except ValueError as e:
+            raise QueryError(str(e))
+        return self._query_grouped(by_type, query, strategies)
+
+    @staticmethod
+    def _build_filter(params: Dict[str, List[str]], by_type: Dict[str, List[MeasurementData]]) -> MeasurementFilter:
+        types = _split(params, 'tip')
+        locations = _split(params, 'yer')
+        measurement_filter = MeasurementFilter(
+            # Tiplerin diğer yazımları (örn. 'basinc') kayıtlı ada çevrilir
+            measurement_types={resolve_measurement_type(name) or name for name in types} if types else None,
+            locations=set(locations) if locations else None,
+            start_date=_parse_date(params['baslangic'][0]) if 'baslangic' in params else None,
+            end_date=_parse_date(params['bitis'][0]) if 'bitis' in params else None,
+        )
+        if 'son_gun' in params:
+            # Son N gün: bitiş tarihi verilmediyse diğer koşullara uyan en yeni ölçüm günüdür
+            try:
+                days = int(params['son_gun'][0])
+            except ValueError:
+                days = 0
+            if days <= 0:
+                raise QueryError("son_gun pozitif bir tam sayı olmalıdır.")
+            if measurement_filter.end_date is None:
+                dates = [data.date for measurements in by_type.values() for data in measurements
+                         if measurement_filter.matches(data)]
+                measurement_filter.end_date = max(dates) if dates else datetime.date.today()
+            measurement_filter.start_date = measurement_filter.end_date - datetime.timedelta(days=days - 1)
+        return measurement_filter
+
+    @staticmethod
+    def _selected(by_type: Dict[str, List[MeasurementData]], measurement_filter: MeasurementFilter) -> List[MeasurementData]:
+        return [data for measurements in by_type.values() for data in measurements if measurement_filter.matches(data)]
+
+    def _query_global(self, by_type, measurement_filter: MeasurementFilter, strategies) -> dict:
+        unsupported = [strategy.name for strategy in strategies if not strategy.supports_global]
+        if unsupported:
+            raise QueryError(f"Global kapsamda desteklenmeyen hesaplama: {', '.join(unsupported)}")
+        selected = self._selected(by_type, measurement_filter)
+        types = {data.measurement_type for data in selected}
+        if len(types) == 1:
+            # Tipe özel ayarlar (örn. histogram kutu genişliği) hesaplama hattındaki gibi uygulanır
+            measurement_type = types.pop()
+            strategies = [strategy.for_measurement_type(measurement_type) for strategy in strategies]
+        aggregator = GlobalAggregator(strategies)
+        for data in selected:
+            if not aggregator.add_statistics(data.statistics):
+                aggregator.add(SeriesSummary(data.values, memoryview(data.time_column)))
+        results, errors = aggregator.calculate()
+        return {'kapsam': 'global', 'dosya_sayısı': len(selected), 'sonuçlar': results,
+                'hatalar': {name: str(e) for name, e in errors.items()}}
+
+    def _query_local(self, by_type, measurement_filter: MeasurementFilter, strategies) -> dict:
+        results = {strategy.name: {} for strategy in strategies}
+        errors = []
+        file_count = 0
+        for measurement_type, measurements in by_type.items():
+            engine = FusedCalculationEngine([strategy.for_measurement_type(measurement_type) for strategy in strategies],
+                                            result_cache=self.result_cache)
+            for data in measurements:
+                if not measurement_filter.matches(data):
+                    continue
+                file_count += 1
+                file_results, file_errors = engine.calculate_summary(
+                    SeriesSummary(data.values, memoryview(data.time_column))
+                )
+                header_info = format_header_info(data)
+                for name, result in file_results.items():
+                    results[name][header_info] = result
+                for name, e in file_errors.items():
+                    errors.append(f"{measurement_type} - {data.id} - {name}: {e}")
+        return {'kapsam': 'lokal', 'dosya_sayısı': file_count, 'sonuçlar': results, 'hatalar': errors}
+
+    def _query_grouped(self, by_type, query: GroupedQuery, strategies) -> dict:
+        selected = query.select(by_type)
+        grouped_results = query.reduce(query.build_segments(selected, log=self.store.log), strategies)
+        results = {strategy.name: {} for strategy in strategies}
+        errors = []
+        for key, (group_results, group_errors) in grouped_results.items():
+            label = format_group_label(query.group_by, key)
+            for name, result in group_results.items():
+                results[name][label] = result
+            for name, e in group_errors.items():
+                errors.append(f"{label} - {name}: {e}")
+        return {'kapsam': 'gruplu', 'dosya_sayısı': len(selected), 'sonuçlar': results, 'hatalar': errors}
+
+    # --- HTTP ---
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Tek bir HTTP/1.1 isteğini okur, yanıtlar ve bağlantıyı kapatır."""
+        try:
+            # Yüzde kodlanmamış Türkçe karakterli adresler (örn. curl ile) için istek satırı UTF-8 çözülür
+            request_line = (await reader.readline()).decode('utf-8', 'replace').strip()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            if int(headers.get('content-length', 0) or 0):
+                await reader.readexactly(int(headers['content-length']))
+            status, payload = await self.dispatch(request_line)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            writer.close()
+            return
+
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('latin-1') + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request_line: str) -> Tuple[int, dict]:
+        """İstek satırına göre uç noktayı çalıştırır. Dönüş: (HTTP durum kodu, JSON gövdesi)"""
+        try:
+            method, target, _ = request_line.split(' ', 2)
+        except ValueError:
+            return 400, {'hata': "Geçersiz istek satırı."}
+        url = urlsplit(target)
+        loop = asyncio.get_running_loop()
+        try:
+            if url.path == '/sorgu' and method == 'GET':
+                return 200, await loop.run_in_executor(self.executor, self.query, parse_qs(url.query))
+            if url.path == '/durum' and method == 'GET':
+                return 200, self.status()
+            if url.path == '/hesaplamalar' and method == 'GET':
+                return 200, {'hesaplamalar': list(STRATEGY_CLASSES)}
+            if url.path == '/yenile' and method == 'POST':
+                changes = await loop.run_in_executor(self.executor, self.store.refresh)
+                return 200, {'yeni': len(changes.added), 'değişen': len(changes.changed),
+                             'silinen': len(changes.removed), 'sürüm': self.store.generation}
+        except QueryError as e:
+            return 400, {'hata': str(e)}
+        except Exception as e:
+            self.store.log(f"Sorgu hatası ({target}): {e}")
+            return 500, {'hata': str(e)}
+        if url.path in ('/sorgu', '/durum', '/hesaplamalar', '/yenile'):
+            return 405, {'hata': f"{method} bu uç noktada desteklenmiyor."}
+        return 404, {'hata': f"Bilinmeyen uç nokta: {url.path}"}
+
+    async def _poll_forever(self):
+        """Klasörü poll_interval saniyede bir yeniden tarar."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await loop.run_in_executor(self.executor, self.store.refresh)
+            except Exception as e:
+                self.store.log(f"Klasör taraması başarısız: {e}")
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_path: Optional[str] = None,
+                    ready: Optional[Callable[[], None]] = None):
+        """Verileri yükler ve sunucuyu durdurulana kadar çalıştırır. unix_path verilirse Unix soketi dinlenir."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, self.store.refresh)
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+            address = unix_path
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+            address = f"http://{host}:{server.sockets[0].getsockname()[1]}"
+        self.store.log(f"Sorgu sunucusu hazır: {address}")
+        if ready:
+            ready()
+        poller = asyncio.create_task(self._poll_forever())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            poller.cancel()
+            self.executor.shutdown(wait=False)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Ölçüm verisini bellekte tutan yerel sorgu sunucusu.")
+    arg_parser.add_argument('root', help="Ölçüm kök klasörü (altında sıcaklık/, nem/ gibi tip klasörleri bulunan)")
+    arg_parser.add_argument('--host', default=DEFAULT_HOST, help=f"Dinlenecek adres (varsayılan {DEFAULT_HOST})")
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Dinlenecek port (varsayılan {DEFAULT_PORT})")
+    arg_parser.add_argument('--unix', default=None, metavar='YOL', help="TCP yerine bu Unix soketini dinle")
+    arg_parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                            help="Yeni veya değişen dosyalar için tarama aralığı (saniye)")
+    arg_parser.add_argument('--workers', type=int, default=DEFAULT_QUERY_WORKERS,
+                            help="Sorguları hesaplayan iş parçacığı sayısı")
+    arg_parser.add_argument('--cache', action='store_true', help="Ayrıştırma önbelleğini (sonuc/.cache) kullan")
+    args = arg_parser.parse_args(argv)
+
+    cache = None
+    if args.cache:
+        from parse_cache import ParsedDataCache
+        cache = ParsedDataCache.for_root(args.root)
+    store = MeasurementStore(args.root, MeasurementParser(verbose=False, cache=cache))
+    server = QueryServer(store, poll_interval=args.interval, max_workers=args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("Sorgu sunucusu durduruldu.")
+    finally:
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
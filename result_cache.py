@@ -0,0 +1,187 @@
+# result_cache.py
+
+import hashlib
+import os
+import pickle
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+from measurement import TIME_TYPECODE, VALUE_TYPECODE
+
+RESULT_SUFFIX = '.sonuc'
+DEFAULT_MAX_RESULT_ENTRIES = 100_000 # Bellekte tutulacak (dosya, strateji) sonucu sayısı
+DEFAULT_MAX_RESULT_BYTES = 256 * 1024 * 1024 # 256 MB (disk)
+
+# Önbellekte bulunamayan sonuçlar için işaret (None geçerli bir sonuç olabilir)
+MISSING = object()
+
+def _as_buffer(column: Sequence, typecode: str):
+    """Sütunu kopyalamadan bayt tamponu olarak döndürür; tampon değilse diziye çevirir."""
+    try:
+        return memoryview(column)
+    except TypeError:
+        return array(typecode, column)
+
+def content_key(values: Sequence[float], times: Optional[Sequence[int]] = None) -> str:
+    """
+    Ayrıştırılmış serinin içerik özeti. Değer ve zaman sütunlarının baytları üzerinden
+    hesaplanır; dosyanın yolu, adı veya değiştirilme zamanı anahtara girmez.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(_as_buffer(values, VALUE_TYPECODE))
+    digest.update(b'|')
+    if times is not None:
+        digest.update(_as_buffer(times, TIME_TYPECODE))
+    return f"seri:{digest.hexdigest()}"
+
+def file_content_key(file_path: str) -> str:
+    """Kaynak dosyanın içerik özeti (belleğe alınmadan işlenen büyük dosyalar için)."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return f"dosya:{digest.hexdigest()}"
+
+def strategy_key(strategy) -> str:
+    """
+    Stratejinin sınıfı, uygulama sürümü (version) ve parametrelerinden oluşan anahtar.
+    Parametre veya sürüm değişince eski sonuçlar kendiliğinden geçersiz olur.
+    """
+    cls = type(strategy)
+    params = sorted(vars(strategy).items())
+    return f"{cls.__module__}.{cls.__qualname__}:v{cls.version}:{params!r}"
+
+class ResultCache:
+    """
+    (seri içeriği, strateji) çiftlerinin lokal sonuçlarını saklar.
+
+    Anahtar içerik özetidir: aynı dosya yeniden okunduğunda veya başka bir yola kopyalandığında
+    sonuç yeniden kullanılır, içeriği değişen dosya ise kendiliğinden yeniden hesaplanır.
+    Bellekte en fazla max_entries sonuç LRU sırasıyla tutulur. cache_folder verilirse sonuçlar
+    diske de yazılır (geçici dosya + yeniden adlandırma) ve sonraki çalıştırmalarda oradan okunur;
+    diskteki toplam boyut max_bytes değerini aşarsa en uzun süredir kullanılmayan kayıtlar silinir.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_RESULT_ENTRIES, cache_folder: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_RESULT_BYTES):
+        self.max_entries = max_entries
+        self.cache_folder = cache_folder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, str], object]' = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_folder:
+            os.makedirs(cache_folder, exist_ok=True)
+
+    @classmethod
+    def for_root(cls, root_folder: str, **kwargs) -> 'ResultCache':
+        """Ölçüm kök klasörü için varsayılan konumda (sonuc/.cache/sonuclar) diskli bir önbellek oluşturur."""
+        return cls(cache_folder=os.path.join(root_folder, 'sonuc', '.cache', 'sonuclar'), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry_path(self, key: Tuple[str, str]) -> str:
+        digest = hashlib.sha1('\x1f'.join(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_folder, digest + RESULT_SUFFIX)
+
+    def get(self, series_key: str, strategy) -> object:
+        """Saklı sonucu döndürür; yoksa MISSING."""
+        key = (series_key, strategy_key(strategy))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        result = self._load(key) if self.cache_folder else MISSING
+        with self._lock:
+            if result is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(key, result)
+        return result
+
+    def put(self, series_key: str, strategy, result: object):
+        """Sonucu bellekte (ve diskli önbellekte diske) saklar."""
+        key = (series_key, strategy_key(strategy))
+        with self._lock:
+            self._remember(key, result)
+        if self.cache_folder:
+            self._store(key, result)
+
+    def _remember(self, key: Tuple[str, str], result: object):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: Tuple[str, str]) -> object:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                stored_key, result = pickle.load(f)
+        except OSError:
+            return MISSING
+        except Exception: # Bozuk veya eski biçimli kayıt
+            self._remove(entry_path)
+            return MISSING
+        if stored_key != key: # Özet çakışması
+            return MISSING
+        try:
+            os.utime(entry_path) # LRU tahliyesi için son kullanım zamanını güncelle
+        except OSError:
+            pass
+        return result
+
+    def _store(self, key: Tuple[str, str], result: object):
+        entry_path = self._entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except (OSError, pickle.PicklingError):
+            self._remove(tmp_path)
+
+    def enforce_size_limit(self) -> int:
+        """Diskteki toplam boyut max_bytes değerini aşıyorsa en eski kayıtları siler; silinen kayıt sayısını döndürür."""
+        if not self.cache_folder:
+            return 0
+        entries = []
+        total = 0
+        with os.scandir(self.cache_folder) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(RESULT_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Bellekteki ve diskteki tüm sonuçları siler."""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_folder:
+            with os.scandir(self.cache_folder) as it:
+                for entry in it:
+                    if entry.name.endswith(RESULT_SUFFIX):
+                        self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,237 @@
+# series_join.py
+#
+# Aynı yer ve tarihe ait sıcaklık ve nem dosyalarını ölçüm zamanlarına göre eşleştirir;
+# eşleşen seriler üzerinden türetilmiş büyüklükler (çiy noktası, hissedilen sıcaklık)
+# ve sıcaklık-nem korelasyonu hesaplanır.
+
+import datetime
+import math
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, List, Sequence, Tuple
+from calculation_strategies import ICalculationStrategy, SeriesSummary
+from data_parser import MeasurementStream
+from measurement import TIME_TYPECODE, VALUE_TYPECODE
+
+# Birleşik sonuçların (korelasyon) yazıldığı ölçüm tipi klasörü
+JOINED_TYPE = 'birleşik'
+# Varsayılan eşleştirme toleransı (saniye); 0 yalnızca aynı zamanlı noktaları eşleştirir
+DEFAULT_JOIN_TOLERANCE = 0
+
+# Magnus formülü katsayıları (Alduchov ve Eskridge, -45..60 °C)
+_MAGNUS_B = 17.62
+_MAGNUS_C = 243.12
+
+def merge_join(left_times: Sequence[int], right_times: Sequence[int],
+               tolerance: int = DEFAULT_JOIN_TOLERANCE) -> Tuple[array, array]:
+    """
+    Sıralı iki zaman sütununu tek geçişte eşleştirir (O(n + m)).
+    Dönüş değeri: (sol indeksler, sağ indeksler); aynı konumdaki indeksler bir eşleşmedir.
+
+    tolerance 0 ise yalnızca zamanı eşit olan noktalar birebir eşleşir. Aksi halde her sol
+    noktaya en yakın sağ nokta (aradaki fark tolerance saniyeyi aşmıyorsa) eşlenir; eşit
+    uzaklıkta önceki nokta seçilir ve bir sağ nokta birden fazla sol noktaya eşlenebilir.
+    """
+    left_index = array('q')
+    right_index = array('q')
+    n, m = len(left_times), len(right_times)
+    i = j = 0
+    if tolerance <= 0:
+        while i < n and j < m:
+            left, right = left_times[i], right_times[j]
+            if left == right:
+                left_index.append(i)
+                right_index.append(j)
+                i += 1
+                j += 1
+            elif left < right:
+                i += 1
+            else:
+                j += 1
+        return left_index, right_index
+
+    if not m:
+        return left_index, right_index
+    for i in range(n):
+        t = left_times[i]
+        # j, zamanı t'yi geçmeyen son sağ noktadır (yoksa 0); en yakın nokta j veya j + 1'dir
+        while j + 1 < m and right_times[j + 1] <= t:
+            j += 1
+        best, best_distance = j, abs(right_times[j] - t)
+        if j + 1 < m and right_times[j + 1] - t < best_distance:
+            best, best_distance = j + 1, right_times[j + 1] - t
+        if best_distance <= tolerance:
+            left_index.append(i)
+            right_index.append(best)
+    return left_index, right_index
+
+def _ordered_columns(measurements: Sequence) -> Tuple[array, array]:
+    """Dosyaların (zaman, değer) sütunlarını birleştirir ve zamana göre sıralı döndürür."""
+    times = array(TIME_TYPECODE)
+    values = array(VALUE_TYPECODE)
+    for data in measurements:
+        if isinstance(data, MeasurementStream):
+            for time_column, value_column in data.iter_batches():
+                times.extend(time_column)
+                values.extend(value_column)
+        else:
+            values.extend(data.values) # İndeksten gelen dosyalar burada yüklenir
+            times.extend(data.time_column)
+    order = SeriesSummary(values, times).time_order
+    if order is None:
+        return times, values
+    return array(TIME_TYPECODE, (times[i] for i in order)), array(VALUE_TYPECODE, (values[i] for i in order))
+
+@dataclass
+class JoinedSeries:
+    """Bir yer ve tarih için zamana göre eşleştirilmiş sıcaklık ve nem değerleri (sıcaklık zamanlarıyla)."""
+    location: str
+    date: datetime.date
+    temperature_ids: List[str]
+    humidity_ids: List[str]
+    times: array = field(default_factory=lambda: array(TIME_TYPECODE))
+    temperature: array = field(default_factory=lambda: array(VALUE_TYPECODE))
+    humidity: array = field(default_factory=lambda: array(VALUE_TYPECODE))
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def header_info(self) -> str:
+        """Sonuç dosyalarındaki başlık. Örn: 'id:1+3 ölçüm: sıcaklık+nem - yer: YER - tarih: 11.11.2011'"""
+        ids = f"{','.join(self.temperature_ids)}+{','.join(self.humidity_ids)}"
+        return f"id:{ids} ölçüm: sıcaklık+nem - yer: {self.location} - tarih: {self.date.strftime('%d.%m.%Y')}"
+
+def pair_measurements(all_measurements_by_type: Dict[str, list]
+                      ) -> List[Tuple[Tuple[str, datetime.date], list, list]]:
+    """
+    Sıcaklık ve nem dosyalarını (yer, tarih) anahtarına göre eşler; yalnızca başlık alanları kullanılır.
+    Aynı anahtarlı birden fazla dosya aynı günün parçaları sayılır ve birlikte eşleştirilir.
+    Dönüş değeri: [((yer, tarih), sıcaklık dosyaları, nem dosyaları), ...] anahtar sırasıyla
+    """
+    temperatures: Dict[Tuple[str, datetime.date], list] = {}
+    humidities: Dict[Tuple[str, datetime.date], list] = {}
+    for data in all_measurements_by_type.get('sıcaklık', []):
+        temperatures.setdefault((data.location, data.date), []).append(data)
+    for data in all_measurements_by_type.get('nem', []):
+        humidities.setdefault((data.location, data.date), []).append(data)
+    return [(key, temperatures[key], humidities[key]) for key in sorted(temperatures.keys() & humidities.keys())]
+
+def join_series(temperature_files: Sequence, humidity_files: Sequence,
+                tolerance: int = DEFAULT_JOIN_TOLERANCE) -> JoinedSeries:
+    """
+    Bir yer ve tarihe ait sıcaklık ve nem dosyalarını merge_join ile eşleştirir.
+    Dosya ayrıştırılamazsa MeasurementParseError fırlatılır.
+    """
+    first = temperature_files[0]
+    joined = JoinedSeries(first.location, first.date,
+                          [data.id for data in temperature_files], [data.id for data in humidity_files])
+    temperature_times, temperature_values = _ordered_columns(temperature_files)
+    humidity_times, humidity_values = _ordered_columns(humidity_files)
+    left_index, right_index = merge_join(temperature_times, humidity_times, tolerance)
+    joined.times = array(TIME_TYPECODE, (temperature_times[i] for i in left_index))
+    joined.temperature = array(VALUE_TYPECODE, (temperature_values[i] for i in left_index))
+    joined.humidity = array(VALUE_TYPECODE, (humidity_values[j] for j in right_index))
+    return joined
+
+# --- Türetilmiş büyüklükler (tüm sütun üzerinde tek geçiş) ---
+
+def dew_point(temperatures: Sequence[float], humidities: Sequence[float]) -> array:
+    """Magnus formülüyle çiy noktası (°C). Bağıl nem yüzde olarak verilir."""
+    if any(rh <= 0 for rh in humidities):
+        raise ValueError("Çiy noktası için bağıl nem 0'dan büyük olmalıdır.")
+    b, c, log = _MAGNUS_B, _MAGNUS_C, math.log
+    gammas = (log(rh / 100.0) + b * t / (c + t) for t, rh in zip(temperatures, humidities))
+    return array(VALUE_TYPECODE, (c * gamma / (b - gamma) for gamma in gammas))
+
+def _heat_index_fahrenheit(tf: float, rh: float) -> float:
+    """NOAA hissedilen sıcaklık hesabı (°F): basit formül, 80 °F üstünde Rothfusz regresyonu."""
+    simple = 0.5 * (tf + 61.0 + (tf - 68.0) * 1.2 + rh * 0.094)
+    if (simple + tf) / 2 < 80.0:
+        return simple
+    hi = (-42.379 + 2.04901523 * tf + 10.14333127 * rh - 0.22475541 * tf * rh - 0.00683783 * tf * tf
+          - 0.05481717 * rh * rh + 0.00122874 * tf * tf * rh + 0.00085282 * tf * rh * rh
+          - 0.00000199 * tf * tf * rh * rh)
+    if rh < 13 and 80.0 <= tf <= 112.0:
+        hi -= (13 - rh) / 4 * math.sqrt((17 - abs(tf - 95.0)) / 17)
+    elif rh > 85 and 80.0 <= tf <= 87.0:
+        hi += (rh - 85) / 10 * (87 - tf) / 5
+    return hi
+
+def heat_index(temperatures: Sequence[float], humidities: Sequence[float]) -> array:
+    """Hissedilen sıcaklık (°C); NOAA yöntemi, hesap °F üzerinden yapılır."""
+    return array(VALUE_TYPECODE, ((_heat_index_fahrenheit(t * 1.8 + 32.0, rh) - 32.0) / 1.8
+                                  for t, rh in zip(temperatures, humidities)))
+
+# Türetilmiş büyüklük adı (sonuçların yazıldığı tip klasörü) -> (sıcaklık, nem) sütunlarından hesap
+DERIVED_METRICS: Dict[str, Callable[[Sequence[float], Sequence[float]], array]] = {
+    'çiy noktası': dew_point,
+    'hissedilen sıcaklık': heat_index,
+}
+
+# --- Korelasyon ---
+
+class PairedSeriesSummary(SeriesSummary):
+    """values (sıcaklık) ile aynı sırada eşleşmiş ikinci bir seri (nem) taşıyan özet."""
+
+    def __init__(self, data_values: Sequence[float], paired_values: Sequence[float],
+                 times: Sequence[int] = None):
+        super().__init__(data_values, times)
+        self.paired = SeriesSummary(paired_values)
+
+    @cached_property
+    def co_deviation_sum(self) -> float:
+        """Ortalamalardan sapmaların çarpımlarının toplamı (eş-moment)."""
+        mean_x, mean_y = self.mean, self.paired.mean
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(self.values, self.paired.values))
+
+class CorrelationCalculationStrategy(ICalculationStrategy):
+    """
+    Eşleşmiş iki seri arasındaki Pearson korelasyon katsayısı.
+    Kısmi özet (adet, ortalama x, ortalama y, M2 x, M2 y, eş-moment) olduğu için dosya
+    bazındaki sonuçlar Chan vd. birleştirmesiyle global korelasyona indirgenir.
+    """
+
+    def calculate(self, data_values: List[Tuple[float, float]]) -> float:
+        """data_values: (x, y) çiftleri."""
+        xs = [x for x, _ in data_values]
+        ys = [y for _, y in data_values]
+        return self.calculate_from_summary(PairedSeriesSummary(xs, ys))
+
+    def calculate_from_summary(self, summary: SeriesSummary) -> float:
+        return self.calculate_from_partial(self.partial_from_summary(summary))
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Tuple[int, float, float, float, float, float]:
+        if not summary.count:
+            return (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        if not isinstance(summary, PairedSeriesSummary):
+            raise ValueError("Korelasyon için eşleştirilmiş sıcaklık ve nem serisi gerekir.")
+        return (summary.count, summary.mean, summary.paired.mean, summary.squared_deviation_sum,
+                summary.paired.squared_deviation_sum, summary.co_deviation_sum)
+
+    def merge_partials(self, left: tuple, right: tuple) -> tuple:
+        n_a, mean_x_a, mean_y_a, m2_x_a, m2_y_a, c_a = left
+        n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_b = right
+        if not n_a or not n_b:
+            return right if not n_a else left
+        n = n_a + n_b
+        delta_x = mean_x_b - mean_x_a
+        delta_y = mean_y_b - mean_y_a
+        weight = n_a * n_b / n
+        return (n, mean_x_a + delta_x * n_b / n, mean_y_a + delta_y * n_b / n,
+                m2_x_a + m2_x_b + delta_x * delta_x * weight,
+                m2_y_a + m2_y_b + delta_y * delta_y * weight,
+                c_a + c_b + delta_x * delta_y * weight)
+
+    def calculate_from_partial(self, partial: tuple) -> float:
+        n, _, _, m2_x, m2_y, co_moment = partial
+        if n < 2:
+            raise ValueError("Korelasyon için en az iki eşleşmiş ölçüm gerekir.")
+        if not m2_x or not m2_y:
+            raise ValueError("Serilerden biri sabit olduğu için korelasyon tanımsız.")
+        return co_moment / math.sqrt(m2_x * m2_y)
+
+    @property
+    def name(self) -> str:
+        return "Korelasyon"
@@ -0,0 +1,44 @@
+# strategy_registry.py
+#
+# Arayüzde ve komut satırında kullanılan hesaplama stratejilerinin kaydı.
+# Strateji modülleri burada import edilmez; yalnızca strateji ilk kullanıldığında yüklenir.
+
+import importlib
+from typing import Dict
+
+# Strateji adı -> "modül:sınıf" (sıra arayüzdeki checkbox sırasıdır)
+STRATEGY_CLASSES: Dict[str, str] = {
+    'Ortalama': 'calculation_strategies:AverageCalculationStrategy',
+    'Maksimum': 'calculation_strategies:MaximumCalculationStrategy',
+    'Minimum': 'calculation_strategies:MinimumCalculationStrategy',
+    'Standart Sapma': 'calculation_strategies:StandardDeviationCalculationStrategy',
+    'Frekans': 'calculation_strategies:FrequencyCalculationStrategy',
+    'Histogram': 'calculation_strategies:HistogramCalculationStrategy',
+    'Medyan': 'calculation_strategies:MedianCalculationStrategy',
+    'Persentil': 'calculation_strategies:PercentileCalculationStrategy',
+    'Yaklaşık Persentil': 'calculation_strategies:ApproximatePercentileCalculationStrategy',
+    'Saatlik Özet': 'time_series_strategies:ResamplingCalculationStrategy',
+    'Kayan Pencere': 'time_series_strategies:RollingWindowCalculationStrategy',
+    'Boşluk Tespiti': 'time_series_strategies:GapDetectionCalculationStrategy',
+}
+
+def normalize_strategy_name(name: str) -> str:
+    """Strateji adını büyük/küçük harf, boşluk ve alt çizgiden bağımsız karşılaştırma için sadeleştirir."""
+    return name.lower().replace(' ', '').replace('_', '')
+
+def find_strategy_name(name: str) -> str:
+    """Verilen adı kayıtlı strateji adına çevirir; bulunamazsa KeyError fırlatır."""
+    wanted = normalize_strategy_name(name)
+    for registered_name in STRATEGY_CLASSES:
+        if normalize_strategy_name(registered_name) == wanted:
+            return registered_name
+    raise KeyError(name)
+
+def load_strategy(name: str):
+    """Kayıtlı strateji sınıfını ilk kullanımda yükler ve bir örneğini döndürür."""
+    module_name, class_name = STRATEGY_CLASSES[name].split(':')
+    return getattr(importlib.import_module(module_name), class_name)()
+
+def load_all_strategies() -> Dict[str, object]:
+    """Kayıtlı tüm stratejilerin birer örneğini kayıt sırasıyla döndürür."""
+    return {name: load_strategy(name) for name in STRATEGY_CLASSES}
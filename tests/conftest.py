@@ -0,0 +1,8 @@
+# tests/conftest.py
+#
+# Modüller depo kökünde düz dosyalar olduğu için testler kökü import yoluna ekler.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
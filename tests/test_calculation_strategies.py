@@ -0,0 +1,140 @@
+# tests/test_calculation_strategies.py
+#
+# Paylaşılan özetten hesaplanan sonuçların calculate() ile bit düzeyinde aynı olması;
+# MergeableHistogram ve tam persentil: dosya bazındaki kısmi özetlerin birleştirilmesi,
+# tüm değerlerin tek listede sıralanmasıyla bulunan sonuçlarla karşılaştırılır.
+
+import math
+import random
+import statistics
+from collections import Counter
+import pytest
+from calculation_strategies import (AverageCalculationStrategy, FrequencyCalculationStrategy, FusedCalculationEngine,
+                                    GlobalAggregator, MaximumCalculationStrategy, MedianCalculationStrategy,
+                                    MergeableHistogram, MinimumCalculationStrategy, PercentileCalculationStrategy,
+                                    SeriesSummary, StandardDeviationCalculationStrategy)
+
+FRACTIONS = (0.0, 0.05, 0.25, 0.5, 0.95, 0.99, 1.0)
+
+def naive_quantiles(values, fractions):
+    """Sıralı değerler üzerinde doğrusal aradeğerli kantiller."""
+    ordered = sorted(values)
+    results = []
+    for fraction in fractions:
+        position = fraction * (len(ordered) - 1)
+        lower, upper = ordered[math.floor(position)], ordered[math.ceil(position)]
+        results.append(lower + (upper - lower) * (position - math.floor(position)))
+    return results
+
+SUMMARY_STRATEGIES = (AverageCalculationStrategy, StandardDeviationCalculationStrategy, MaximumCalculationStrategy,
+                      MinimumCalculationStrategy, MedianCalculationStrategy)
+
+def test_summary_matches_calculate_on_known_series():
+    values = [0.1, 0.2, 0.3, 0.1, 0.2, 0.3, 0.1, 0.2]
+    assert AverageCalculationStrategy().calculate_from_summary(SeriesSummary(values)) == 0.18750000000000003
+    assert AverageCalculationStrategy().calculate(values) == 0.18750000000000003
+
+@pytest.mark.parametrize('seed', range(200))
+def test_summary_results_are_bit_identical(seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 400)
+    if seed % 2:
+        values = [rng.choice((0.1, 0.2, 0.3, 12.7, -3.3)) for _ in range(n)] # Az sayıda farklı değer
+    else:
+        values = [rng.uniform(-40, 60) for _ in range(n)]
+    summary = SeriesSummary(values)
+    summary.value_counts # Sayımların önceden hesaplanmış olması sonucu değiştirmemeli
+    results, errors = FusedCalculationEngine([strategy() for strategy in SUMMARY_STRATEGIES]).calculate_summary(summary)
+    assert not errors
+    for strategy_class in SUMMARY_STRATEGIES:
+        strategy = strategy_class()
+        assert results[strategy.name] == strategy.calculate(values)
+        assert strategy.calculate_from_summary(SeriesSummary(values)) == strategy.calculate(values)
+
+def random_chunks(rng, count, size, distinct):
+    return [[round(rng.uniform(-50, 50), distinct) for _ in range(rng.randint(1, size))] for _ in range(count)]
+
+def merged_histogram(chunks, max_bins):
+    histogram = MergeableHistogram(max_bins)
+    for chunk in chunks:
+        histogram.merge(MergeableHistogram.from_value_counts(dict(Counter(chunk)), max_bins))
+    return histogram
+
+@pytest.mark.parametrize('seed', range(10))
+def test_unbinned_histogram_is_exact(seed):
+    rng = random.Random(seed)
+    chunks = random_chunks(rng, 20, 2000, distinct=6)
+    values = [value for chunk in chunks for value in chunk]
+    histogram = merged_histogram(chunks, max_bins=None)
+    assert histogram.bin_width == 0.0
+    assert histogram.counts == Counter(values)
+    assert histogram.quantiles(FRACTIONS) == naive_quantiles(values, FRACTIONS)
+    assert histogram.median() == statistics.median(values)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_rebinned_counts_match_naive_binning(seed):
+    rng = random.Random(seed)
+    chunks = random_chunks(rng, 20, 2000, distinct=6)
+    values = [value for chunk in chunks for value in chunk]
+    histogram = merged_histogram(chunks, max_bins=rng.choice((16, 100, 1000)))
+
+    width = histogram.bin_width
+    assert width > 0 and math.log2(width).is_integer()
+    assert len(histogram.counts) <= histogram.max_bins
+    # İç içe kutular: art arda yeniden kutulama tek seferde kutulamayla aynı sayımları verir
+    assert histogram.counts == Counter(math.floor(value / width) * width for value in values)
+    assert histogram.count == len(values)
+    assert (histogram.minimum, histogram.maximum) == (min(values), max(values))
+
+@pytest.mark.parametrize('seed', range(10))
+def test_rebinned_quantiles_within_half_bin(seed):
+    rng = random.Random(seed)
+    chunks = random_chunks(rng, 10, 3000, distinct=4)
+    values = [value for chunk in chunks for value in chunk]
+    histogram = merged_histogram(chunks, max_bins=64)
+    for approximate, exact in zip(histogram.quantiles(FRACTIONS), naive_quantiles(values, FRACTIONS)):
+        assert abs(approximate - exact) <= histogram.bin_width / 2 + 1e-9
+
+def test_merge_histograms_with_different_widths():
+    rng = random.Random(3)
+    wide = [rng.uniform(0, 10_000) for _ in range(5000)]
+    narrow = [rng.uniform(0, 10) for _ in range(5000)]
+    for first, second in ((wide, narrow), (narrow, wide)):
+        histogram = merged_histogram([first, second], max_bins=256)
+        width = histogram.bin_width
+        assert histogram.counts == Counter(math.floor(value / width) * width for value in first + second)
+
+def test_exact_percentile_past_default_bin_limit():
+    # Farklı değer sayısı MergeableHistogram'ın varsayılan sınırını (65536) aşsa da sonuç tamdır
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(80_000)]
+    strategy = PercentileCalculationStrategy(quantiles=(0.01, 0.5, 0.95, 0.999))
+    partial = None
+    for start in range(0, len(values), 7_000):
+        chunk_partial = strategy.partial_from_summary(SeriesSummary(values[start:start + 7_000]))
+        partial = chunk_partial if partial is None else strategy.merge_partials(partial, chunk_partial)
+    assert strategy.calculate_from_partial(partial) == strategy.calculate(values)
+    assert list(strategy.calculate(values).values()) == naive_quantiles(values, strategy.quantiles)
+
+@pytest.mark.parametrize('strategy', [FrequencyCalculationStrategy(max_distinct_values=1000),
+                                      PercentileCalculationStrategy(max_distinct_values=1000)],
+                         ids=lambda strategy: strategy.name)
+def test_exact_partials_stop_at_distinct_limit(strategy):
+    # Akış parçaları birleştirilirken özet sınırın ötesine büyümez; hata sayımlar eklenmeden verilir
+    distinct = lambda partial: len(partial if isinstance(partial, dict) else partial.counts)
+    partial = strategy.partial_from_summary(SeriesSummary([float(v) for v in range(950)] * 2))
+    over = strategy.partial_from_summary(SeriesSummary([float(v) for v in range(900, 1100)]))
+    with pytest.raises(ValueError):
+        strategy.merge_partials(partial, over)
+    assert distinct(partial) == 950
+
+    aggregator = GlobalAggregator([strategy])
+    for start in range(0, 1100, 100):
+        aggregator.add(SeriesSummary([float(v) for v in range(start, start + 100)]))
+    results, errors = aggregator.calculate()
+    assert strategy.name in errors and strategy.name not in results
+
+    within_limit = GlobalAggregator([strategy])
+    for start in range(0, 1000, 100):
+        within_limit.add(SeriesSummary([float(v) for v in range(start, start + 100)]))
+    assert strategy.name in within_limit.calculate()[0]
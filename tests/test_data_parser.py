@@ -0,0 +1,43 @@
+# tests/test_data_parser.py
+#
+# Aynı id ve tarihli dosyalar, okuma sırasından bağımsız olarak dosya yoluna göre sıralanır;
+# önbellekten yüklenen dosyaların hatalı satır sayıları da raporlanır.
+
+import os
+import pytest
+from data_parser import MeasurementParser
+from parse_cache import ParsedDataCache
+
+def write_measurement(folder, name, value):
+    with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+        f.write("id:3 ölçüm: nem - yer: YER - tarih: 11.11.2011\n")
+        f.write(f"08:00:00,{value}\n")
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_equal_id_and_date_are_ordered_by_file_path(tmp_path, workers):
+    folder = tmp_path / 'nem'
+    folder.mkdir()
+    for name, value in (('id3_Nem_YER_11.11.2011_c.txt', 3.0), ('id3_Nem_YER_11.11.2011_a.txt', 1.0),
+                        ('id3_Nem_YER_11.11.2011_b.txt', 2.0)):
+        write_measurement(str(folder), name, value)
+
+    parser = MeasurementParser(verbose=False)
+    measurements = parser.get_all_measurements_in_folder(str(tmp_path), workers=workers, chunk_size=1)['nem']
+
+    assert [os.path.basename(data.file_path) for data in measurements] == [
+        'id3_Nem_YER_11.11.2011_a.txt', 'id3_Nem_YER_11.11.2011_b.txt', 'id3_Nem_YER_11.11.2011_c.txt']
+    assert [data.value_column[0] for data in measurements] == [1.0, 2.0, 3.0]
+
+def test_cache_hit_reports_rejected_lines(tmp_path):
+    folder = tmp_path / 'nem'
+    folder.mkdir()
+    with open(folder / 'id3_Nem_YER_11.11.2011.txt', 'w', encoding='utf-8') as f:
+        f.write("id:3 ölçüm: nem - yer: YER - tarih: 11.11.2011\n08:00:00,60.0\nbozuk satır\n08:10:00,x\n08:15:00,61.0\n")
+    cache = ParsedDataCache(str(tmp_path / 'cache'))
+
+    for _ in range(2): # İkinci okuma önbellekten gelir
+        parser = MeasurementParser(verbose=False, cache=cache)
+        data = parser.get_all_measurements_in_folder(str(tmp_path))['nem'][0]
+        assert list(data.value_column) == [60.0, 61.0]
+        assert parser.rejected_lines == {str(folder / 'id3_Nem_YER_11.11.2011.txt'): 2}
+    assert len(os.listdir(tmp_path / 'cache')) == 1
@@ -0,0 +1,89 @@
+# tests/test_decimation.py
+#
+# min_max_buckets ve lttb, kovaları ve üçgen alanlarını doğrudan tanımından hesaplayan
+# basit uygulamalarla karşılaştırılır.
+
+import math
+import random
+import pytest
+from decimation import lttb, min_max_buckets
+
+def naive_min_max_buckets(x, y, edges):
+    """Her kovadan ilk en küçük ve ilk en büyük noktanın indeksleri (zaman sırasıyla)."""
+    indices = []
+    for start, end in zip(edges, edges[1:]):
+        bucket = range(start, end)
+        if len(bucket) <= 2:
+            indices.extend(bucket)
+            continue
+        low = min(bucket, key=lambda i: (y[i], i))
+        high = min(bucket, key=lambda i: (-y[i], i))
+        indices.extend(sorted({low, high}))
+    return [x[i] for i in indices], [y[i] for i in indices]
+
+def triangle_area(a, b, c):
+    """Üç noktanın oluşturduğu üçgenin alanı (ayakkabı bağı formülü)."""
+    return abs(a[0] * (b[1] - c[1]) + b[0] * (c[1] - a[1]) + c[0] * (a[1] - b[1])) / 2
+
+def naive_lttb(points, threshold):
+    """Kovalar ve alanlar tanımdan; her kovada en büyük alanlı ilk nokta seçilir."""
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+    size = (n - 2) / (threshold - 2)
+    buckets = [list(range(math.floor(i * size) + 1, math.floor((i + 1) * size) + 1)) for i in range(threshold - 2)]
+    buckets.append([n - 1])
+    selected = [points[0]]
+    for bucket, following in zip(buckets, buckets[1:]):
+        following_points = [points[i] for i in following]
+        average = (sum(p[0] for p in following_points) / len(following_points),
+                   sum(p[1] for p in following_points) / len(following_points))
+        areas = [triangle_area(selected[-1], points[i], average) for i in bucket]
+        selected.append(points[bucket[areas.index(max(areas))]])
+    selected.append(points[-1])
+    return selected
+
+def random_series(rng, n):
+    x, t = [], 0
+    for _ in range(n):
+        t += rng.randint(1, 60)
+        x.append(t)
+    return x, [rng.gauss(20, 5) for _ in range(n)]
+
+def random_edges(rng, n):
+    inner = sorted(rng.randint(0, n) for _ in range(rng.randint(0, 40)))
+    return [0] + inner + [n]
+
+@pytest.mark.parametrize('seed', range(20))
+def test_min_max_buckets_matches_naive(seed):
+    rng = random.Random(seed)
+    n = rng.randint(0, 500)
+    x, y = random_series(rng, n)
+    if rng.random() < 0.5:
+        y = [float(round(value)) for value in y] # Eşit değerlerde ilk görülen seçilmeli
+    edges = random_edges(rng, n)
+    xs, ys = min_max_buckets(x, y, edges)
+    assert (list(xs), list(ys)) == naive_min_max_buckets(x, y, edges)
+
+def test_min_max_buckets_keeps_extremes():
+    rng = random.Random(7)
+    x, y = random_series(rng, 10_000)
+    _, ys = min_max_buckets(x, y, list(range(0, 10_001, 137)) + [10_000])
+    assert (min(ys), max(ys)) == (min(y), max(y))
+
+@pytest.mark.parametrize('seed', range(20))
+def test_lttb_matches_naive(seed):
+    rng = random.Random(seed)
+    x, y = random_series(rng, rng.randint(3, 2000))
+    threshold = rng.randint(3, len(x) + 5)
+    xs, ys = lttb(x, y, threshold)
+    assert list(zip(xs, ys)) == naive_lttb(list(zip(x, y)), threshold)
+    assert len(xs) == min(threshold, len(x))
+    assert (xs[0], xs[-1]) == (x[0], x[-1])
+    assert all(a < b for a, b in zip(xs, xs[1:]))
+
+@pytest.mark.parametrize('threshold', (0, 1, 2))
+def test_lttb_small_threshold_returns_input(threshold):
+    x, y = [1, 2, 3, 4], [1.0, 3.0, 2.0, 5.0]
+    xs, ys = lttb(x, y, threshold)
+    assert (list(xs), list(ys)) == (x, y)
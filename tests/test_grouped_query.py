@@ -0,0 +1,88 @@
+# tests/test_grouped_query.py
+#
+# Gruplu indirgeme: tek taramalı segment özetlerinden bulunan sonuçlar, her grubun
+# değerleri üzerinde stratejilerin calculate() sonuçlarıyla bit düzeyinde karşılaştırılır.
+
+import datetime
+import random
+from array import array
+import pytest
+from calculation_strategies import (AverageCalculationStrategy, FrequencyCalculationStrategy,
+                                    MaximumCalculationStrategy, MedianCalculationStrategy,
+                                    MinimumCalculationStrategy, StandardDeviationCalculationStrategy)
+from data_parser import MeasurementParseError, MeasurementStream
+from grouped_query import GroupedQuery, SegmentedValues
+
+STRATEGIES = [AverageCalculationStrategy(), StandardDeviationCalculationStrategy(), MaximumCalculationStrategy(),
+              MinimumCalculationStrategy(), MedianCalculationStrategy(), FrequencyCalculationStrategy()]
+
+class FakeData:
+    def __init__(self, values, failing=False):
+        self.id = '1'
+        self.measurement_type = 'sıcaklık'
+        self.location = 'YER'
+        self.date = datetime.date(2011, 11, 11)
+        self._values = array('d', values)
+        self._failing = failing
+
+    @property
+    def value_column(self):
+        if self._failing:
+            raise MeasurementParseError("bozuk dosya")
+        return self._values
+
+class FailingStream(MeasurementStream):
+    """İlk parçayı verip ardından ayrıştırma hatası fırlatan akış."""
+
+    def __init__(self, values):
+        self.id = '2'
+        self.measurement_type = 'nem'
+        self.values = array('d', values)
+
+    def iter_batches(self):
+        yield array('i', range(len(self.values))), self.values
+        raise MeasurementParseError("dosya yarıda kesildi")
+
+def random_segments(rng):
+    segments = SegmentedValues()
+    for key in range(rng.randint(1, 30)):
+        for _ in range(rng.randint(1, 3)):
+            n = rng.randint(0, 50)
+            if key % 2:
+                segments.append((key,), [rng.choice((0.1, 0.2, 0.3, 21.5)) for _ in range(n)])
+            else:
+                segments.append((key,), [rng.uniform(-10, 40) for _ in range(n)])
+    if segments.keys:
+        segments.offsets.append(len(segments.values))
+    return segments
+
+@pytest.mark.parametrize('seed', range(30))
+def test_reduce_matches_calculate_per_group(seed):
+    segments = random_segments(random.Random(seed))
+    grouped_results = GroupedQuery([]).reduce(segments, STRATEGIES)
+    assert list(grouped_results) == segments.keys
+    for i, key in enumerate(segments.keys):
+        values = list(segments.segment(i))
+        results, errors = grouped_results[key]
+        for strategy in STRATEGIES:
+            try:
+                expected = strategy.calculate(values)
+            except ValueError:
+                assert strategy.name in errors
+                continue
+            assert results[strategy.name] == expected
+        assert list(results) == [strategy.name for strategy in STRATEGIES if strategy.name in results]
+
+def test_failed_reads_add_no_group_and_no_values():
+    logged = []
+    selected = [
+        (('a',), FakeData([1.0, 2.0], failing=True)), # Grubun tek dosyası okunamıyor
+        (('b',), FailingStream([5.0, 6.0])), # Akış yarıda kesiliyor
+        (('b',), FakeData([3.0])),
+        (('c',), FakeData([4.0, 8.0])),
+    ]
+    segments = GroupedQuery([]).build_segments(selected, logged.append)
+    assert segments.keys == [('b',), ('c',)]
+    assert segments.file_counts == [1, 1]
+    assert [list(segments.segment(i)) for i in range(len(segments))] == [[3.0], [4.0, 8.0]]
+    assert len(logged) == 2
@@ -0,0 +1,91 @@
+# tests/test_quantile_sketch.py
+#
+# KLL özeti: birleştirme sonrası ağırlıkların korunması ve kantillerin gerçek sıralara
+# göre hata sınırı içinde kalması, sıralanmış değerlerle karşılaştırılarak sınanır.
+
+import bisect
+import math
+import random
+import pytest
+from calculation_strategies import SeriesSummary
+from quantile_sketch import KLLSketch, k_for_rank_error
+
+FRACTIONS = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+RANK_ERROR = 0.01
+
+def rank_distance(sorted_values, value, fraction):
+    """value'nun sıralı değerlerdeki normalize sıra aralığının fraction'a uzaklığı (aralık içindeyse 0)."""
+    n = len(sorted_values)
+    low = bisect.bisect_left(sorted_values, value) / n
+    high = bisect.bisect_right(sorted_values, value) / n
+    return max(low - fraction, fraction - high, 0.0)
+
+def stored_weight(sketch):
+    return sum(len(level) << height for height, level in enumerate(sketch.compactors))
+
+def new_sketch(seed=0):
+    return KLLSketch(k_for_rank_error(RANK_ERROR), seed)
+
+def test_small_input_is_exact():
+    # Kapasite aşılmadıkça sıkıştırma olmaz; kantiller SeriesSummary.quantiles ile aynıdır
+    values = [float(v) for v in random.Random(0).sample(range(1000), 100)]
+    sketch = new_sketch()
+    sketch.extend(values)
+    assert sketch.quantiles(FRACTIONS) == SeriesSummary(values).quantiles(FRACTIONS)
+
+def test_quantiles_interpolate_between_adjacent_ranks():
+    sketch = new_sketch()
+    sketch.extend([4.0, 1.0, 3.0, 2.0])
+    assert sketch.quantiles([0.5, 0.25, 0.0, 1.0]) == [2.5, 1.75, 1.0, 4.0]
+
+def test_odd_level_keeps_a_random_value():
+    # Tek sayıdaki seviyede kalan değer ve taşınan (tek/çift) yarı rastgele seçilir;
+    # her zaman en küçüğü bırakmak üst seviyelere taşınan değerleri yukarı kaydırırdı
+    kept, promoted = set(), set()
+    for seed in range(50):
+        sketch = KLLSketch(8, seed)
+        sketch.extend([float(v) for v in range(9)]) # Tam kapasite: bir kez sıkıştırılır
+        assert stored_weight(sketch) == 9
+        kept.update(sketch.compactors[0])
+        promoted.add(tuple(sketch.compactors[1]))
+    assert len(kept) > 2
+    assert len(promoted) > 2
+
+@pytest.mark.parametrize('seed', range(5))
+def test_quantiles_within_rank_error(seed):
+    rng = random.Random(seed)
+    values = [rng.gauss(20, 5) for _ in range(50_000)]
+    sketch = new_sketch(seed)
+    sketch.extend(values)
+    ordered = sorted(values)
+    for fraction, value in zip(FRACTIONS, sketch.quantiles(FRACTIONS)):
+        assert rank_distance(ordered, value, fraction) <= 2 * RANK_ERROR
+    assert sketch.quantiles([0.0, 1.0]) == [ordered[0], ordered[-1]]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_merge_matches_combined_values(seed):
+    rng = random.Random(seed)
+    chunks = [[rng.uniform(-10, 40) + offset for _ in range(rng.randint(0, 8000))] for offset in range(12)]
+    merged = new_sketch(seed)
+    for i, chunk in enumerate(chunks):
+        sketch = new_sketch(seed + i)
+        sketch.extend(chunk)
+        merged.merge(sketch)
+
+    ordered = sorted(value for chunk in chunks for value in chunk)
+    assert merged.count == len(ordered)
+    assert stored_weight(merged) == len(ordered) # Sıkıştırma toplam ağırlığı korur
+    assert (merged.minimum, merged.maximum) == (ordered[0], ordered[-1])
+    assert sum(len(level) for level in merged.compactors) <= 4 * merged.k
+    for fraction, value in zip(FRACTIONS, merged.quantiles(FRACTIONS)):
+        assert rank_distance(ordered, value, fraction) <= 2 * RANK_ERROR
+
+def test_merge_with_empty_sketch():
+    sketch = new_sketch()
+    sketch.extend([3.0, 1.0, 2.0])
+    assert sketch.merge(new_sketch()).quantiles([0.5]) == [2.0]
+    assert new_sketch().merge(sketch).quantiles([0.5]) == [2.0]
+
+def test_empty_sketch_raises():
+    with pytest.raises(ValueError):
+        new_sketch().quantiles([0.5])
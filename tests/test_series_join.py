@@ -0,0 +1,79 @@
+# tests/test_series_join.py
+#
+# merge_join tek geçişli eşleştirmesi, her sol nokta için tüm sağ noktaları tarayan
+# basit eşleştirmeyle karşılaştırılır.
+
+import random
+import pytest
+from series_join import merge_join
+
+def naive_exact_join(left_times, right_times):
+    """Eşit zamanlı noktaları sırayla birebir eşler (her sağ nokta en fazla bir kez)."""
+    unused = {}
+    for j, t in enumerate(right_times):
+        unused.setdefault(t, []).append(j)
+    pairs = []
+    for i, t in enumerate(left_times):
+        if unused.get(t):
+            pairs.append((i, unused[t].pop(0)))
+    return pairs
+
+def naive_nearest_join(left_times, right_times, tolerance):
+    """Her sol noktaya en yakın sağ nokta; eşit uzaklıkta önceki (küçük zamanlı) nokta."""
+    pairs = []
+    for i, t in enumerate(left_times):
+        candidates = [(abs(r - t), r > t, j) for j, r in enumerate(right_times) if abs(r - t) <= tolerance]
+        if candidates:
+            pairs.append((i, min(candidates)[2]))
+    return pairs
+
+def sorted_times(rng, n, max_step, strictly_increasing=True):
+    times, t = [], rng.randint(0, 100)
+    for _ in range(n):
+        t += rng.randint(1 if strictly_increasing else 0, max_step)
+        times.append(t)
+    return times
+
+def as_pairs(indices):
+    left_index, right_index = indices
+    assert len(left_index) == len(right_index)
+    return list(zip(left_index, right_index))
+
+@pytest.mark.parametrize('seed', range(20))
+def test_exact_join_matches_naive(seed):
+    rng = random.Random(seed)
+    left = sorted_times(rng, rng.randint(0, 300), 4, strictly_increasing=False)
+    right = sorted_times(rng, rng.randint(0, 300), 4, strictly_increasing=False)
+    assert as_pairs(merge_join(left, right, 0)) == naive_exact_join(left, right)
+
+@pytest.mark.parametrize('seed', range(20))
+def test_tolerance_join_matches_naive(seed):
+    rng = random.Random(seed)
+    left = sorted_times(rng, rng.randint(0, 300), rng.choice((5, 30, 90)))
+    right = sorted_times(rng, rng.randint(0, 300), rng.choice((5, 30, 90)))
+    tolerance = rng.choice((1, 10, 30, 120))
+    assert as_pairs(merge_join(left, right, tolerance)) == naive_nearest_join(left, right, tolerance)
+
+def test_tolerance_tie_prefers_earlier_point():
+    assert as_pairs(merge_join([10], [5, 15], 5)) == [(0, 0)]
+    assert as_pairs(merge_join([10], [5, 15], 4)) == []
+
+def test_tolerance_reuses_right_points():
+    # Seyrek sağ seride bir nokta birden fazla sol noktaya eşlenebilir
+    assert as_pairs(merge_join([0, 10, 20, 30], [12], 20)) == [(0, 0), (1, 0), (2, 0), (3, 0)]
+
+@pytest.mark.parametrize('seed', range(10))
+def test_tolerance_join_with_repeated_right_times(seed):
+    # Eşit zamanlı sağ noktalarda hangisinin seçildiği belirsizdir; uzaklık en küçük olmalıdır
+    rng = random.Random(seed)
+    left = sorted_times(rng, 200, 20, strictly_increasing=False)
+    right = sorted_times(rng, 200, 20, strictly_increasing=False)
+    actual = as_pairs(merge_join(left, right, 15))
+    expected = naive_nearest_join(left, right, 15)
+    assert [i for i, _ in actual] == [i for i, _ in expected]
+    assert [right[j] for _, j in actual] == [right[j] for _, j in expected]
+
+def test_empty_inputs():
+    for tolerance in (0, 10):
+        assert as_pairs(merge_join([], [1, 2], tolerance)) == []
+        assert as_pairs(merge_join([1, 2], [], tolerance)) == []
@@ -0,0 +1,78 @@
+# tests/test_time_series_strategies.py
+#
+# Kayan pencerenin monoton kuyruklu uygulaması, her nokta için pencereyi baştan
+# tarayan basit uygulamayla karşılaştırılır.
+
+import math
+import random
+import pytest
+from calculation_strategies import SeriesSummary
+from time_series_strategies import RollingWindowCalculationStrategy, format_seconds, rolling_window
+
+def naive_rolling_window(times, values, window_seconds):
+    """Her nokta için (t - window_seconds, t] penceresini baştan tarar: O(n^2)."""
+    for i, t in enumerate(times):
+        window = [values[j] for j in range(i + 1) if times[j] > t - window_seconds]
+        yield t, sum(window) / len(window), min(window), max(window)
+
+def assert_same_windows(actual, expected):
+    assert len(actual) == len(expected)
+    for (t, mean, minimum, maximum), (t_expected, mean_expected, min_expected, max_expected) in zip(actual, expected):
+        assert t == t_expected
+        assert math.isclose(mean, mean_expected, rel_tol=1e-9, abs_tol=1e-9)
+        assert minimum == min_expected
+        assert maximum == max_expected
+
+def random_series(rng, n, max_step, value_choices=None):
+    """Artan (eşit olabilen) zamanlar ve rastgele değerler."""
+    times, t = [], 0
+    for _ in range(n):
+        t += rng.randint(0, max_step)
+        times.append(t)
+    if value_choices is None:
+        values = [rng.uniform(-20, 40) for _ in range(n)]
+    else:
+        values = [rng.choice(value_choices) for _ in range(n)]
+    return times, values
+
+@pytest.mark.parametrize('seed', range(20))
+def test_rolling_window_matches_naive(seed):
+    rng = random.Random(seed)
+    times, values = random_series(rng, rng.randint(1, 300), max_step=rng.choice((1, 30, 120)))
+    window_seconds = rng.choice((1, 60, 300, 3600))
+    assert_same_windows(list(rolling_window(times, values, window_seconds)),
+                        list(naive_rolling_window(times, values, window_seconds)))
+
+@pytest.mark.parametrize('seed', range(10))
+def test_rolling_window_with_repeated_values_and_times(seed):
+    # Eşit değerler kuyruklarda eşitlik koşullarını, eşit zamanlar pencere sınırını sınar
+    rng = random.Random(seed)
+    times, values = random_series(rng, 200, max_step=3, value_choices=(1.0, 2.0, 3.0))
+    assert_same_windows(list(rolling_window(times, values, 5)),
+                        list(naive_rolling_window(times, values, 5)))
+
+def test_rolling_window_monotonic_series():
+    # Artan ve azalan serilerde kuyruklardan biri her adımda tamamen boşalır
+    times = list(range(0, 1000, 10))
+    for values in ([float(i) for i in range(100)], [float(-i) for i in range(100)]):
+        assert_same_windows(list(rolling_window(times, values, 55)),
+                            list(naive_rolling_window(times, values, 55)))
+
+def test_strategy_orders_unsorted_times():
+    rng = random.Random(1)
+    times = rng.sample(range(0, 86400, 7), 500) # Farklı ve sırasız zamanlar
+    values = [rng.uniform(0, 30) for _ in times]
+    result = RollingWindowCalculationStrategy(window_seconds=600).calculate_from_summary(SeriesSummary(values, times))
+
+    order = sorted(range(len(times)), key=times.__getitem__)
+    sorted_times = [times[i] for i in order]
+    sorted_values = [values[i] for i in order]
+    expected = list(naive_rolling_window(sorted_times, sorted_values, 600))
+    assert list(result) == [format_seconds(t) for t, *_ in expected]
+    for window, (_, mean, minimum, maximum) in zip(result.values(), expected):
+        assert math.isclose(window['ortalama'], mean, rel_tol=1e-9)
+        assert (window['minimum'], window['maksimum']) == (minimum, maximum)
+
+def test_strategy_requires_times():
+    with pytest.raises(ValueError):
+        RollingWindowCalculationStrategy().calculate_from_summary(SeriesSummary([1.0, 2.0]))
@@ -0,0 +1,37 @@
+# tests/test_watch.py
+#
+# İzleme modu: bir tipin son dosyası silinince o tipin eski çıktıları kalmaz.
+
+import os
+from output_writer import OutputWriter
+from strategy_registry import load_strategy
+from watch import IncrementalCalculator
+
+def write_measurement(folder, name, measurement_id, values):
+    with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+        f.write(f"id:{measurement_id} ölçüm: nem - yer: YER - tarih: 11.11.2011\n")
+        for minute, value in enumerate(values):
+            f.write(f"08:{minute:02d}:00,{value}\n")
+
+def test_removing_last_file_removes_type_outputs(tmp_path):
+    folder = tmp_path / 'olcumler' / 'nem'
+    folder.mkdir(parents=True)
+    write_measurement(str(folder), 'id3_Nem_YER_11.11.2011.txt', 3, [60.0, 62.5])
+    write_measurement(str(folder), 'id4_Nem_YER_11.11.2011.txt', 4, [55.0])
+    output_folder = tmp_path / 'sonuc' / 'nem'
+    strategies = [load_strategy('Ortalama'), load_strategy('Frekans')]
+    calculator = IncrementalCalculator(str(tmp_path / 'olcumler'), OutputWriter(str(tmp_path)),
+                                       strategies, strategies, log=lambda message: None)
+
+    calculator.poll()
+    outputs = sorted(os.listdir(output_folder))
+    assert outputs == ['frekanslar.txt', 'global_frekans.txt', 'global_ortalama.txt', 'ortalamalar.txt']
+
+    os.remove(folder / 'id3_Nem_YER_11.11.2011.txt')
+    calculator.poll()
+    assert sorted(os.listdir(output_folder)) == outputs
+    assert 'id:3' not in (output_folder / 'ortalamalar.txt').read_text(encoding='utf-8')
+
+    os.remove(folder / 'id4_Nem_YER_11.11.2011.txt')
+    assert calculator.poll().removed
+    assert os.listdir(output_folder) == []
@@ -0,0 +1,210 @@
+# time_series_strategies.py
+#
+# Ölçüm zamanlarını (gün başından itibaren saniye) kullanan hesaplama stratejileri.
+# Hepsi seri başına O(n) çalışır (zamanlar sıralı değilse bir kez sıralanır).
+
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from calculation_strategies import ICalculationStrategy, SeriesSummary, select_kth
+
+def format_seconds(seconds: int) -> str:
+    """Gün başından itibaren saniyeyi 'HH:MM:SS' olarak yazar."""
+    seconds = int(seconds) % 86400
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+def _require_times(summary: SeriesSummary, strategy_name: str):
+    if summary.times is None:
+        raise ValueError(f"{strategy_name} için ölçüm zamanları bulunmuyor.")
+    if not summary.count:
+        raise ValueError(f"{strategy_name} hesaplamak için veri bulunmuyor.")
+
+def _ordered_series(summary: SeriesSummary) -> Tuple[Sequence[int], Sequence[float]]:
+    """Zaman sırasına göre (zamanlar, değerler) döndürür; zaten sıralıysa kopyalamaz."""
+    order = summary.time_order
+    if order is None:
+        return summary.times, summary.values
+    return [summary.times[i] for i in order], [summary.values[i] for i in order]
+
+def rolling_window(times: Sequence[int], values: Sequence[float],
+                   window_seconds: int) -> Iterator[Tuple[int, float, float, float]]:
+    """
+    Zamana göre sıralı seride her nokta için (t - window_seconds, t] penceresinin
+    (zaman, ortalama, minimum, maksimum) değerlerini üretir.
+
+    Ortalama kayan toplamla, minimum ve maksimum monoton kuyruklarla tutulur:
+    her nokta kuyruklara bir kez girip bir kez çıktığı için toplam süre O(n)'dir.
+    """
+    total = 0.0
+    start = 0
+    min_queue = deque() # Değerleri artan indeksler
+    max_queue = deque() # Değerleri azalan indeksler
+    for i, (t, value) in enumerate(zip(times, values)):
+        total += value
+        while min_queue and values[min_queue[-1]] >= value:
+            min_queue.pop()
+        min_queue.append(i)
+        while max_queue and values[max_queue[-1]] <= value:
+            max_queue.pop()
+        max_queue.append(i)
+
+        # Pencereden çıkan noktalar
+        while times[start] <= t - window_seconds:
+            total -= values[start]
+            start += 1
+        while min_queue[0] < start:
+            min_queue.popleft()
+        while max_queue[0] < start:
+            max_queue.popleft()
+        yield t, total / (i - start + 1), values[min_queue[0]], values[max_queue[0]]
+
+class ResamplingCalculationStrategy(ICalculationStrategy):
+    """
+    Seriyi sabit aralıklara (varsayılan saatlik) böler ve her aralığın ortalama,
+    minimum ve maksimumunu verir. Aralık özetleri (adet, toplam, min, max) birleştirilebilir
+    olduğu için global sonuç (tüm dosyaların saatlik profili) ve akış modu da desteklenir.
+    """
+
+    def __init__(self, interval_seconds: int = 3600):
+        if interval_seconds <= 0:
+            raise ValueError("Aralık süresi pozitif olmalıdır.")
+        self.interval_seconds = interval_seconds
+
+    def calculate(self, data_values: List[float]) -> Dict[str, Dict[str, float]]:
+        raise ValueError(f"{self.name} için ölçüm zamanları bulunmuyor.")
+
+    def calculate_from_summary(self, summary: SeriesSummary) -> Dict[str, Dict[str, float]]:
+        _require_times(summary, self.name)
+        return self.calculate_from_partial(self.partial_from_summary(summary))
+
+    def partial_from_summary(self, summary: SeriesSummary) -> Dict[int, List[float]]:
+        """{aralık başlangıcı (saniye): [adet, toplam, min, max]}"""
+        buckets: Dict[int, List[float]] = {}
+        if summary.times is None:
+            return buckets
+        interval = self.interval_seconds
+        for t, value in zip(summary.times, summary.values):
+            key = t - t % interval
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [1, value, value, value]
+            else:
+                bucket[0] += 1
+                bucket[1] += value
+                if value < bucket[2]:
+                    bucket[2] = value
+                elif value > bucket[3]:
+                    bucket[3] = value
+        return buckets
+
+    def merge_partials(self, left: Dict[int, List[float]], right: Dict[int, List[float]]) -> Dict[int, List[float]]:
+        for key, (count, total, minimum, maximum) in right.items():
+            bucket = left.get(key)
+            if bucket is None:
+                left[key] = [count, total, minimum, maximum]
+            else:
+                bucket[0] += count
+                bucket[1] += total
+                bucket[2] = min(bucket[2], minimum)
+                bucket[3] = max(bucket[3], maximum)
+        return left
+
+    def calculate_from_partial(self, partial: Dict[int, List[float]]) -> Dict[str, Dict[str, float]]:
+        if not partial:
+            raise ValueError(f"{self.name} hesaplamak için zamanlı veri bulunmuyor.")
+        return {
+            format_seconds(key): {'ortalama': total / count, 'minimum': minimum, 'maksimum': maximum}
+            for key, (count, total, minimum, maximum) in sorted(partial.items())
+        }
+
+    output_layout = 'series'
+
+    @property
+    def name(self) -> str:
+        return "Saatlik Özet" if self.interval_seconds == 3600 else "Aralık Özeti"
+
+class RollingWindowCalculationStrategy(ICalculationStrategy):
+    """
+    Her ölçüm noktası için kendisiyle biten window_seconds uzunluğundaki zaman
+    penceresinin kayan ortalama, minimum ve maksimumunu verir (bkz. rolling_window).
+    Dosya bazında çalışır; global ve akış modunda hesaplanamaz.
+    """
+    supports_global = False
+
+    def __init__(self, window_seconds: int = 600):
+        if window_seconds <= 0:
+            raise ValueError("Pencere süresi pozitif olmalıdır.")
+        self.window_seconds = window_seconds
+
+    def calculate(self, data_values: List[float]) -> Dict[str, Dict[str, float]]:
+        raise ValueError(f"{self.name} için ölçüm zamanları bulunmuyor.")
+
+    def calculate_from_summary(self, summary: SeriesSummary) -> Dict[str, Dict[str, float]]:
+        _require_times(summary, self.name)
+        times, values = _ordered_series(summary)
+        return {
+            format_seconds(t): {'ortalama': mean, 'minimum': minimum, 'maksimum': maximum}
+            for t, mean, minimum, maximum in rolling_window(times, values, self.window_seconds)
+        }
+
+    def partial_from_summary(self, summary: SeriesSummary) -> None:
+        return None
+
+    def merge_partials(self, left: None, right: None) -> None:
+        return None
+
+    def calculate_from_partial(self, partial: None) -> Dict[str, Dict[str, float]]:
+        raise ValueError(f"{self.name} birleştirilmiş veri üzerinde hesaplanamaz.")
+
+    output_layout = 'series'
+
+    @property
+    def name(self) -> str:
+        return "Kayan Pencere"
+
+class GapDetectionCalculationStrategy(ICalculationStrategy):
+    """
+    Ardışık iki ölçüm arasındaki süre max_gap_seconds değerini aşan aralıkları bulur.
+    max_gap_seconds verilmezse eşik serinin tipik (medyan) örnekleme aralığının
+    gap_factor katıdır. Sonuç: {'başlangıç - bitiş': boşluk süresi (saniye)}; boşluk yoksa boş sözlük.
+    Dosya bazında çalışır; global ve akış modunda hesaplanamaz.
+    """
+    supports_global = False
+
+    def __init__(self, max_gap_seconds: Optional[int] = None, gap_factor: float = 3.0):
+        if max_gap_seconds is not None and max_gap_seconds <= 0:
+            raise ValueError("Boşluk eşiği pozitif olmalıdır.")
+        self.max_gap_seconds = max_gap_seconds
+        self.gap_factor = gap_factor
+
+    def calculate(self, data_values: List[float]) -> Dict[str, int]:
+        raise ValueError(f"{self.name} için ölçüm zamanları bulunmuyor.")
+
+    def calculate_from_summary(self, summary: SeriesSummary) -> Dict[str, int]:
+        _require_times(summary, self.name)
+        times, _ = _ordered_series(summary)
+        intervals = [current - previous for previous, current in zip(times, times[1:])]
+        if not intervals:
+            return {}
+        max_gap = self.max_gap_seconds
+        if max_gap is None:
+            max_gap = self.gap_factor * max(select_kth(intervals, len(intervals) // 2), 1)
+        return {
+            f"{format_seconds(times[i])} - {format_seconds(times[i + 1])}": interval
+            for i, interval in enumerate(intervals)
+            if interval > max_gap
+        }
+
+    def partial_from_summary(self, summary: SeriesSummary) -> None:
+        return None
+
+    def merge_partials(self, left: None, right: None) -> None:
+        return None
+
+    def calculate_from_partial(self, partial: None) -> Dict[str, int]:
+        raise ValueError(f"{self.name} birleştirilmiş veri üzerinde hesaplanamaz.")
+
+    output_layout = 'series'
+
+    @property
+    def name(self) -> str:
+        return "Boşluk Tespiti"
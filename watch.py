@@ -0,0 +1,233 @@
+# watch.py
+#
+# Ölçüm klasörünü periyodik olarak tarayıp yalnızca değişen dosyalardan etkilenen
+# sonuçları yeniden hesaplayan izleme modu (arayüzden bağımsız).
+
+import copy
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from calculation_strategies import FusedCalculationEngine, ICalculationStrategy, SeriesSummary
+from data_parser import MeasurementParser, _measurement_sort_key
+from instrumentation import NULL_INSTRUMENTATION
+from output_writer import OutputWriteError, OutputWriter
+from pipeline import format_header_info
+
+# Varsayılan tarama aralığı (saniye)
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Dosya yolu -> (ölçüm tipi, boyut, değiştirilme zamanı (ns))
+FolderSnapshot = Dict[str, Tuple[str, int, int]]
+
+def snapshot_folder(parser: MeasurementParser, root_folder: str) -> FolderSnapshot:
+    """Kök klasördeki ölçüm dosyalarının boyut ve değiştirilme zamanlarını toplar (içerik okunmaz)."""
+    snapshot = {}
+    for entry, measurement_type in parser._discover_files(root_folder):
+        try:
+            stat = entry.stat() # Keşifte zaten stat yapılmışsa tekrarlanmaz
+        except OSError:
+            continue # Tarama sırasında silinmiş
+        snapshot[entry.path] = (measurement_type, stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+@dataclass
+class FolderChanges:
+    """İki tarama arasındaki farklar (dosya yolları)."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+def diff_snapshots(old: FolderSnapshot, new: FolderSnapshot) -> FolderChanges:
+    """Eklenen, değişen ve silinen dosyaları bulur."""
+    changes = FolderChanges()
+    for file_path, state in new.items():
+        if file_path not in old:
+            changes.added.append(file_path)
+        elif old[file_path] != state:
+            changes.changed.append(file_path)
+    changes.removed = [file_path for file_path in old if file_path not in new]
+    return changes
+
+@dataclass
+class FileResult:
+    """Tek bir girdi dosyasının saklanan lokal sonuçları ve global birleştirme için kısmi özetleri."""
+    measurement_type: str
+    sort_key: tuple
+    header_info: str
+    local_results: Dict[str, any]
+    partials: Dict[str, any]
+
+class IncrementalCalculator:
+    """
+    Klasördeki her dosya için lokal sonuçları ve global kısmi özetleri saklar; poll() ile
+    yalnızca eklenen, değişen veya silinen dosyaları işler.
+
+    Bağımlılıklar: bir girdi dosyası yalnızca kendi ölçüm tipinin lokal ve global çıktı
+    dosyalarını etkiler. Değişiklikten etkilenen tipler için lokal sonuçlar saklı satırlardan,
+    global sonuçlar saklı kısmi özetlerin yeniden birleştirilmesiyle oluşturulur; yani yalnızca
+    değişen dosyalar ayrıştırılır ve hesaplanır. İçeriği değişmeyen çıktı dosyalarına dokunulmaz;
+    bir tipin işlenebilen son dosyası da silinirse o tipin çıktı dosyaları silinir.
+    """
+
+    def __init__(self, root_folder: str, output_writer: OutputWriter,
+                 selected_strategies_local: List[ICalculationStrategy],
+                 selected_strategies_global: List[ICalculationStrategy],
+                 parser: Optional[MeasurementParser] = None,
+                 log: Callable[[str], None] = print,
+                 instrumentation=NULL_INSTRUMENTATION,
+                 result_cache=None,
+                 measurement_filter=None):
+        self.root_folder = root_folder
+        self.output_writer = output_writer
+        self.selected_strategies_local = list(selected_strategies_local)
+        self.selected_strategies_global = list(selected_strategies_global)
+        self.parser = parser or MeasurementParser(verbose=False)
+        self.log = log
+        self.instrumentation = instrumentation
+        self.result_cache = result_cache # Değişen dosyanın içeriği önceden hesaplanmışsa sonuçlar buradan gelir
+        self.measurement_filter = measurement_filter # Verilirse (MeasurementFilter) başlığı uymayan dosyalar atlanır
+        self.snapshot: FolderSnapshot = {}
+        self.files: Dict[str, Optional[FileResult]] = {} # Ayrıştırılamayan dosyalar için None
+
+    def _strategies_for(self, measurement_type: str) -> Tuple[List[ICalculationStrategy], List[ICalculationStrategy]]:
+        return ([strategy.for_measurement_type(measurement_type) for strategy in self.selected_strategies_local],
+                [strategy.for_measurement_type(measurement_type) for strategy in self.selected_strategies_global])
+
+    def poll(self) -> FolderChanges:
+        """Klasörü bir kez tarar ve değişiklik varsa etkilenen çıktıları günceller."""
+        new_snapshot = snapshot_folder(self.parser, self.root_folder)
+        changes = diff_snapshots(self.snapshot, new_snapshot)
+        if changes:
+            self.apply(changes, new_snapshot)
+        return changes
+
+    def apply(self, changes: FolderChanges, new_snapshot: FolderSnapshot):
+        """Değişen dosyaları işler ve etkilenen ölçüm tiplerinin çıktılarını yeniden yazar."""
+        affected_types = set()
+        for file_path in changes.removed:
+            if self._type_selected(self.snapshot[file_path][0]):
+                affected_types.add(self.snapshot[file_path][0])
+            self.files.pop(file_path, None)
+        with self.instrumentation.stage('hesaplama'):
+            for file_path in changes.added + changes.changed:
+                measurement_type = new_snapshot[file_path][0]
+                if not self._type_selected(measurement_type):
+                    continue # Filtre dışındaki tiplerin dosyaları ayrıştırılmaz, çıktıları yazılmaz
+                affected_types.add(measurement_type)
+                self.files[file_path] = self._process_file(file_path, measurement_type)
+        self.snapshot = new_snapshot
+        self.log(f"{len(changes.added)} yeni, {len(changes.changed)} değişen, {len(changes.removed)} silinen dosya işlendi.")
+        for measurement_type in sorted(affected_types):
+            self._write_type(measurement_type)
+
+    def _type_selected(self, measurement_type: str) -> bool:
+        measurement_filter = self.measurement_filter
+        return (measurement_filter is None or measurement_filter.measurement_types is None
+                or measurement_type in measurement_filter.measurement_types)
+
+    def _process_file(self, file_path: str, measurement_type: str) -> Optional[FileResult]:
+        """Dosyayı ayrıştırıp lokal sonuçlarını ve global kısmi özetlerini hesaplar (filtreye uymuyorsa None)."""
+        measurement_filter = self.measurement_filter
+        data, failure = self.parser._parse_job(file_path, measurement_type)
+        if data is None:
+            self.log(f"Uyarı: {failure.file_path} ayrıştırılamadı: {failure.reason}")
+            return None
+        if measurement_filter is not None and not measurement_filter.matches(data):
+            return None
+        local_strategies, global_strategies = self._strategies_for(measurement_type)
+        summary = SeriesSummary(data.values, memoryview(data.time_column))
+        results, errors = FusedCalculationEngine(local_strategies, self.instrumentation,
+                                                 self.result_cache).calculate_summary(summary)
+        for strategy_name, e in errors.items():
+            self.log(f"Uyarı ({measurement_type} - {data.id} - {strategy_name}): {e}")
+        partials = {strategy.name: strategy.partial_from_summary(summary) for strategy in global_strategies}
+        return FileResult(measurement_type, _measurement_sort_key(data), format_header_info(data), results, partials)
+
+    def _write_type(self, measurement_type: str):
+        """Bir ölçüm tipinin lokal ve global çıktılarını saklı sonuçlardan oluşturup yalnızca değişenleri yazar."""
+        file_results = sorted(
+            (result for result in self.files.values() if result and result.measurement_type == measurement_type),
+            key=lambda result: result.sort_key
+        )
+        local_strategies, global_strategies = self._strategies_for(measurement_type)
+        if not file_results:
+            # Son dosya da silinmiş veya ayrıştırılamıyor; eski sonuçlar artık hiçbir girdiye karşılık gelmez
+            self.log(f"'{measurement_type}' için işlenebilen dosya kalmadı; çıktıları siliniyor.")
+            for strategy in local_strategies:
+                self._remove(measurement_type, strategy, is_global=False)
+            for strategy in global_strategies:
+                self._remove(measurement_type, strategy, is_global=True)
+            return
+
+        for strategy in local_strategies:
+            results = {result.header_info: result.local_results[strategy.name]
+                       for result in file_results if strategy.name in result.local_results}
+            if results:
+                self._write(results, measurement_type, strategy, is_global=False)
+            else:
+                self._remove(measurement_type, strategy, is_global=False)
+
+        for strategy in global_strategies:
+            # Saklı özetler değişmesin diye birleştirme ilk özetin kopyası üzerinde yapılır
+            try:
+                partial = copy.deepcopy(file_results[0].partials[strategy.name])
+                for result in file_results[1:]:
+                    partial = strategy.merge_partials(partial, result.partials[strategy.name])
+                value = strategy.calculate_from_partial(partial)
+            except ValueError as e:
+                self.log(f"Uyarı ({measurement_type} - Global - {strategy.name}): {e}")
+                continue
+            results = {f"Tüm {measurement_type} değerlerinin {strategy.name.lower()}": value}
+            self._write(results, measurement_type, strategy, is_global=True)
+
+    def _write(self, results: Dict[str, any], measurement_type: str, strategy: ICalculationStrategy,
+               is_global: bool):
+        scope = "Global" if is_global else "Lokal"
+        calculation_name = strategy.name
+        layout = strategy.global_output_layout if is_global else strategy.output_layout
+        output_path = self.output_writer._get_output_path(measurement_type, calculation_name, is_global)
+        previous_mtime = os.stat(output_path).st_mtime_ns if os.path.exists(output_path) else None
+        try:
+            with self.instrumentation.stage('yazma'):
+                written_path = self.output_writer.write_results(
+                    results, measurement_type, calculation_name, is_global, skip_unchanged=True, layout=layout
+                )
+        except OutputWriteError as e:
+            self.log(f"- {measurement_type.capitalize()} {calculation_name} ({scope}) kaydedilemedi: {e}")
+            return
+        if previous_mtime is None or os.stat(written_path).st_mtime_ns != previous_mtime:
+            self.log(f"- {measurement_type.capitalize()} {calculation_name} ({scope}) güncellendi: {os.path.basename(written_path)}")
+
+    def _remove(self, measurement_type: str, strategy: ICalculationStrategy, is_global: bool):
+        """Artık sonucu olmayan çıktı dosyasını siler (yoksa hiçbir şey yapmaz)."""
+        scope = "Global" if is_global else "Lokal"
+        output_path = self.output_writer._get_output_path(measurement_type, strategy.name, is_global)
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.log(f"- {measurement_type.capitalize()} {strategy.name} ({scope}) silinemedi: {e}")
+            return
+        self.log(f"- {measurement_type.capitalize()} {strategy.name} ({scope}) silindi: {os.path.basename(output_path)}")
+
+    def run(self, interval: float = DEFAULT_POLL_INTERVAL,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+            max_polls: Optional[int] = None,
+            sleep: Callable[[float], None] = time.sleep):
+        """
+        Klasörü interval saniyede bir tarar. is_cancelled True dönene (veya max_polls
+        taramaya ulaşılana) kadar sürer. sleep, iptalin beklemeden fark edilmesi için
+        dışarıdan verilebilir (örn. threading.Event.wait).
+        """
+        polls = 0
+        while not (is_cancelled and is_cancelled()):
+            self.poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            sleep(interval)